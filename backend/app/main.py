@@ -20,8 +20,9 @@ except Exception:  # pragma: no cover
     SLOWAPI_AVAILABLE = False
 
 from app.database import Base, init_engine
+from app.middleware import EdgeMiddleware
 from app.routes import project_routes, setup_routes, generator_routes
-from app.routes import fs_routes
+from app.routes import fs_routes, metrics_routes
 
 # Initialize engine & create tables
 engine = init_engine()
@@ -31,14 +32,18 @@ Base.metadata.create_all(bind=engine)  # creates tables automatically
 app = FastAPI(title="ProjectMaker API", description="Interactive Project Scaffolding Wizard")
 
 # Structured logging (Loguru)
-# Rotates daily, keeps 7 days, includes backtrace for easier debugging
+# Rotates daily, keeps 7 days, includes backtrace for easier debugging.
+# diagnose=False: variable dumps in tracebacks are slow and can leak request data.
+# enqueue=True: the sink writes from a background thread.
+# Per-request lines go to the JSON-lines request log instead (app/request_log.py).
 logger.add(
     "logs/{time}.log",
     rotation="1 day",
     retention="7 days",
     level="INFO",
     backtrace=True,
-    diagnose=True,
+    diagnose=False,
+    enqueue=True,
 )
 
 # CORS configuration
@@ -67,7 +72,7 @@ else:
         use_regex = False
 
 allow_credentials = True
-cors_common = dict(allow_methods=["*"], allow_headers=["*"], expose_headers=["Content-Disposition"])  # for downloads
+cors_common = dict(allow_methods=["*"], allow_headers=["*"], expose_headers=["Content-Disposition", "ETag"])  # downloads + conditional requests
 
 if use_regex:
     allow_credentials = False  # regex + credentials not allowed
@@ -85,37 +90,24 @@ else:
         **cors_common,
     )
 
-# Security headers middleware (lightweight)
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    response = await call_next(request)
-    # Basic hardening headers
-    response.headers.setdefault("X-Content-Type-Options", "nosniff")
-    response.headers.setdefault("X-Frame-Options", "DENY")
-    response.headers.setdefault("X-XSS-Protection", "1; mode=block")  # legacy but harmless
-    # Minimal CSP suitable for API responses; adjust if serving HTML
-    response.headers.setdefault("Content-Security-Policy", "default-src 'self' data: blob:")
-    # Consider enabling HSTS only behind HTTPS (avoid breaking http dev)
-    # response.headers.setdefault("Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload")
-    return response
-
-# Request/response logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Request: {request.method} {request.url}")
-    try:
-        response = await call_next(request)
-    except Exception as e:
-        logger.exception(f"Unhandled error for {request.method} {request.url}: {e}")
-        raise
-    logger.info(f"Response: {response.status_code} {request.method} {request.url}")
-    return response
+# Security headers + request ids + sampled JSON request log, composed into one pure ASGI layer
+# (no BaseHTTPMiddleware task per request; streaming responses pass through untouched)
+def _env_flag(name: str, default: str = "true") -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+app.add_middleware(
+    EdgeMiddleware,
+    security_headers=_env_flag("SECURITY_HEADERS_ENABLED"),
+    log_requests=_env_flag("REQUEST_LOGGING_ENABLED"),
+)
 
 # Include routes
 app.include_router(project_routes.router)
 app.include_router(setup_routes.router)
 app.include_router(generator_routes.router)
 app.include_router(fs_routes.router)
+if _env_flag("METRICS_ENABLED"):
+    app.include_router(metrics_routes.router)
 
 # Optional global rate limiting (enabled if SLOWAPI_AVAILABLE and env RATE_LIMIT_ENABLED=true)
 _rate_enabled = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1","true","yes","on")
@@ -123,8 +115,11 @@ _default_limit = os.getenv("RATE_LIMIT_DEFAULT", "120/minute")
 if SLOWAPI_AVAILABLE and _rate_enabled:
     limiter = Limiter(key_func=get_remote_address, default_limits=[_default_limit])
     app.state.limiter = limiter  # type: ignore[attr-defined]
-    from slowapi.middleware import SlowAPIMiddleware
-    app.add_middleware(SlowAPIMiddleware)
+    try:  # pure ASGI variant (slowapi >= 0.1.9), keeps the stack free of BaseHTTPMiddleware
+        from slowapi.middleware import SlowAPIASGIMiddleware as _RateLimitMiddleware
+    except ImportError:  # pragma: no cover
+        from slowapi.middleware import SlowAPIMiddleware as _RateLimitMiddleware
+    app.add_middleware(_RateLimitMiddleware)
 
     @app.exception_handler(RateLimitExceeded)  # type: ignore[misc]
     async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):  # type: ignore[valid-type]
@@ -165,7 +160,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
-    rid = str(uuid.uuid4())
+    rid = getattr(request.state, "request_id", None) or str(uuid.uuid4())
     logger.exception(f"Unhandled exception [{rid}] at {request.method} {request.url}: {exc}")
     return JSONResponse(
         status_code=500,
@@ -0,0 +1,204 @@
+# backend/app/request_log.py
+# Structured request log: one JSON line per request, sampled per route, handed to a
+# bounded queue and written by a background thread so the event loop never does file I/O
+# and never waits: record() is non-blocking under both backpressure policies.
+import atexit
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.services.json_codec import dumps
+
+DEFAULT_LOG_PATH = os.getenv("PROJECTMAKER_REQUEST_LOG", "logs/requests-{date}.jsonl")
+DEFAULT_QUEUE_SIZE = int(os.getenv("PROJECTMAKER_REQUEST_LOG_QUEUE", "10000") or 10000)
+# drop: discard lines while the writer lags; block: give the writer up to the timeout to
+# catch up (lines wait in an overflow buffer, not in the caller), then drop
+DEFAULT_BACKPRESSURE = os.getenv("PROJECTMAKER_REQUEST_LOG_BACKPRESSURE", "drop").lower()
+if DEFAULT_BACKPRESSURE not in ("drop", "block"):
+    DEFAULT_BACKPRESSURE = "drop"
+DEFAULT_BLOCK_TIMEOUT = float(os.getenv("PROJECTMAKER_REQUEST_LOG_BLOCK_TIMEOUT", "0.5") or 0.5)
+# "<path prefix>=<rate>" pairs; the longest matching prefix wins, '*' is the default
+DEFAULT_SAMPLING = os.getenv("PROJECTMAKER_REQUEST_LOG_SAMPLING", "/health=0.01,*=1")
+
+_STOP = object()
+
+
+def parse_sampling(spec: str) -> List[Tuple[str, float]]:
+    """'/health=0.01,/api/projects/preview=0.2,*=1' -> [(prefix, rate)], longest prefix first."""
+    rules = []
+    for part in (spec or "").split(","):
+        prefix, sep, rate = part.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            value = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+        rules.append(("" if prefix.strip() == "*" else prefix.strip(), value))
+    rules.sort(key=lambda r: len(r[0]), reverse=True)
+    return rules
+
+
+def new_request_id() -> str:
+    return os.urandom(8).hex()
+
+
+class RequestLog:
+    """Sampled, enqueued JSON-lines request logger with drop/block backpressure."""
+
+    def __init__(self, path: str = DEFAULT_LOG_PATH, maxsize: int = DEFAULT_QUEUE_SIZE,
+                 backpressure: str = DEFAULT_BACKPRESSURE, block_timeout: float = DEFAULT_BLOCK_TIMEOUT,
+                 sampling: str = DEFAULT_SAMPLING):
+        if backpressure not in ("drop", "block"):
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+        self.path = path
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.rules = parse_sampling(sampling)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, maxsize))
+        # "block" overflow: (deadline, entry) pairs the writer takes after the queue
+        self._overflow: "deque" = deque()
+        self._overflow_max = max(1, maxsize)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._rates: Dict[str, float] = {}
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.write_errors = 0
+
+    def rate_for(self, path: str) -> float:
+        rate = self._rates.get(path)
+        if rate is None:
+            rate = 1.0
+            for prefix, value in self.rules:
+                if path.startswith(prefix):
+                    rate = value
+                    break
+            if len(self._rates) < 4096:  # bounded: paths may carry ids
+                self._rates[path] = rate
+        return rate
+
+    def record(self, entry: Dict) -> bool:
+        """Queue one request record; 5xx and errors bypass sampling. Returns False if not logged."""
+        if entry.get("status", 0) < 500 and "error" not in entry:
+            rate = self.rate_for(entry.get("path", ""))
+            if rate < 1.0 and (rate <= 0.0 or random.random() >= rate):
+                self.sampled_out += 1
+                return False
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            pass
+        # Called from the event loop: never wait here. Under "block" the writer does the waiting.
+        if self.backpressure == "block" and len(self._overflow) < self._overflow_max:
+            self._overflow.append((time.monotonic() + self.block_timeout, entry))
+            return True
+        self._count_dropped(1)
+        return False
+
+    def _count_dropped(self, n: int) -> None:
+        # Drops are counted from the event loop and from the writer thread
+        with self._lock:
+            self.dropped += n
+
+    def _take_overflow(self) -> List[Dict]:
+        """Overflow lines still within their timeout; late ones count as dropped."""
+        taken, late, now = [], 0, time.monotonic()
+        while self._overflow:
+            try:
+                deadline, entry = self._overflow.popleft()
+            except IndexError:
+                break
+            if deadline >= now:
+                taken.append(entry)
+            else:
+                late += 1
+        if late:
+            self._count_dropped(late)
+        return taken
+
+    def _ensure_writer(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="request-log", daemon=True)
+                    self._thread.start()
+
+    def _open(self, date: str):
+        if self.path == "-":
+            return sys.stdout
+        target = self.path.replace("{date}", date)
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        return open(target, "a", encoding="utf-8")
+
+    def _run(self) -> None:
+        date, fh = None, None
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < 512:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(entry is _STOP for entry in batch)
+            entries = [entry for entry in batch if entry is not _STOP] + self._take_overflow()
+            lines = [dumps(entry).decode("utf-8") for entry in entries]
+            if lines:
+                try:
+                    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+                    if fh is None or today != date:
+                        if fh is not None and fh is not sys.stdout:
+                            fh.close()
+                        date, fh = today, self._open(today)
+                    fh.write("\n".join(lines) + "\n")
+                    fh.flush()
+                    self.written += len(lines)
+                except Exception as e:  # never let logging take the app down
+                    self.write_errors += 1
+                    logger.warning(f"Request log write failed: {e}")
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                if fh is not None and fh is not sys.stdout:
+                    fh.close()
+                return
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until everything queued so far is written (best effort, bounded by timeout)."""
+        deadline = time.monotonic() + timeout
+        while self._thread is not None and (self._queue.unfinished_tasks or self._overflow) and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=1.0)
+            except queue.Full:
+                return
+            self._thread.join(timeout=5.0)
+
+    def stats(self) -> Dict:
+        return {
+            "queued": self._queue.qsize() + len(self._overflow),
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "write_errors": self.write_errors,
+            "backpressure": self.backpressure,
+        }
+
+
+request_log = RequestLog()
+atexit.register(request_log.close)
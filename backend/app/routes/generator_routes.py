@@ -1,16 +1,40 @@
 # backend/app/routes/generator_routes.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List
-import io
+import json
+import os
 from app.services.project_generator import ProjectGenerator
 from app.services.templates import BackendTemplates, FrontendTemplates
-from app.services.pdf_generator import PDFGenerator
+from app.services.pdf_generator import PDF_LAYOUT_VERSION
+from app.services.pdf_cache import DETERMINISTIC, pdf_cache, pdf_key
+from app.services.pdf_fonts import fonts_fingerprint
+from app.services.report import HTML_CSP, REPORT_FORMATS, build_report, mask_secrets, negotiate, render_html, render_json, render_markdown, summary_pdf
 from app.services.script_generator import ScriptGenerator
+from app.services.build_plan import stream_plan
+from app.services.output_sinks import ARCHIVE_FORMATS, archive_root_name, archive_sink
+from app.services.jobs import job_manager
+from app.services.batch_builder import MAX_BATCH_SIZE, stream_batch
+from app.services.executors import ExecutorBusy, cpu_executor, fs_executor
+from app.services.resolved_config import config_digest, resolve_config
+from app.services.etag import etag_for, etag_matches
+from app.services.single_flight import flights
+from app.services.tree_delta import payload_hash, preview_delta, preview_store
+from app.services.tree_codec import TREE_FORMATS, dumps, encode_columnar
+from app.services.file_preview import config_for, preview_file, remember_config
 
 router = APIRouter(prefix="/api/projects", tags=["Generator"])
 
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def _busy(e: ExecutorBusy) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
 # Pydantic models
 class ProjectConfig(BaseModel):
     project_name: str
@@ -38,94 +62,184 @@ class ProjectConfig(BaseModel):
     auto_generate_tables: bool = False
 
 
+def _render_preview(rc) -> dict:
+    """Preview payload for a resolved config (shared by coalesced requests, treat as read-only)"""
+    # Framework subtrees are memoized per combo; only custom entries are spliced per request
+    tree = ProjectGenerator().generate_project_tree(rc)
+    
+    # Get dependencies preview (requirements.txt or package.json)
+    requirements = ""
+    try:
+        if rc.get('backend_framework'):
+            fw = rc.backend_id
+            if fw == "fastapi":
+                requirements = BackendTemplates.fastapi_requirements()
+            elif fw == "flask":
+                requirements = BackendTemplates.flask_requirements()
+            elif fw == "django":
+                requirements = BackendTemplates.django_requirements()
+            elif fw in ["express", "nestjs"]:
+                requirements = BackendTemplates.express_package_json(rc)
+            elif fw in ["nextjs_api", "nextjs-api", "nextjsapi"]:
+                # Minimal Next.js API package.json preview (backend port 5177)
+                requirements = '{\n  "name": "nextjs-api-backend",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "next dev -p 5177", "build": "next build", "start": "next start -p 5177" },\n  "dependencies": { "next": "latest", "react": "^18", "react-dom": "^18" }\n}\n'
+            elif fw in ["bun", "bunjs", "bun.js"]:
+                # Bun.js boilerplate package.json preview
+                requirements = '{\n  "name": "bun-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": {\n    "dev": "bun run start",\n    "start": "bun run build && node build/server.js",\n    "build": "bun build src -o build"\n  },\n  "dependencies": {\n    "express": "^4.17.1",\n    "dotenv": "^10.0.0"\n  },\n  "devDependencies": {\n    "typescript": "^4.5.0",\n    "ts-node": "^10.0.0",\n    "@types/express": "^4.17.13",\n    "@types/node": "^16.11.7"\n  }\n}\n'
+            elif fw in ["springboot", "spring-boot", "spring"]:
+                # Spring Boot build.gradle preview
+                requirements = 'plugins {\\n  id \'org.springframework.boot\' version \'3.1.0\'\\n  id \'io.spring.dependency-management\' version \'1.0.12.RELEASE\'\\n  id \'java\'\\n}\\n\\nrepositories { mavenCentral() }\\n' 
+            elif fw in ["koa", "koa.js", "koajs"]:
+                # Koa package.json preview
+                requirements = '{\n  "name": "koa-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": { "start": "node src/server.js", "dev": "nodemon src/server.js" },\n  "dependencies": { "koa": "^2.13.4", "koa-router": "^10.0.0", "koa-bodyparser": "^4.4.0", "dotenv": "^10.0.0", "ws": "^8.0.0", "@koa/cors": "^5.0.0" },\n  "devDependencies": { "nodemon": "^2.0.12" }\n}\n'
+        elif rc.get('frontend_framework'):
+            ff = rc.frontend_id
+            if ff == "react":
+                requirements = FrontendTemplates.react_package_json(rc)
+            elif ff == "nextjs":
+                requirements = FrontendTemplates.nextjs_package_json(rc)
+            elif ff == "vue":
+                # Minimal Vue + Vite package.json preview
+                requirements = '{\n  "name": "vue-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "vue": "^3.4.0" },\n  "devDependencies": { "vite": "^5.0.0", "@vitejs/plugin-vue": "^5.0.0", "typescript": "^5.3.0" }\n}\n'
+            elif ff == "svelte":
+                requirements = '{\n  "name": "svelte-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "@motionone/svelte": "^10.16.4" },\n  "devDependencies": { "vite": "^5.0.0" }\n}\n'
+            elif ff == "angular":
+                requirements = '{\n  "name": "angular-boilerplate",\n  "private": true,\n  "version": "1.0.0"\n}\n'
+            elif ff in ["nuxt", "nuxtjs"]:
+                requirements = '{\n  "name": "nuxt-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "nuxt dev -p 3010", "build": "nuxt build", "preview": "nuxt preview" },\n  "dependencies": { "nuxt": "^3.13.0" }\n}\n'
+            elif ff == "solidjs":
+                requirements = '{\n  "name": "solidjs-boilerplate",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "solid-js": "^1.9.0" }\n}\n'
+    except Exception as e:
+        print(f"[preview] requirements error: {e}")
+        requirements = requirements or ''
+    
+    payload = {
+        "tree": tree,
+        "requirements": requirements,
+        "config": rc.to_dict(),
+        "config_hash": rc.digest,
+        "hash": payload_hash(tree, requirements)
+    }
+    # Remember what we served so a later request can ask for a delta against it
+    preview_store.remember(payload["hash"], payload)
+    return payload
+
+
 @router.post("/preview")
-def preview_project(config: ProjectConfig):
+def preview_project(
+    config: ProjectConfig,
+    if_none_match: Optional[str] = Header(None),
+    base_hash: Optional[str] = Query(None),
+    tree_format: str = Query("tree", alias="format"),
+):
     """
     Generate a preview of the project structure without creating files
     Returns the project tree and requirements.txt content
+    Send the returned ETag back as If-None-Match to get a 304 for an unchanged config
+    Pass the last received `hash` as base_hash to get a tree patch instead of the full tree
+    (falls back to the full payload when the base is unknown or the patch would not be smaller)
+    format=columnar sends the tree as flat name/parent columns instead of nested nodes
+    A patch is its own representation: its ETag covers base_hash, so a conditional request
+    only gets a 304 for the representation (full tree or patch) it would be served
     """
+    if tree_format not in TREE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{tree_format}', use one of {list(TREE_FORMATS)}")
+    rc = resolve_config(config)
+    remember_config(rc)
+    etag = etag_for(f"preview:{tree_format}", rc.digest)
+    # Without base_hash the representation is known up front: answer a match before rendering
+    if not base_hash and etag_matches(if_none_match, etag):
+        return _not_modified(etag)
     try:
-        from app.services.frameworks.registry import preview_backend_tree, preview_frontend_tree
-        cfg = config.dict()
-        be_tree = preview_backend_tree(cfg)
-        fe_tree = preview_frontend_tree(cfg)
-        # Debug: log what we received
-        print(f"[preview] backend={config.backend_framework} -> has_tree={bool(be_tree)} | frontend={config.frontend_framework} -> has_tree={bool(fe_tree)}")
-
-        tree = {
-            "name": config.project_name,
-            "type": "directory",
-            "children": [x for x in [be_tree, fe_tree] if x]
-        }
-        
-        # Get dependencies preview (requirements.txt or package.json)
-        requirements = ""
-        try:
-            if config.backend_framework:
-                fw = config.backend_framework.lower()
-                if fw == "fastapi":
-                    requirements = BackendTemplates.fastapi_requirements()
-                elif fw == "flask":
-                    requirements = BackendTemplates.flask_requirements()
-                elif fw == "django":
-                    requirements = BackendTemplates.django_requirements()
-                elif fw in ["express", "nestjs"]:
-                    requirements = BackendTemplates.express_package_json(config)
-                elif fw in ["nextjs_api", "nextjs-api", "nextjsapi"]:
-                    # Minimal Next.js API package.json preview (backend port 5177)
-                    requirements = '{\n  "name": "nextjs-api-backend",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "next dev -p 5177", "build": "next build", "start": "next start -p 5177" },\n  "dependencies": { "next": "latest", "react": "^18", "react-dom": "^18" }\n}\n'
-                elif fw in ["bun", "bunjs", "bun.js"]:
-                    # Bun.js boilerplate package.json preview
-                    requirements = '{\n  "name": "bun-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": {\n    "dev": "bun run start",\n    "start": "bun run build && node build/server.js",\n    "build": "bun build src -o build"\n  },\n  "dependencies": {\n    "express": "^4.17.1",\n    "dotenv": "^10.0.0"\n  },\n  "devDependencies": {\n    "typescript": "^4.5.0",\n    "ts-node": "^10.0.0",\n    "@types/express": "^4.17.13",\n    "@types/node": "^16.11.7"\n  }\n}\n'
-                elif fw in ["springboot", "spring-boot", "spring"]:
-                    # Spring Boot build.gradle preview
-                    requirements = 'plugins {\\n  id \'org.springframework.boot\' version \'3.1.0\'\\n  id \'io.spring.dependency-management\' version \'1.0.12.RELEASE\'\\n  id \'java\'\\n}\\n\\nrepositories { mavenCentral() }\\n' 
-                elif fw in ["koa", "koa.js", "koajs"]:
-                    # Koa package.json preview
-                    requirements = '{\n  "name": "koa-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": { "start": "node src/server.js", "dev": "nodemon src/server.js" },\n  "dependencies": { "koa": "^2.13.4", "koa-router": "^10.0.0", "koa-bodyparser": "^4.4.0", "dotenv": "^10.0.0", "ws": "^8.0.0", "@koa/cors": "^5.0.0" },\n  "devDependencies": { "nodemon": "^2.0.12" }\n}\n'
-            elif config.frontend_framework:
-                ff = config.frontend_framework.lower()
-                if ff == "react":
-                    requirements = FrontendTemplates.react_package_json(config)
-                elif ff == "nextjs":
-                    requirements = FrontendTemplates.nextjs_package_json(config)
-                elif ff == "vue":
-                    # Minimal Vue + Vite package.json preview
-                    requirements = '{\n  "name": "vue-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "vue": "^3.4.0" },\n  "devDependencies": { "vite": "^5.0.0", "@vitejs/plugin-vue": "^5.0.0", "typescript": "^5.3.0" }\n}\n'
-                elif ff == "svelte":
-                    requirements = '{\n  "name": "svelte-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "@motionone/svelte": "^10.16.4" },\n  "devDependencies": { "vite": "^5.0.0" }\n}\n'
-                elif ff == "angular":
-                    requirements = '{\n  "name": "angular-boilerplate",\n  "private": true,\n  "version": "1.0.0"\n}\n'
-                elif ff in ["nuxt", "nuxtjs"]:
-                    requirements = '{\n  "name": "nuxt-app",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "nuxt dev -p 3010", "build": "nuxt build", "preview": "nuxt preview" },\n  "dependencies": { "nuxt": "^3.13.0" }\n}\n'
-                elif ff == "solidjs":
-                    requirements = '{\n  "name": "solidjs-boilerplate",\n  "private": true,\n  "version": "1.0.0",\n  "scripts": { "dev": "vite --port 3010", "build": "vite build", "preview": "vite preview" },\n  "dependencies": { "solid-js": "^1.9.0" }\n}\n'
-        except Exception as e:
-            print(f"[preview] requirements error: {e}")
-            requirements = requirements or ''
-        
-        return {
-            "tree": tree,
-            "requirements": requirements,
-            "config": config.dict()
-        }
+        # Identical concurrent previews (the wizard often fires two) share one render
+        payload = flights.do(("preview", rc.digest), lambda: _render_preview(rc))
+        body = None
+        if base_hash:
+            body = preview_delta(base_hash, payload)
+            if body is not None:
+                body["config_hash"] = rc.digest
+                etag = etag_for(f"preview-delta:{base_hash}", rc.digest)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+        if body is None and tree_format == "columnar":
+            body = {**payload, "tree": encode_columnar(payload["tree"])}
+        # Plain dicts of str/list only: serialize directly instead of going through jsonable_encoder
+        return Response(
+            content=dumps(body if body is not None else payload),
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _file_response(rc, path: str, if_none_match: Optional[str]) -> Response:
+    etag = etag_for(f"file:{path}", rc.digest)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    try:
+        planned = preview_file(rc, path)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to render {path}: {e}")
+    if planned is None:
+        raise HTTPException(status_code=404, detail=f"'{path}' is not a file in this project")
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if planned.mode:
+        headers["X-File-Mode"] = oct(planned.mode)
+    return Response(content=planned.data(), media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@router.get("/preview/file")
+def preview_file_by_hash(
+    path: str = Query(..., min_length=1),
+    config_hash: str = Query(...),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Render one file of the project (e.g. backend/app/main.py) without building the rest
+    config_hash is the `config_hash` returned by /preview; unknown hashes get a 404 (POST the config instead)
+    """
+    rc = config_for(config_hash)
+    if rc is None:
+        raise HTTPException(status_code=404, detail="Unknown config_hash; POST the config to /preview or /preview/file")
+    return _file_response(rc, path, if_none_match)
+
+
+@router.post("/preview/file")
+def preview_file_by_config(
+    config: ProjectConfig,
+    path: str = Query(..., min_length=1),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Render one file of the project for a config sent in the body"""
+    return _file_response(resolve_config(config), path, if_none_match)
+
+
 @router.post("/build")
-def build_project(config: ProjectConfig):
+async def build_project(
+    config: ProjectConfig,
+    mode: str = Query("full"),
+    overwrite_conflicts: bool = Query(False),
+):
     """
     Actually build the project - create all files and folders
+    mode=incremental rewrites only changed files in an existing target_directory
     Returns the status of all operations
+    Runs on the filesystem build pool; 503 when its queue is full
     """
+    if mode not in ("full", "incremental"):
+        raise HTTPException(status_code=400, detail=f"Unsupported mode '{mode}'. Use 'full' or 'incremental'")
     try:
         generator = ProjectGenerator()
         
         # Build the project
-        result = generator.build_project(
-            config.dict(),
-            target_directory=config.target_directory
+        result = await fs_executor.run(
+            lambda: generator.build_project(
+                resolve_config(config),
+                target_directory=config.target_directory,
+                mode=mode,
+                overwrite_conflicts=overwrite_conflicts
+            )
         )
         
         if not result["success"]:
@@ -138,69 +252,215 @@ def build_project(config: ProjectConfig):
             "success": True,
             "project_path": result["project_path"],
             "operations": result["operations"],
-            "errors": result.get("errors", [])
+            "errors": result.get("errors", []),
+            "write_stats": result.get("write_stats"),
+            "incremental": result.get("incremental"),
+            "conflicts": result.get("conflicts", []),
+            "orphaned": result.get("orphaned", []),
+            "paths": result.get("paths")
         }
     except HTTPException:
         raise
+    except ExecutorBusy as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/frameworks")
-def list_frameworks():
+@router.post("/build-batch")
+async def build_batch(request: Request, mode: str = Query("full")):
     """
-    Get list of supported frameworks and libraries
+    Build many projects at once on the CPU process pool
+    Body: a JSON list of ProjectConfig objects, or NDJSON (one config per line)
+    Streams one NDJSON result per project as it completes, then a summary line
+    """
+    if mode not in ("full", "incremental"):
+        raise HTTPException(status_code=400, detail=f"Unsupported mode '{mode}'. Use 'full' or 'incremental'")
+    raw = (await request.body()).decode("utf-8")
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            items = [json.loads(line) for line in raw.splitlines() if line.strip()]
+        else:
+            items = json.loads(raw or "[]")
+            if isinstance(items, dict):
+                items = items.get("projects", [])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {e}")
+    if not isinstance(items, list) or not items:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one project config")
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch too large ({len(items)} > {MAX_BATCH_SIZE})")
+
+    configs = []
+    targets = set()
+    generator = ProjectGenerator()  # the batch builds use its default output directory too
+    for i, item in enumerate(items):
+        try:
+            cfg = ProjectConfig(**item).model_dump()
+        except (TypeError, ValidationError) as e:
+            raise HTTPException(status_code=422, detail={"index": i, "errors": str(e)})
+        # Two builds writing into the same folder would interleave
+        target = os.path.normpath(cfg.get("target_directory") or generator.default_target(cfg))
+        if target in targets:
+            raise HTTPException(status_code=400, detail={"index": i, "errors": f"Duplicate target directory: {target}"})
+        targets.add(target)
+        configs.append(cfg)
+
+    return StreamingResponse(stream_batch(configs, mode), media_type="application/x-ndjson")
+
+
+@router.post("/jobs", status_code=202)
+def create_build_job(
+    config: ProjectConfig,
+    mode: str = Query("full"),
+    overwrite_conflicts: bool = Query(False),
+):
     """
+    Queue a build and return its job id immediately
+    Follow progress on /jobs/{id}/events (SSE); the final result is on /jobs/{id}
+    Runs on the filesystem build pool; 503 when its queue is full
+    """
+    if mode not in ("full", "incremental"):
+        raise HTTPException(status_code=400, detail=f"Unsupported mode '{mode}'. Use 'full' or 'incremental'")
+    cfg = resolve_config(config)
+    target = config.target_directory
+
+    def run(progress):
+        return ProjectGenerator().build_project(
+            cfg,
+            target_directory=target,
+            mode=mode,
+            overwrite_conflicts=overwrite_conflicts,
+            progress=progress
+        )
+
+    try:
+        job = job_manager.submit("build", run)
+    except ExecutorBusy as e:
+        raise _busy(e)
     return {
-        "backend": [
-            {"id": "fastapi", "name": "FastAPI", "description": "Modern, fast web framework", "icon": "fastapi"},
-            {"id": "flask", "name": "Flask", "description": "Lightweight WSGI framework", "icon": "flask"},
-            {"id": "django", "name": "Django", "description": "High-level web framework", "icon": "django"},
-            {"id": "express", "name": "Express.js", "description": "Fast Node.js web framework", "icon": "express"},
-            {"id": "nestjs", "name": "NestJS", "description": "Progressive Node.js framework", "icon": "nestjs"},
-            {"id": "springboot", "name": "Spring Boot", "description": "Production-ready Java framework", "icon": "springboot"},
-            {"id": "koa", "name": "Koa.js", "description": "Minimalist Node.js framework", "icon": "koa"},
-            {"id": "bun", "name": "Bun.js", "description": "Fast all-in-one JavaScript runtime", "icon": "bun"},
-            {"id": "nextjs_api", "name": "Next.js API", "description": "API backend using Next.js (App Router)", "icon": "nextdotjs"}
-        ],
-        "frontend": [
-            {"id": "react", "name": "React", "description": "UI library by Facebook", "icon": "react"},
-            {"id": "nextjs", "name": "Next.js", "description": "React framework with SSR", "icon": "nextdotjs"},
-            {"id": "vue", "name": "Vue", "description": "Progressive framework", "icon": "vuedotjs"},
-            {"id": "nuxt", "name": "Nuxt", "description": "Vue framework with SSR", "icon": "nuxtdotjs"},
-            {"id": "angular", "name": "Angular", "description": "Platform by Google", "icon": "angular"},
-            {"id": "svelte", "name": "Svelte", "description": "Cybernetically enhanced apps", "icon": "svelte"},
-            {"id": "solid", "name": "SolidJS", "description": "Simple and performant", "icon": "solid"},
-            {"id": "html", "name": "HTML/CSS/JS", "description": "Plain web technologies", "icon": "html5"}
-        ],
-        "libraries": [
-            {"id": "tailwind", "name": "Tailwind CSS", "description": "Utility-first CSS framework", "version": "3.3.0"},
-            {"id": "emotion", "name": "Emotion", "description": "CSS-in-JS library", "version": "11.11.0"},
-            {"id": "styled-components", "name": "Styled Components", "description": "CSS-in-JS", "version": "6.1.0"},
-            {"id": "framer-motion", "name": "Framer Motion", "description": "Animation library", "version": "11.0.0"},
-            {"id": "lenis", "name": "Lenis", "description": "Smooth scroll", "version": "1.1.0"},
-            {"id": "gsap", "name": "GSAP", "description": "Animation platform", "version": "3.12.0"},
-            {"id": "three", "name": "Three.js", "description": "3D library", "version": "0.160.0"},
-            {"id": "axios", "name": "Axios", "description": "HTTP client", "version": "1.6.0"},
-            {"id": "react-query", "name": "React Query", "description": "Data fetching", "version": "5.0.0"},
-            {"id": "zustand", "name": "Zustand", "description": "State management", "version": "4.4.0"},
-            {"id": "redux", "name": "Redux Toolkit", "description": "State management", "version": "2.0.0"}
-        ],
-        "databases": [
-            {"id": "mysql", "name": "MySQL", "description": "Relational database"},
-            {"id": "postgresql", "name": "PostgreSQL", "description": "Advanced relational DB"},
-            {"id": "mongodb", "name": "MongoDB", "description": "NoSQL document database"},
-            {"id": "sqlite", "name": "SQLite", "description": "Lightweight file-based DB"}
-        ]
+        "job_id": job.id,
+        "status": job.status,
+        "events_url": f"/api/projects/jobs/{job.id}/events",
+        "result_url": f"/api/projects/jobs/{job.id}",
     }
 
 
+@router.get("/jobs/{job_id}")
+def get_build_job(job_id: str):
+    """Job status, plus the build result once it has finished"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.summary()
+
+
+@router.get("/jobs/{job_id}/events")
+async def build_job_events(job_id: str, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-Sent Events: status, operation, error and a final done event
+    Reconnects resume after Last-Event-ID
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    start = int(last_event_id) + 1 if (last_event_id or "").isdigit() else 0
+    return StreamingResponse(
+        job.stream(start),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/export")
+def export_project(config: ProjectConfig, fmt: str = Query("zip", alias="format")):
+    """
+    Render the project in memory and stream it back as a zip or tar.gz archive
+    Nothing is written under /tmp/generated_projects
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{fmt}'. Use one of: {', '.join(ARCHIVE_FORMATS)}")
+    try:
+        plan = ProjectGenerator().plan_project(resolve_config(config))
+        root_name = archive_root_name(config.project_name)
+        media_type, ext = ARCHIVE_FORMATS[fmt]
+        return StreamingResponse(
+            stream_plan(plan, archive_sink(fmt, root_name=root_name)),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={root_name}{ext}"}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+FRAMEWORKS_CATALOG = {
+    "backend": [
+        {"id": "fastapi", "name": "FastAPI", "description": "Modern, fast web framework", "icon": "fastapi"},
+        {"id": "flask", "name": "Flask", "description": "Lightweight WSGI framework", "icon": "flask"},
+        {"id": "django", "name": "Django", "description": "High-level web framework", "icon": "django"},
+        {"id": "express", "name": "Express.js", "description": "Fast Node.js web framework", "icon": "express"},
+        {"id": "nestjs", "name": "NestJS", "description": "Progressive Node.js framework", "icon": "nestjs"},
+        {"id": "springboot", "name": "Spring Boot", "description": "Production-ready Java framework", "icon": "springboot"},
+        {"id": "koa", "name": "Koa.js", "description": "Minimalist Node.js framework", "icon": "koa"},
+        {"id": "bun", "name": "Bun.js", "description": "Fast all-in-one JavaScript runtime", "icon": "bun"},
+        {"id": "nextjs_api", "name": "Next.js API", "description": "API backend using Next.js (App Router)", "icon": "nextdotjs"}
+    ],
+    "frontend": [
+        {"id": "react", "name": "React", "description": "UI library by Facebook", "icon": "react"},
+        {"id": "nextjs", "name": "Next.js", "description": "React framework with SSR", "icon": "nextdotjs"},
+        {"id": "vue", "name": "Vue", "description": "Progressive framework", "icon": "vuedotjs"},
+        {"id": "nuxt", "name": "Nuxt", "description": "Vue framework with SSR", "icon": "nuxtdotjs"},
+        {"id": "angular", "name": "Angular", "description": "Platform by Google", "icon": "angular"},
+        {"id": "svelte", "name": "Svelte", "description": "Cybernetically enhanced apps", "icon": "svelte"},
+        {"id": "solid", "name": "SolidJS", "description": "Simple and performant", "icon": "solid"},
+        {"id": "html", "name": "HTML/CSS/JS", "description": "Plain web technologies", "icon": "html5"}
+    ],
+    "libraries": [
+        {"id": "tailwind", "name": "Tailwind CSS", "description": "Utility-first CSS framework", "version": "3.3.0"},
+        {"id": "emotion", "name": "Emotion", "description": "CSS-in-JS library", "version": "11.11.0"},
+        {"id": "styled-components", "name": "Styled Components", "description": "CSS-in-JS", "version": "6.1.0"},
+        {"id": "framer-motion", "name": "Framer Motion", "description": "Animation library", "version": "11.0.0"},
+        {"id": "lenis", "name": "Lenis", "description": "Smooth scroll", "version": "1.1.0"},
+        {"id": "gsap", "name": "GSAP", "description": "Animation platform", "version": "3.12.0"},
+        {"id": "three", "name": "Three.js", "description": "3D library", "version": "0.160.0"},
+        {"id": "axios", "name": "Axios", "description": "HTTP client", "version": "1.6.0"},
+        {"id": "react-query", "name": "React Query", "description": "Data fetching", "version": "5.0.0"},
+        {"id": "zustand", "name": "Zustand", "description": "State management", "version": "4.4.0"},
+        {"id": "redux", "name": "Redux Toolkit", "description": "State management", "version": "2.0.0"}
+    ],
+    "databases": [
+        {"id": "mysql", "name": "MySQL", "description": "Relational database"},
+        {"id": "postgresql", "name": "PostgreSQL", "description": "Advanced relational DB"},
+        {"id": "mongodb", "name": "MongoDB", "description": "NoSQL document database"},
+        {"id": "sqlite", "name": "SQLite", "description": "Lightweight file-based DB"}
+    ]
+}
+
+# The catalog only changes with a deploy: serialize it and compute its ETag once
+_FRAMEWORKS_BODY = json.dumps(FRAMEWORKS_CATALOG).encode("utf-8")
+_FRAMEWORKS_ETAG = etag_for("frameworks", config_digest(FRAMEWORKS_CATALOG))
+
+
+@router.get("/frameworks")
+def list_frameworks(if_none_match: Optional[str] = Header(None)):
+    """
+    Get list of supported frameworks and libraries
+    """
+    if etag_matches(if_none_match, _FRAMEWORKS_ETAG):
+        return _not_modified(_FRAMEWORKS_ETAG)
+    return Response(
+        content=_FRAMEWORKS_BODY,
+        media_type="application/json",
+        headers={"ETag": _FRAMEWORKS_ETAG, "Cache-Control": "no-cache"},
+    )
+
+
 @router.post("/generate-db-script")
 def generate_db_script(config: ProjectConfig):
     """Generate DB setup text bundle (script, rationale, examples)"""
     try:
-        bundle = ScriptGenerator.generate_db_text_bundle(config.dict())
-        return bundle
+        rc = resolve_config(config)
+        return flights.do(("db-script", rc.digest), lambda: ScriptGenerator.generate_db_text_bundle(rc))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -234,27 +494,118 @@ def generate_schema(payload: SchemaDesign):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _pdf_key(rc) -> str:
+    # fonts_fingerprint() parses the font files on first use, so call this off the event loop.
+    # Keyed on the secret-masked config the PDF is rendered from (see _cached_pdf).
+    return pdf_key(config_digest(mask_secrets(rc)), f"{PDF_LAYOUT_VERSION}:{fonts_fingerprint()}")
+
+
+def _pdf_etag(key: str) -> str:
+    """
+    The ETag covers everything the cache key does (layout, fonts, mode, config). Weak when
+    not deterministic: a re-render of the same config then gives different bytes.
+    """
+    return etag_for("pdf", key, weak=not DETERMINISTIC)
+
+
+async def _cached_pdf(rc, key: str) -> bytes:
+    """
+    PDF from the memory/disk cache; on a miss it is rendered in the CPU process pool
+    (once per concurrent burst) and stored by the pool's callback, off the event loop.
+    """
+    pdf_bytes = await run_in_threadpool(pdf_cache.get, key)
+    if pdf_bytes is not None:
+        return pdf_bytes
+    return await cpu_executor.run(summary_pdf, mask_secrets(rc), key=("pdf", key),
+                                  on_result=lambda data: pdf_cache.put(key, data))
+
+
 @router.post("/generate-pdf")
-def generate_pdf(config: ProjectConfig):
+async def generate_pdf(config: ProjectConfig, if_none_match: Optional[str] = Header(None)):
     """Generate downloadable PDF with project summary"""
+    rc = resolve_config(config)
+    key = await run_in_threadpool(_pdf_key, rc)
+    etag = _pdf_etag(key)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
     try:
-        from app.services.pdf_generator import PDFGenerator
-        generator = ProjectGenerator()
-        tree = generator.generate_project_tree(config.dict())
-        requirements = ""
-        if config.backend_framework:
-            if config.backend_framework.lower() == "fastapi":
-                requirements = BackendTemplates.fastapi_requirements()
-            elif config.backend_framework.lower() == "flask":
-                requirements = BackendTemplates.flask_requirements()
-        
-        pdf_bytes = PDFGenerator.generate_summary_pdf(config.dict(), tree, requirements)
+        pdf_bytes = await _cached_pdf(rc, key)
         
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={config.project_name}_summary.pdf"}
+            headers={
+                "Content-Disposition": f"attachment; filename={config.project_name}_summary.pdf",
+                "ETag": etag,
+                "Cache-Control": "no-cache",
+            }
         )
+    except ExecutorBusy as e:
+        raise _busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+_REPORT_RENDERERS = {"json": render_json, "markdown": render_markdown, "html": render_html}
+
+
+async def _report_response(rc, accept: Optional[str], fmt: Optional[str], if_none_match: Optional[str]) -> Response:
+    """Render the project report in the requested (?format=) or negotiated (Accept) format"""
+    kind = fmt or negotiate(accept)
+    if kind not in REPORT_FORMATS:
+        supported = ", ".join(REPORT_FORMATS)
+        if fmt:
+            raise HTTPException(status_code=400, detail=f"Unsupported format '{fmt}'. Use one of: {supported}")
+        raise HTTPException(status_code=406, detail=f"No acceptable report format. Supported: {supported}")
+    if kind == "pdf":
+        key = await run_in_threadpool(_pdf_key, rc)
+        etag = _pdf_etag(key)
+    else:
+        etag = etag_for(f"report:{kind}", rc.digest)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    try:
+        if kind == "pdf":
+            body = await _cached_pdf(rc, key)
+            headers["Content-Disposition"] = f"attachment; filename={rc['project_name']}_summary.pdf"
+        else:
+            report = await run_in_threadpool(flights.do, ("report", rc.digest), lambda: build_report(rc))
+            body = _REPORT_RENDERERS[kind](report)
+            if kind == "html":
+                headers["Content-Security-Policy"] = HTML_CSP
+    except ExecutorBusy as e:
+        raise _busy(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=body, media_type=REPORT_FORMATS[kind], headers=headers)
+
+
+@router.get("/report")
+async def report_by_hash(
+    config_hash: str = Query(...),
+    fmt: Optional[str] = Query(None, alias="format"),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Project summary as JSON, Markdown, HTML or PDF, chosen by the Accept header (or ?format=)
+    config_hash is the `config_hash` returned by /preview; unknown hashes get a 404 (POST the config instead)
+    """
+    rc = config_for(config_hash)
+    if rc is None:
+        raise HTTPException(status_code=404, detail="Unknown config_hash; POST the config to /preview or /report")
+    return await _report_response(rc, accept, fmt, if_none_match)
+
+
+@router.post("/report")
+async def report_by_config(
+    config: ProjectConfig,
+    fmt: Optional[str] = Query(None, alias="format"),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Project summary for a config sent in the body; same formats as GET /report"""
+    rc = resolve_config(config)
+    remember_config(rc)
+    return await _report_response(rc, accept, fmt, if_none_match)
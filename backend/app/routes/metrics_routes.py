@@ -0,0 +1,63 @@
+# backend/app/routes/metrics_routes.py
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from app.request_log import request_log
+from app.services import file_preview, preview_cache
+from app.services.executors import EXECUTORS
+from app.services.jobs import job_manager
+from app.services.metrics import registry, stats_samples
+from app.services.pdf_cache import pdf_cache
+from app.services.pdf_fonts import subset_cache
+from app.services.single_flight import flights
+from app.services.template_cache import template_cache
+
+router = APIRouter(tags=["Metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+CACHE_COUNTERS = ("hits", "misses", "evictions")
+
+
+def _cache_samples():
+    """Hit/miss counters for every in-process cache, one `cache` label each."""
+    caches = {"templates": template_cache.stats()}
+    for name, st in file_preview.stats().items():
+        caches[f"file_preview_{name}"] = st
+    for name, fn in (("backend_skeleton", preview_cache.backend_skeleton),
+                     ("frontend_skeleton", preview_cache.frontend_skeleton)):
+        info = fn.cache_info()
+        caches[name] = {"size": info.currsize, "maxsize": info.maxsize or 0,
+                        "hits": info.hits, "misses": info.misses}
+    pdf = pdf_cache.stats()
+    for tier in ("memory", "disk"):
+        st = pdf[tier]
+        caches[f"pdf_{tier}"] = {"size": st["entries"], "bytes": st["bytes"], "max_bytes": st["max_bytes"],
+                                 "hits": st["hits"], "evictions": st["evictions"]}
+    caches["pdf_memory"]["misses"] = pdf["misses"]
+    caches["pdf_font_subsets"] = subset_cache.stats()
+    for name, st in caches.items():
+        yield from stats_samples("projectmaker_cache", "In-process cache", st, CACHE_COUNTERS, {"cache": name})
+
+
+def _executor_samples():
+    """Queue depth and task counts per workload executor, one `executor` label each."""
+    for ex in EXECUTORS:
+        yield from stats_samples("projectmaker_executor", "Workload executor", ex.stats(),
+                                 ("completed", "failed", "rejected", "coalesced"), {"executor": ex.name})
+
+
+registry.register_collector(_cache_samples)
+registry.register_collector(lambda: stats_samples(
+    "projectmaker_single_flight", "Coalesced preview/build calls", flights.stats(), ("executed", "shared")))
+registry.register_collector(lambda: stats_samples(
+    "projectmaker_jobs", "Background build jobs", job_manager.stats()))
+registry.register_collector(_executor_samples)
+registry.register_collector(lambda: stats_samples(
+    "projectmaker_request_log", "Structured request log", request_log.stats(),
+    ("written", "dropped", "sampled_out", "write_errors")))
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
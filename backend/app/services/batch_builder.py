@@ -0,0 +1,74 @@
+# backend/app/services/batch_builder.py
+import asyncio
+import json
+import os
+import time
+from typing import AsyncIterator, Dict, List
+
+from .executors import cpu_executor
+from .project_generator import ProjectGenerator
+
+MAX_BATCH_SIZE = int(os.getenv("PROJECTMAKER_BATCH_MAX", "200") or 200)
+
+
+def build_one(index: int, config: Dict, mode: str = "full") -> Dict:
+    """Run one build in a worker process; returns a compact, picklable summary."""
+    t0 = time.perf_counter()
+    try:
+        result = ProjectGenerator().build_project(config, target_directory=config.get("target_directory"), mode=mode)
+    except Exception as e:
+        result = {"success": False, "errors": [f"❌ Error: {e}"], "operations": []}
+    return {
+        "index": index,
+        "project_name": config.get("project_name"),
+        "success": result.get("success", False),
+        "project_path": result.get("project_path"),
+        "operations": len(result.get("operations", [])),
+        "errors": result.get("errors", []),
+        "incremental": result.get("incremental"),
+        "write_stats": result.get("write_stats"),
+        "seconds": round(time.perf_counter() - t0, 4),
+    }
+
+
+def _line(index: int, done: asyncio.Future) -> Dict:
+    try:
+        return done.result()
+    except Exception as e:
+        # The worker process itself died (the executor starts a fresh pool for the next task)
+        return {"index": index, "success": False, "errors": [f"❌ Worker error: {e}"]}
+
+
+async def stream_batch(configs: List[Dict], mode: str = "full") -> AsyncIterator[bytes]:
+    """
+    Fan builds out over the shared CPU process pool and yield one NDJSON line per
+    project as each completes. Only a small window of builds is queued at a time, so
+    PDF renders sharing the pool wait behind a couple of builds, not the whole batch.
+    """
+    t0 = time.perf_counter()
+    window = 2 * cpu_executor.max_workers
+    running: Dict[asyncio.Future, tuple] = {}
+    ok = 0
+    pos = 0
+    try:
+        while pos < len(configs) or running:
+            while pos < len(configs) and len(running) < window:
+                future = cpu_executor.submit(build_one, pos, configs[pos], mode, bounded=False)
+                running[asyncio.wrap_future(future)] = (pos, future)
+                pos += 1
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                line = _line(running.pop(fut)[0], fut)
+                ok += bool(line.get("success"))
+                yield (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
+    finally:
+        # Client went away: don't keep building projects nobody will read about
+        for _, future in running.values():
+            future.cancel()
+    yield (json.dumps({
+        "done": True,
+        "total": len(configs),
+        "succeeded": ok,
+        "failed": len(configs) - ok,
+        "wall_seconds": round(time.perf_counter() - t0, 4),
+    }) + "\n").encode("utf-8")
@@ -0,0 +1,182 @@
+# backend/app/services/build_plan.py
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .file_writer import WriteEntry, unique_parents
+from .output_sinks import DiskSink, OutputSink
+
+Content = Union[str, bytes]
+# A zero-argument callable is rendered on first access (see PlannedFile.content)
+LazyContent = Union[Content, Callable[[], Content]]
+
+
+def clean_rel(path: str) -> str:
+    """Plan key for a path: POSIX separators, no empty or '.' segments."""
+    return '/'.join(p for p in str(path).replace('\\', '/').split('/') if p and p != '.')
+
+
+class PlannedFile:
+    """A single file in a build plan (project-relative POSIX path)."""
+
+    __slots__ = ('path', '_content', 'mode', 'message')
+
+    def __init__(self, path: str, content: LazyContent, mode: Optional[int] = None, message: Optional[str] = None):
+        self.path = path
+        self._content = content
+        self.mode = mode
+        self.message = message
+
+    @property
+    def content(self) -> Content:
+        c = self._content
+        if callable(c):
+            c = self._content = c()
+        return c
+
+    @property
+    def rendered(self) -> bool:
+        return not callable(self._content)
+
+    def data(self) -> bytes:
+        c = self.content
+        return c if isinstance(c, bytes) else str(c).encode('utf-8')
+
+
+class BuildPlan:
+    """
+    Ordered, in-memory manifest of everything a build creates: path -> content/mode.
+    Framework modules only render into a plan; a single executor touches the disk.
+    """
+
+    def __init__(self, **meta):
+        self.files: Dict[str, PlannedFile] = {}
+        self.directories: Dict[str, Optional[str]] = {}
+        self.errors: List[str] = []
+        self.meta: Dict = dict(meta)
+        # ('note'|'dir'|'file', value) in insertion order, used to report operations
+        self._steps: List[Tuple[str, str]] = []
+
+    @staticmethod
+    def _clean(path: str) -> str:
+        return clean_rel(path)
+
+    def add_file(self, path: str, content: LazyContent, mode: Optional[int] = None, message: Optional[str] = None) -> None:
+        rel = self._clean(path)
+        if not rel:
+            return
+        if rel not in self.files:
+            self._steps.append(('file', rel))
+        self.files[rel] = PlannedFile(rel, content, mode, message)
+
+    def add_dir(self, path: str, message: Optional[str] = None) -> None:
+        rel = self._clean(path)
+        if not rel:
+            return
+        if rel not in self.directories or message:
+            self._steps.append(('dir', rel))
+        self.directories[rel] = message or self.directories.get(rel)
+
+    def add_note(self, message: str) -> None:
+        self._steps.append(('note', message))
+
+    def extend(self, other: 'BuildPlan') -> None:
+        """Append another plan's steps, files and errors (later files win)."""
+        for kind, value in other._steps:
+            if kind == 'file':
+                f = other.files[value]
+                self.add_file(f.path, f._content, f.mode, f.message)
+            elif kind == 'dir':
+                self.add_dir(value, other.directories.get(value))
+            else:
+                self.add_note(value)
+        self.errors.extend(other.errors)
+
+    def subset(self, keep: Callable[[PlannedFile], bool]) -> 'BuildPlan':
+        """Copy of the plan with only the files `keep` accepts (notes, dirs and errors are kept)."""
+        out = BuildPlan(**self.meta)
+        for kind, value in self._steps:
+            if kind == 'file':
+                f = self.files[value]
+                if keep(f):
+                    out.add_file(f.path, f._content, f.mode, f.message)
+            elif kind == 'dir':
+                out.add_dir(value, self.directories.get(value))
+            else:
+                out.add_note(value)
+        out.errors.extend(self.errors)
+        return out
+
+    def render_all(self, keep: Optional[Callable[[PlannedFile], bool]] = None) -> None:
+        """
+        Render every lazy file now (only those `keep` accepts, if given); a file whose
+        template fails is dropped and reported in errors.
+        """
+        for rel, f in list(self.files.items()):
+            if not f.rendered and (keep is None or keep(f)):
+                try:
+                    f.content
+                except Exception as e:
+                    del self.files[rel]
+                    self.errors.append(f"❌ Render error ({rel}): {e}")
+
+    def steps(self) -> Iterator[Tuple[str, str]]:
+        seen = set()
+        for kind, value in self._steps:
+            if kind == 'file' and value not in self.files:
+                continue
+            if kind != 'note':
+                if (kind, value) in seen:
+                    continue
+                seen.add((kind, value))
+            yield kind, value
+
+    def directory_set(self) -> List[str]:
+        """Deduplicated directories to create: only leaves, since mkdir(parents=True) covers ancestors."""
+        return unique_parents(self.files, self.directories)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+def _entries(plan: BuildPlan) -> List[WriteEntry]:
+    return [(f.path, f.data(), f.mode) for f in (plan.files[v] for k, v in plan.steps() if k == 'file')]
+
+
+def apply_plan(plan: BuildPlan, target: Union[Path, OutputSink], max_workers: Optional[int] = None) -> Dict:
+    """
+    Materialize a plan into a sink (a Path means a DiskSink with the batched writer).
+    Operations follow plan order; the caller owns the sink's open/close lifecycle.
+    """
+    plan.render_all()
+    sink = target if isinstance(target, OutputSink) else DiskSink(Path(target), max_workers)
+    result = sink.write_many(_entries(plan), directories=plan.directories)
+    written = set(result["written"])
+    ops: List[str] = []
+    for kind, value in plan.steps():
+        if kind == 'note':
+            ops.append(value)
+        elif kind == 'dir':
+            msg = plan.directories.get(value)
+            if msg:
+                ops.append(msg)
+        elif value in written:
+            ops.append(plan.files[value].message or f"✅ Created: {value}")
+    return {'operations': ops, 'errors': list(plan.errors) + result["errors"], 'stats': result["stats"],
+            'written': result["written"]}
+
+
+def stream_plan(plan: BuildPlan, sink: OutputSink) -> Iterator[bytes]:
+    """Feed a plan into a streaming archive sink member by member, yielding bytes as they are produced."""
+    plan.render_all()
+    sink.open()
+    for d in plan.directory_set():
+        sink.makedirs(d)
+    for rel, data, mode in _entries(plan):
+        sink.write(rel, data, mode)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    sink.close()
+    tail = sink.drain()
+    if tail:
+        yield tail
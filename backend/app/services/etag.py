@@ -0,0 +1,49 @@
+# backend/app/services/etag.py
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+_SERVICES_DIR = Path(__file__).resolve().parent
+
+
+def _source_stamp() -> str:
+    """Hash of the generator sources, so a deploy that changes any template changes every ETag."""
+    h = hashlib.sha256()
+    for fp in sorted(_SERVICES_DIR.rglob("*.py")):
+        try:
+            h.update(fp.relative_to(_SERVICES_DIR).as_posix().encode("utf-8"))
+            h.update(fp.read_bytes())
+        except OSError:
+            continue
+    return h.hexdigest()[:16]
+
+
+# Override with a release id in deployments that ship without sources (e.g. zipapps)
+TEMPLATE_VERSION = os.getenv("PROJECTMAKER_TEMPLATE_VERSION") or _source_stamp()
+
+
+def etag_for(kind: str, digest: str, weak: bool = False) -> str:
+    """
+    ETag for a response kind ('preview', 'pdf', ...) and a config digest. Strong unless
+    `weak`: use that when equal inputs can produce different bytes (e.g. timestamps).
+    """
+    tag = hashlib.sha256(f"{kind}:{TEMPLATE_VERSION}:{digest}".encode("utf-8")).hexdigest()[:32]
+    return f'W/"{tag}"' if weak else f'"{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for this header)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    want = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == want:
+            return True
+    return False
+
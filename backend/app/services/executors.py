@@ -0,0 +1,178 @@
+# backend/app/services/executors.py
+# Workload-class executors. CPU-heavy work (PDF layout, batch builds) goes to a small
+# process pool so it neither holds the GIL nor takes threads from FastAPI's shared anyio
+# pool; blocking filesystem builds get their own thread pool. Each has its own worker
+# and queue limits, and reports queue depth and wait/run times to /metrics.
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from loguru import logger
+
+from .metrics import executor_run_seconds, executor_wait_seconds, registry
+
+# PROJECTMAKER_BATCH_WORKERS is the older name of the CPU pool size
+CPU_WORKERS = int(os.getenv("PROJECTMAKER_CPU_WORKERS") or os.getenv("PROJECTMAKER_BATCH_WORKERS") or 0) \
+    or min(4, os.cpu_count() or 2)
+FS_WORKERS = int(os.getenv("PROJECTMAKER_FS_WORKERS", "8") or 8)
+# Tasks allowed to wait for a worker before new ones are refused (0 = no limit)
+CPU_QUEUE = int(os.getenv("PROJECTMAKER_CPU_QUEUE", "32") or 0)
+FS_QUEUE = int(os.getenv("PROJECTMAKER_FS_QUEUE", "64") or 0)
+
+
+class ExecutorBusy(RuntimeError):
+    """The executor's queue is full; the caller should retry later."""
+
+
+def _call(fn: Callable, args: tuple, in_process: bool = False):
+    """
+    Runs in the worker: returns (wall-clock start, result, metrics) so the parent can
+    split wait from run time. A worker process has its own metrics registry, so the
+    stage timings and build counters the task recorded travel back for the parent to merge.
+    """
+    started = time.time()
+    result = fn(*args)
+    return started, result, registry.drain() if in_process else None
+
+
+class WorkloadExecutor:
+    """
+    A lazily created process or thread pool for one class of work. Tasks submitted
+    with the same key while one is in flight share its future. Queue depth is derived
+    from tasks in flight: at most `max_workers` run, the rest wait.
+    """
+
+    def __init__(self, name: str, processes: bool, max_workers: int, max_queue: int = 0):
+        self.name = name
+        self.processes = processes
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._pool = None
+        self._lock = threading.Lock()
+        self._keyed: Dict[Hashable, Future] = {}
+        self._in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.coalesced = 0
+
+    def _get_pool(self):
+        # Process pools use spawn: forking a multi-threaded server process is not safe.
+        # Workers are reused, so imports and template modules are loaded once per worker.
+        if self._pool is None:
+            if self.processes:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"pm-{self.name}")
+        return self._pool
+
+    def submit(self, fn: Callable, *args, key: Optional[Hashable] = None,
+               on_result: Optional[Callable[[Any], None]] = None, bounded: bool = True) -> Future:
+        """
+        Queue fn(*args) (picklable for process pools) and return its future. Raises
+        ExecutorBusy when bounded and the queue is full. on_result(result) runs once,
+        off the event loop, when the task that actually ran succeeds.
+        """
+        with self._lock:
+            if key is not None and key in self._keyed:
+                self.coalesced += 1
+                return self._keyed[key]
+            if bounded and self.max_queue and self._in_flight - self.max_workers >= self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy(f"{self.name} executor queue is full ({self.max_queue} waiting)")
+            pool = self._get_pool()
+            submitted = time.time()
+            try:
+                inner = pool.submit(_call, fn, args, self.processes)
+            except BrokenProcessPool:
+                self._reset(pool)
+                pool = self._get_pool()
+                inner = pool.submit(_call, fn, args, self.processes)
+            self._in_flight += 1
+            outer: Future = Future()
+            if key is not None:
+                self._keyed[key] = outer
+        outer.add_done_callback(lambda f: f.cancelled() and inner.cancel())
+        inner.add_done_callback(lambda f: self._finish(f, outer, pool, key, submitted, on_result))
+        return outer
+
+    async def run(self, fn: Callable, *args, key: Optional[Hashable] = None,
+                  on_result: Optional[Callable[[Any], None]] = None) -> Any:
+        """Await fn(*args) on this executor. A cancelled caller does not cancel the task (others may share it)."""
+        return await asyncio.shield(asyncio.wrap_future(self.submit(fn, *args, key=key, on_result=on_result)))
+
+    def _finish(self, inner: Future, outer: Future, pool, key, submitted: float, on_result) -> None:
+        done = time.time()
+        error = None if inner.cancelled() else inner.exception()
+        with self._lock:
+            self._in_flight -= 1
+            if key is not None and self._keyed.get(key) is outer:
+                del self._keyed[key]
+            if inner.cancelled() or error is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+        if isinstance(error, BrokenProcessPool):
+            # A worker process died; the next submit gets a fresh pool
+            with self._lock:
+                self._reset(pool)
+        try:
+            if inner.cancelled():
+                outer.cancel()
+            elif error is not None:
+                outer.set_exception(error)
+            else:
+                started, result, delta = inner.result()
+                if delta:
+                    registry.merge(delta)
+                executor_wait_seconds.observe(max(0.0, started - submitted), self.name)
+                executor_run_seconds.observe(max(0.0, done - started), self.name)
+                if on_result is not None:
+                    try:
+                        on_result(result)
+                    except Exception as e:
+                        logger.warning(f"{self.name} executor result hook failed: {e}")
+                outer.set_result(result)
+        except InvalidStateError:
+            pass  # the caller cancelled meanwhile
+
+    def _reset(self, pool) -> None:
+        if self._pool is pool and pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._reset(self._pool)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            running = min(self._in_flight, self.max_workers)
+            return {
+                "workers": self.max_workers,
+                "running": running,
+                "queued": self._in_flight - running,
+                "queue_limit": self.max_queue,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "coalesced": self.coalesced,
+            }
+
+
+cpu_executor = WorkloadExecutor("cpu", processes=True, max_workers=CPU_WORKERS, max_queue=CPU_QUEUE)
+fs_executor = WorkloadExecutor("fs", processes=False, max_workers=FS_WORKERS, max_queue=FS_QUEUE)
+EXECUTORS = (cpu_executor, fs_executor)
+
+
+@atexit.register
+def _shutdown() -> None:
+    for ex in EXECUTORS:
+        ex.shutdown()
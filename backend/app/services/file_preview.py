@@ -0,0 +1,88 @@
+# backend/app/services/file_preview.py
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from .build_plan import BuildPlan, PlannedFile, clean_rel
+from .project_generator import ProjectGenerator
+from .resolved_config import ResolvedConfig, resolve_config
+
+# A preview is not a build: its README shows this instead of the time a build would stamp,
+# so the memoized content (served under a digest-keyed ETag) does not depend on the clock
+PREVIEW_CREATED_AT = "(set when the project is built)"
+
+
+class _LRU:
+    """Bounded, thread-safe LRU of objects (plans, configs) with the same stats as TemplateCache."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = max(0, int(maxsize))
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+# Lazy plans per config digest; each file renders once, on first request
+_plans = _LRU(int(os.getenv("PROJECTMAKER_FILE_PREVIEW_PLANS", "32") or 32))
+# Configs seen by /preview, so the wizard can refer to one by its digest
+_configs = _LRU(int(os.getenv("PROJECTMAKER_FILE_PREVIEW_CONFIGS", "256") or 256))
+
+
+def remember_config(config: ResolvedConfig) -> None:
+    _configs.put(config.digest, config)
+
+
+def config_for(digest: str) -> Optional[ResolvedConfig]:
+    return _configs.get(digest)
+
+
+def plan_for(config: Any) -> BuildPlan:
+    """Lazy build plan for a config (nothing but paths is rendered until a file is read)."""
+    config = resolve_config(config)
+    plan = _plans.get(config.digest)
+    if plan is None:
+        plan = ProjectGenerator().plan_project(config, created_at=PREVIEW_CREATED_AT)
+        _plans.put(config.digest, plan)
+    return plan
+
+
+def preview_file(config: Any, path: str) -> Optional[PlannedFile]:
+    """The planned file at a project-relative path, rendered, or None if the plan has no such file."""
+    config = resolve_config(config)
+    remember_config(config)
+    planned = plan_for(config).files.get(clean_rel(path))
+    if planned is not None:
+        planned.content  # render now so template errors surface here
+    return planned
+
+
+def stats() -> dict:
+    return {"plans": _plans.stats(), "configs": _configs.stats()}
@@ -4,27 +4,20 @@ from typing import Dict, Optional
 
 # Reuse existing template providers
 from .templates import BackendTemplates, FrontendTemplates
+from .frameworks import aliases as _aliases
 
 # ---------- Normalizers ----------
 
-BACKEND_ALIASES = {
-    "express.js": "express", "expressjs": "express", "node": "express", "nodejs": "express",
-    "nest": "nestjs", "nestjs.js": "nestjs",
-    "next": "nextjs", "next.js": "nextjs", "nextjs-api": "nextjs", "nextjs_api": "nextjs", "nextjsapi": "nextjs",
-}
-
-FRONTEND_ALIASES = {
-    "next": "nextjs", "next.js": "nextjs",
-    "solid": "solidjs", "solid.js": "solidjs",
-}
+BACKEND_ALIASES = _aliases.BACKEND_ALIASES
+FRONTEND_ALIASES = _aliases.FRONTEND_ALIASES
 
 def normalize_backend(value: Optional[str]) -> str:
-    v = str(value or '').strip().lower()
-    return BACKEND_ALIASES.get(v, v)
+    # This module has one Next.js backend branch for both the API and fullstack flavours
+    fw = _aliases.normalize_backend(value)
+    return 'nextjs' if fw == 'nextjs_api' else fw
 
 def normalize_frontend(value: Optional[str]) -> str:
-    v = str(value or '').strip().lower()
-    return FRONTEND_ALIASES.get(v, v)
+    return _aliases.normalize_frontend(value)
 
 # ---------- Preview trees ----------
 
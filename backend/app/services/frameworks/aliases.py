@@ -0,0 +1,39 @@
+# backend/app/services/frameworks/aliases.py
+from typing import Optional
+
+# Single source of truth for framework ids; registry, ResolvedConfig and the
+# legacy generators all resolve through these tables
+
+BACKEND_ALIASES = {
+    'express.js': 'express', 'expressjs': 'express', 'node': 'express', 'nodejs': 'express',
+    'nest': 'nestjs', 'nestjs.js': 'nestjs',
+    # Keep Next.js API distinct from Next.js frontend
+    'nextjs-api': 'nextjs_api', 'nextjs_api': 'nextjs_api', 'nextjsapi': 'nextjs_api', 'nextjs api': 'nextjs_api', 'next js api': 'nextjs_api',
+    # Bun aliases
+    'bunjs': 'bun', 'bun.js': 'bun',
+    # Spring Boot aliases
+    'spring': 'springboot', 'spring-boot': 'springboot', 'springboot': 'springboot',
+    # Koa aliases
+    'koa.js': 'koa', 'koajs': 'koa',
+    # Plain "next" or "next.js" refers to frontend nextjs only (not backend)
+    'next': 'nextjs', 'next.js': 'nextjs', 'next js': 'nextjs'
+}
+
+FRONTEND_ALIASES = {
+    'next': 'nextjs', 'next.js': 'nextjs',
+    'solid': 'solidjs', 'solid.js': 'solidjs',
+    'nuxtjs': 'nuxt', 'nuxt.js': 'nuxt'
+}
+
+# Backend ids that, paired with a Next.js frontend, produce a single fullstack app
+NEXT_BACKENDS = ('nextjs', 'nextjs_api')
+
+
+def normalize_backend(value: Optional[str]) -> str:
+    v = str(value or '').strip().lower()
+    return BACKEND_ALIASES.get(v, v)
+
+
+def normalize_frontend(value: Optional[str]) -> str:
+    v = str(value or '').strip().lower()
+    return FRONTEND_ALIASES.get(v, v)
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/bun.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -52,21 +52,13 @@ def preview(config: Dict) -> Dict:
     }
 
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # Create directories
-        for p in [
-            base / 'src' / 'controllers',
-            base / 'src' / 'middlewares',
-            base / 'src' / 'models',
-            base / 'src' / 'routes',
-            base / 'src' / 'services',
-            base / 'src' / 'utils',
-        ]:
-            p.mkdir(parents=True, exist_ok=True)
+        for d in ['controllers', 'middlewares', 'models', 'routes', 'services', 'utils']:
+            bp.add_dir(f"{backend}/src/{d}")
         # Files content
         files: Dict[str, str] = {
             'src/app.ts': """import express from 'express';
@@ -216,13 +208,10 @@ Generated with [ProjectMaker](https://github.com/SwagCode4U/projectmaker)
 """,
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
         # create empty bun.lockb placeholder
-        (base / 'bun.lockb').write_text('')
-        ops.append(f"✅ Created: {backend}/bun.lockb")
+        bp.add_file(f"{backend}/bun.lockb", '')
     except Exception as e:
-        errs.append(str(e))
-    return {'operations': ops, 'errors': errs, 'backend_type': 'bun'}
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'bun'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/django.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -26,19 +26,18 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'core').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/core")
         files = {
-            'manage.py': T.django_manage(config),
-            'requirements.txt': T.django_requirements(),
+            'manage.py': lambda: T.django_manage(config),
+            'requirements.txt': lambda: T.django_requirements(),
             'core/__init__.py': '',
-            'core/settings.py': T.django_settings(config),
-            'core/urls.py': T.django_urls(config),
-            'core/wsgi.py': T.django_wsgi(config),
+            'core/settings.py': lambda: T.django_settings(config),
+            'core/urls.py': lambda: T.django_urls(config),
+            'core/wsgi.py': lambda: T.django_wsgi(config),
             '.gitignore': """*.pyc
 __pycache__/
 .env
@@ -48,10 +47,8 @@ __pycache__/
             'README.md': """# Django Boilerplate\n\nA minimal Django starter to get you moving quickly.\n\n## Getting Started\n```bash\npip install -r requirements.txt\npython manage.py runserver\n```\n\n---\n\nGenerated with [ProjectMaker](https://github.com/SwagCode4U/projectmaker)\n""",
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'backend_type': 'django' }
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'django'
+    return bp
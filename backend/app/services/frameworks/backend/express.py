@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/express.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 PORT = 5177
@@ -29,31 +29,28 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'src' / 'routes').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'controllers').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'middlewares').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'utils').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/src/routes")
+        bp.add_dir(f"{backend}/src/controllers")
+        bp.add_dir(f"{backend}/src/middlewares")
+        bp.add_dir(f"{backend}/src/utils")
         files = {
-            'package.json': T.express_package_json(config),
-            'src/app.js': T.express_app_js(config),
-            'src/server.js': T.express_server_js(config),
-            'src/routes/index.js': T.express_routes_index_js(config),
-            'src/controllers/homeController.js': T.express_home_controller_js(config),
-            'src/middlewares/errorHandler.js': T.express_error_handler_js(config),
-            'src/utils/logger.js': T.express_logger_js(config),
-            '.env.example': T.express_env_example(config),
-            'README.md': T.express_readme(config),
+            'package.json': lambda: T.express_package_json(config),
+            'src/app.js': lambda: T.express_app_js(config),
+            'src/server.js': lambda: T.express_server_js(config),
+            'src/routes/index.js': lambda: T.express_routes_index_js(config),
+            'src/controllers/homeController.js': lambda: T.express_home_controller_js(config),
+            'src/middlewares/errorHandler.js': lambda: T.express_error_handler_js(config),
+            'src/utils/logger.js': lambda: T.express_logger_js(config),
+            '.env.example': lambda: T.express_env_example(config),
+            'README.md': lambda: T.express_readme(config),
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'backend_type': 'express' }
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'express'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/fastapi.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -30,32 +30,29 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'app' / 'routes').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/app/routes")
         files = {
-            'app.py': T.fastapi_root_app(config),
+            'app.py': lambda: T.fastapi_root_app(config),
             'app/__init__.py': '',
-            'app/main.py': T.fastapi_main(config),
-            'app/database.py': T.fastapi_database(config),
-            'app/models.py': T.fastapi_models(config),
-            'app/schemas.py': T.fastapi_schemas(config),
-            'app/crud.py': T.fastapi_crud(config),
+            'app/main.py': lambda: T.fastapi_main(config),
+            'app/database.py': lambda: T.fastapi_database(config),
+            'app/models.py': lambda: T.fastapi_models(config),
+            'app/schemas.py': lambda: T.fastapi_schemas(config),
+            'app/crud.py': lambda: T.fastapi_crud(config),
             'app/routes/__init__.py': '',
-            'app/routes/project_routes.py': T.fastapi_routes(config),
-            'requirements.txt': T.fastapi_requirements(),
-            '.env.example': T.env_example(config),
+            'app/routes/project_routes.py': lambda: T.fastapi_routes(config),
+            'requirements.txt': lambda: T.fastapi_requirements(),
+            '.env.example': lambda: T.env_example(config),
             '.gitignore': """__pycache__/\n*.py[cod]\n.env\nvenv/\nprojectmaker.db\n""",
             'README.md': f"""# {config.get('project_name','FastAPI App')} (FastAPI)\n\nDev server: uvicorn app.main:app --reload --port 8000\n\nBuilt with ❤️ for the developer community by SwagCode4U.\n""",
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'backend_type': 'fastapi' }
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'fastapi'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/flask.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -22,25 +22,22 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        base.mkdir(parents=True, exist_ok=True)
+        bp.add_dir(backend)
         files = {
-            'app.py': T.flask_app(config),
-            'config.py': T.flask_config(config),
-            'models.py': T.flask_models(config),
-            'routes.py': T.flask_routes(config),
-            'requirements.txt': T.flask_requirements(),
-            '.env.example': T.env_example(config),
+            'app.py': lambda: T.flask_app(config),
+            'config.py': lambda: T.flask_config(config),
+            'models.py': lambda: T.flask_models(config),
+            'routes.py': lambda: T.flask_routes(config),
+            'requirements.txt': lambda: T.flask_requirements(),
+            '.env.example': lambda: T.env_example(config),
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'backend_type': 'flask' }
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'flask'
+    return bp
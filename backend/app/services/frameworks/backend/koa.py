@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/koa.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -40,15 +40,14 @@ def preview(config: Dict) -> Dict:
     }
 
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # Dirs
-        (base / 'src' / 'controllers').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'middlewares').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'routes').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/src/controllers")
+        bp.add_dir(f"{backend}/src/middlewares")
+        bp.add_dir(f"{backend}/src/routes")
 
         files: Dict[str, str] = {
             'package.json': """{
@@ -158,10 +157,8 @@ module.exports = function startWebSocketServer(server) {
 """,
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return {'operations': ops, 'errors': errs, 'backend_type': 'koa'}
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'koa'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/nestjs.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 def normalize(v: str) -> str:
     return 'nestjs'
@@ -54,20 +54,19 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # directories
-        (base / 'src' / 'modules' / 'auth' / 'dto').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'modules' / 'users' / 'dto').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'modules' / 'shared' / 'guards').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'modules' / 'shared' / 'interceptors').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'modules' / 'shared' / 'pipes').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'common' / 'exceptions').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'common' / 'filters').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'config').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/src/modules/auth/dto")
+        bp.add_dir(f"{backend}/src/modules/users/dto")
+        bp.add_dir(f"{backend}/src/modules/shared/guards")
+        bp.add_dir(f"{backend}/src/modules/shared/interceptors")
+        bp.add_dir(f"{backend}/src/modules/shared/pipes")
+        bp.add_dir(f"{backend}/src/common/exceptions")
+        bp.add_dir(f"{backend}/src/common/filters")
+        bp.add_dir(f"{backend}/src/config")
         
         files: Dict[str, str] = {
             'package.json': """{
@@ -195,10 +194,8 @@ export class CustomHttpException extends HttpException{ constructor(message:stri
 """,
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'backend_type': 'nestjs' }
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'nestjs'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/nextapi.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -102,19 +102,18 @@ def preview(config: Dict) -> Dict:
     }
 
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # create dirs
-        (base / 'app' / 'api' / 'v1' / 'users' / '[id]').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'api' / 'v1' / 'auth' / 'login').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'api' / 'v1' / 'auth' / 'register').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'middleware').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'lib').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'types').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'utils').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/app/api/v1/users/[id]")
+        bp.add_dir(f"{backend}/app/api/v1/auth/login")
+        bp.add_dir(f"{backend}/app/api/v1/auth/register")
+        bp.add_dir(f"{backend}/app/middleware")
+        bp.add_dir(f"{backend}/app/lib")
+        bp.add_dir(f"{backend}/app/types")
+        bp.add_dir(f"{backend}/app/utils")
         # files
         files = {
             'package.json': (
@@ -178,10 +177,8 @@ def build(root: Path, config: Dict) -> Dict:
             'app/utils/logger.ts': 'export function log(message:string){ console.log(`[${new Date().toISOString()}] ${message}`); }\n',
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return {'operations': ops, 'errors': errs, 'backend_type': 'nextjs_api'}
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'nextjs_api'
+    return bp
@@ -1,8 +1,8 @@
 # backend/app/services/frameworks/backend/nextjs_api.py
 # Thin shim so the backend id `nextjs_api` resolves to the existing Next.js API module
 from . import nextapi as _impl
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -17,5 +17,5 @@ def preview(config: Dict) -> Dict:
     return _impl.preview(config)
 
 
-def build(root: Path, config: Dict) -> Dict:
-    return _impl.build(root, config)
+def plan(config: Dict) -> BuildPlan:
+    return _impl.plan(config)
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/backend/springboot.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -60,17 +60,16 @@ def preview(config: Dict) -> Dict:
     }
 
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     backend = config.get('backend_folder_name', 'backend')
-    base = root / backend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # Create directory tree
-        (base / 'src' / 'main' / 'java' / 'com' / 'example' / 'config').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'main' / 'java' / 'com' / 'example' / 'controller').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'main' / 'java' / 'com' / 'example' / 'model').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'main' / 'resources' / 'static').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'test' / 'java' / 'com' / 'example').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{backend}/src/main/java/com/example/config")
+        bp.add_dir(f"{backend}/src/main/java/com/example/controller")
+        bp.add_dir(f"{backend}/src/main/java/com/example/model")
+        bp.add_dir(f"{backend}/src/main/resources/static")
+        bp.add_dir(f"{backend}/src/test/java/com/example")
 
         files: Dict[str, str] = {
             'build.gradle': """plugins {
@@ -186,10 +185,8 @@ Generated with [ProjectMaker](https://github.com/SwagCode4U/projectmaker)
 """,
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {backend}/{rel}")
+            bp.add_file(f"{backend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return {'operations': ops, 'errors': errs, 'backend_type': 'springboot'}
+        bp.errors.append(str(e))
+    bp.meta['backend_type'] = 'springboot'
+    return bp
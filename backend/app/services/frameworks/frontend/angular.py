@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/angular.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -51,22 +51,21 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'src' / 'app' / 'components' / 'header').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'app' / 'components' / 'footer').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'app' / 'pages' / 'home').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'app' / 'pages' / 'about').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/src/app/components/header")
+        bp.add_dir(f"{frontend}/src/app/components/footer")
+        bp.add_dir(f"{frontend}/src/app/pages/home")
+        bp.add_dir(f"{frontend}/src/app/pages/about")
         files = {
-            'package.json': T.angular_package_json(config),
-            'angular.json': T.angular_json(config),
-            'src/index.html': T.angular_index_html(config),
-            'src/main.ts': T.angular_main(config),
-            'src/app/app.module.ts': T.angular_app_module(config),
-            'src/app/app-routing.module.ts': T.angular_app_routing_module(config),
+            'package.json': lambda: T.angular_package_json(config),
+            'angular.json': lambda: T.angular_json(config),
+            'src/index.html': lambda: T.angular_index_html(config),
+            'src/main.ts': lambda: T.angular_main(config),
+            'src/app/app.module.ts': lambda: T.angular_app_module(config),
+            'src/app/app-routing.module.ts': lambda: T.angular_app_routing_module(config),
             'src/app/app.component.ts': """import { Component } from '@angular/core';
 
 @Component({
@@ -83,22 +82,20 @@ export class AppComponent { title = 'Angular Boilerplate'; }
 <app-footer></app-footer>
 """,
             'src/app/app.component.css': "",
-            'src/app/components/header/header.component.ts': T.angular_header_component_ts(config),
-            'src/app/components/header/header.component.html': T.angular_header_component_html(config),
-            'src/app/components/footer/footer.component.ts': T.angular_footer_component_ts(config),
-            'src/app/components/footer/footer.component.html': T.angular_footer_component_html(config),
-            'src/app/pages/home/home.component.ts': T.angular_home_component_ts(config),
-            'src/app/pages/home/home.component.html': T.angular_home_component_html(config),
-            'src/app/pages/about/about.component.ts': T.angular_about_component_ts(config),
-            'src/app/pages/about/about.component.html': T.angular_about_component_html(config),
+            'src/app/components/header/header.component.ts': lambda: T.angular_header_component_ts(config),
+            'src/app/components/header/header.component.html': lambda: T.angular_header_component_html(config),
+            'src/app/components/footer/footer.component.ts': lambda: T.angular_footer_component_ts(config),
+            'src/app/components/footer/footer.component.html': lambda: T.angular_footer_component_html(config),
+            'src/app/pages/home/home.component.ts': lambda: T.angular_home_component_ts(config),
+            'src/app/pages/home/home.component.html': lambda: T.angular_home_component_html(config),
+            'src/app/pages/about/about.component.ts': lambda: T.angular_about_component_ts(config),
+            'src/app/pages/about/about.component.html': lambda: T.angular_about_component_html(config),
             'tailwind.config.cjs': "module.exports={content:['./src/**/*.{html,ts}'],theme:{extend:{}},plugins:[]}\n",
             'postcss.config.cjs': "module.exports={plugins:{tailwindcss:{},autoprefixer:{}}}\n",
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'angular' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'angular'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/html.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 
 def normalize(v: str) -> str:
@@ -24,12 +24,11 @@ def preview(config: Dict) -> Dict:
     }
 
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        base.mkdir(parents=True, exist_ok=True)
+        bp.add_dir(frontend)
         files: Dict[str, str] = {
             'index.html': """<!DOCTYPE html>
 <html lang=\"en\">
@@ -109,10 +108,8 @@ body.light .shiny-heading { text-shadow: 0 0 20px color-mix(in oklab, var(--acce
 """,
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return {'operations': ops, 'errors': errs, 'frontend_type': 'html'}
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'html'
+    return bp
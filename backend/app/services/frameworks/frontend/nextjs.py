@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/nextjs.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -33,14 +33,13 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'app' / 'api' / 'hello').mkdir(parents=True, exist_ok=True)
-        (base / 'app' / 'components').mkdir(parents=True, exist_ok=True)
-        (base / 'public').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/app/api/hello")
+        bp.add_dir(f"{frontend}/app/components")
+        bp.add_dir(f"{frontend}/public")
         # Files (hard-coded TS + Tailwind setup)
         files = {
             'package.json': '{\n  "name": "nextjs-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": {\n    "dev": "next dev -p 3010",\n    "build": "next build",\n    "start": "next start",\n    "lint": "next lint"\n  },\n  "dependencies": {\n    "next": "latest",\n    "react": "^18",\n    "react-dom": "^18"\n  },\n  "devDependencies": {\n    "autoprefixer": "^10",\n    "postcss": "^8",\n    "tailwindcss": "^3",\n    "typescript": "^5"\n  }\n}\n',
@@ -57,12 +56,10 @@ def build(root: Path, config: Dict) -> Dict:
             'app/globals.css': '@tailwind base;\n@tailwind components;\n@tailwind utilities;\n\nbody{ font-family: "Inter", sans-serif; }\n',
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
         # favicon
-        (base / 'public' / 'favicon.ico').write_text('placeholder')
+        bp.add_file(f"{frontend}/public/favicon.ico", 'placeholder')
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'nextjs' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'nextjs'
+    return bp
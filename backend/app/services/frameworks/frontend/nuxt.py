@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/nuxt.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 def normalize(v: str) -> str:
     return 'nuxt'
@@ -34,22 +34,21 @@ def preview(config: Dict) -> Dict:
 
 # Build Nuxt 3 boilerplate
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
         # dirs
-        (base / 'assets').mkdir(parents=True, exist_ok=True)
-        (base / 'components').mkdir(parents=True, exist_ok=True)
-        (base / 'composables').mkdir(parents=True, exist_ok=True)
-        (base / 'layouts').mkdir(parents=True, exist_ok=True)
-        (base / 'middleware').mkdir(parents=True, exist_ok=True)
-        (base / 'pages').mkdir(parents=True, exist_ok=True)
-        (base / 'plugins').mkdir(parents=True, exist_ok=True)
-        (base / 'public').mkdir(parents=True, exist_ok=True)
-        (base / 'server' / 'api').mkdir(parents=True, exist_ok=True)
-        (base / 'utils').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/assets")
+        bp.add_dir(f"{frontend}/components")
+        bp.add_dir(f"{frontend}/composables")
+        bp.add_dir(f"{frontend}/layouts")
+        bp.add_dir(f"{frontend}/middleware")
+        bp.add_dir(f"{frontend}/pages")
+        bp.add_dir(f"{frontend}/plugins")
+        bp.add_dir(f"{frontend}/public")
+        bp.add_dir(f"{frontend}/server/api")
+        bp.add_dir(f"{frontend}/utils")
 
         files: Dict[str, str] = {
             'package.json': """{
@@ -162,10 +161,8 @@ definePageMeta({ layout: 'default' })
         }
 
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'nuxt' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'nuxt'
+    return bp
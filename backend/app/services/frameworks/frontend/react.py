@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/react.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -34,36 +34,33 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'src' / 'components').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'hooks').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'styles').mkdir(parents=True, exist_ok=True)
-        (base / 'public').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/src/components")
+        bp.add_dir(f"{frontend}/src/hooks")
+        bp.add_dir(f"{frontend}/src/styles")
+        bp.add_dir(f"{frontend}/public")
         files = {
-            'package.json': T.react_package_json(config),
-            'index.html': T.react_index_html(config),
-            'src/App.jsx': T.react_app(config),
-            'src/main.jsx': T.react_main(config),
-            'src/index.css': T.react_css(config),
-            'src/components/Navbar.jsx': T.react_navbar(config),
-            'src/components/Hero.jsx': T.react_hero(config),
-            'src/components/Footer.jsx': T.react_footer(config),
-            'src/hooks/useLenis.js': T.react_use_lenis(config),
-            'src/styles/theme.js': T.react_theme(config),
-            'tailwind.config.js': T.tailwind_config(config, framework='react'),
-            'postcss.config.js': T.postcss_config(),
-            'README.md': T.react_readme(config),
+            'package.json': lambda: T.react_package_json(config),
+            'index.html': lambda: T.react_index_html(config),
+            'src/App.jsx': lambda: T.react_app(config),
+            'src/main.jsx': lambda: T.react_main(config),
+            'src/index.css': lambda: T.react_css(config),
+            'src/components/Navbar.jsx': lambda: T.react_navbar(config),
+            'src/components/Hero.jsx': lambda: T.react_hero(config),
+            'src/components/Footer.jsx': lambda: T.react_footer(config),
+            'src/hooks/useLenis.js': lambda: T.react_use_lenis(config),
+            'src/styles/theme.js': lambda: T.react_theme(config),
+            'tailwind.config.js': lambda: T.tailwind_config(config, framework='react'),
+            'postcss.config.js': lambda: T.postcss_config(),
+            'README.md': lambda: T.react_readme(config),
             'public/favicon.ico': 'placeholder',
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'react' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'react'
+    return bp
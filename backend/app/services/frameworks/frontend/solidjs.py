@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/solidjs.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 def normalize(v: str) -> str:
     return 'solidjs'
@@ -29,13 +29,12 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'public').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'components').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/public")
+        bp.add_dir(f"{frontend}/src/components")
         files: Dict[str,str] = {
             'package.json': '{\n  "name": "solidjs-boilerplate",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": {"dev": "vite --port 3010", "build": "vite build", "preview": "vite preview"},\n  "dependencies": { "solid-js": "^1.9.0" },\n  "devDependencies": { "typescript": "^5.3.3", "vite": "^5.0.0", "vite-plugin-solid": "^2.9.0", "tailwindcss": "^3.4.0", "postcss": "^8.4.30", "autoprefixer": "^10.4.16" }\n}\n',
             'index.html': '<!DOCTYPE html>\n<html lang="en"><head><meta charset="UTF-8" /><meta name="viewport" content="width=device-width, initial-scale=1.0" /><title>SolidJS Boilerplate</title></head><body><div id="root"></div><script type="module" src="/src/main.tsx"></script></body></html>\n',
@@ -50,10 +49,8 @@ def build(root: Path, config: Dict) -> Dict:
             'README.md': '# ⚡ SolidJS Boilerplate\n\nA fast, minimal starter built with SolidJS, Vite, and Tailwind CSS.\n',
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'solidjs' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'solidjs'
+    return bp
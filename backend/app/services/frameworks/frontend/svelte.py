@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/svelte.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 from .. import templates_adapter as T
 
 def normalize(v: str) -> str:
@@ -29,35 +29,32 @@ def preview(config: Dict) -> Dict:
         ]
     }
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'src' / 'lib').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'routes').mkdir(parents=True, exist_ok=True)
-        (base / 'public').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/src/lib")
+        bp.add_dir(f"{frontend}/src/routes")
+        bp.add_dir(f"{frontend}/public")
         files = {
-            'package.json': T.svelte_package_json(config),
-            'vite.config.js': T.svelte_vite_config(config),
-            'index.html': T.svelte_index_html(config),
-            'tailwind.config.js': T.tailwind_config(config, framework='svelte'),
-            'postcss.config.js': T.postcss_config(),
-            'src/App.svelte': T.svelte_app(config),
-            'src/app.css': T.svelte_app_css(config),
-            'src/lib/api.js': T.svelte_lib_api_js(config),
-            'src/lib/utils.js': T.svelte_lib_utils_js(config),
-            'src/routes/Home.svelte': T.svelte_home(config),
-            'src/routes/Explorer.svelte': T.svelte_explorer(config),
-            'src/routes/CreateFile.svelte': T.svelte_create_file(config),
-            'src/routes/DBDesigner.svelte': T.svelte_db_designer(config),
+            'package.json': lambda: T.svelte_package_json(config),
+            'vite.config.js': lambda: T.svelte_vite_config(config),
+            'index.html': lambda: T.svelte_index_html(config),
+            'tailwind.config.js': lambda: T.tailwind_config(config, framework='svelte'),
+            'postcss.config.js': lambda: T.postcss_config(),
+            'src/App.svelte': lambda: T.svelte_app(config),
+            'src/app.css': lambda: T.svelte_app_css(config),
+            'src/lib/api.js': lambda: T.svelte_lib_api_js(config),
+            'src/lib/utils.js': lambda: T.svelte_lib_utils_js(config),
+            'src/routes/Home.svelte': lambda: T.svelte_home(config),
+            'src/routes/Explorer.svelte': lambda: T.svelte_explorer(config),
+            'src/routes/CreateFile.svelte': lambda: T.svelte_create_file(config),
+            'src/routes/DBDesigner.svelte': lambda: T.svelte_db_designer(config),
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
-        (base / 'public' / 'logo.png').write_text('placeholder')
+            bp.add_file(f"{frontend}/{rel}", content)
+        bp.add_file(f"{frontend}/public/logo.png", 'placeholder')
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'svelte' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'svelte'
+    return bp
@@ -1,6 +1,6 @@
 # backend/app/services/frameworks/frontend/vue.py
-from pathlib import Path
 from typing import Dict
+from ...build_plan import BuildPlan
 
 def normalize(v: str) -> str:
     return 'vue'
@@ -40,18 +40,17 @@ def preview(config: Dict) -> Dict:
 
 # Build full Vue boilerplate
 
-def build(root: Path, config: Dict) -> Dict:
+def plan(config: Dict) -> BuildPlan:
     frontend = config.get('frontend_folder_name', 'frontend')
-    base = root / frontend
-    ops, errs = [], []
+    bp = BuildPlan()
     try:
-        (base / 'public').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'assets').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'components').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'layouts').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'pages').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'router').mkdir(parents=True, exist_ok=True)
-        (base / 'src' / 'store').mkdir(parents=True, exist_ok=True)
+        bp.add_dir(f"{frontend}/public")
+        bp.add_dir(f"{frontend}/src/assets")
+        bp.add_dir(f"{frontend}/src/components")
+        bp.add_dir(f"{frontend}/src/layouts")
+        bp.add_dir(f"{frontend}/src/pages")
+        bp.add_dir(f"{frontend}/src/router")
+        bp.add_dir(f"{frontend}/src/store")
 
         files: Dict[str, str] = {
             'package.json': '{\n  "name": "vue-app",\n  "version": "1.0.0",\n  "private": true,\n  "scripts": {\n    "dev": "vite --port 3010",\n    "build": "vite build",\n    "preview": "vite preview",\n    "lint": "eslint src --ext .ts,.vue"\n  },\n  "dependencies": {\n    "vue": "^3.4.0",\n    "vue-router": "^4.3.0",\n    "pinia": "^2.1.7"\n  },\n  "devDependencies": {\n    "typescript": "^5.3.0",\n    "vite": "^5.0.0",\n    "@vitejs/plugin-vue": "^5.0.0",\n    "eslint": "^9.0.0",\n    "@vue/eslint-config-typescript": "^13.0.0"\n  }\n}\n',
@@ -74,10 +73,8 @@ def build(root: Path, config: Dict) -> Dict:
             'src/vite-env.d.ts': '/// <reference types="vite/client" />\n',
         }
         for rel, content in files.items():
-            fp = base / rel
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content)
-            ops.append(f"✅ Created: {frontend}/{rel}")
+            bp.add_file(f"{frontend}/{rel}", content)
     except Exception as e:
-        errs.append(str(e))
-    return { 'operations': ops, 'errors': errs, 'frontend_type': 'vue' }
+        bp.errors.append(str(e))
+    bp.meta['frontend_type'] = 'vue'
+    return bp
@@ -1,10 +1,14 @@
 # backend/app/services/frameworks/registry.py
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 # Optional imports so missing modules don't crash the server
 import importlib
 
+from app.services.build_plan import BuildPlan, apply_plan
+from app.services.output_sinks import OutputSink
+from app.services.resolved_config import resolve_config
+
 def _opt(module_path: str):
     try:
         return importlib.import_module(module_path)
@@ -56,35 +60,11 @@ _FRONTENDS = { k:v for k,v in {
     'html': fe_html,
 }.items() if v }
 
-_BACKEND_ALIASES = {
-    'express.js': 'express', 'expressjs': 'express', 'node': 'express', 'nodejs': 'express',
-    'nest': 'nestjs', 'nestjs.js': 'nestjs',
-    # Keep Next.js API distinct from Next.js frontend
-    'nextjs-api': 'nextjs_api', 'nextjs_api': 'nextjs_api', 'nextjsapi': 'nextjs_api', 'nextjs api': 'nextjs_api', 'next js api': 'nextjs_api',
-    # Bun aliases
-    'bunjs': 'bun', 'bun.js': 'bun',
-    # Spring Boot aliases
-    'spring': 'springboot', 'spring-boot': 'springboot', 'springboot': 'springboot',
-    # Koa aliases
-    'koa.js': 'koa', 'koajs': 'koa',
-    # Plain "next" or "next.js" refers to frontend nextjs only (not backend)
-    'next': 'nextjs', 'next.js': 'nextjs', 'next js': 'nextjs'
-}
-
-_FRONTEND_ALIASES = {
-    'next': 'nextjs', 'next.js': 'nextjs',
-    'solid': 'solidjs', 'solid.js': 'solidjs',
-    'nuxtjs': 'nuxt', 'nuxt.js': 'nuxt'
-}
-
-def _norm(value: Optional[str], aliases: Dict[str, str]) -> str:
-    v = str(value or '').strip().lower()
-    return aliases.get(v, v)
-
 # Public API used by ProjectGenerator
 
 def preview_backend_tree(config: Dict) -> Optional[Dict]:
-    bid = _norm(config.get('backend_framework'), _BACKEND_ALIASES)
+    config = resolve_config(config)
+    bid = config.backend_id
     mod = _BACKENDS.get(bid)
     if not mod:
         # Try dynamic import lazily
@@ -102,7 +82,8 @@ def preview_backend_tree(config: Dict) -> Optional[Dict]:
         return None
 
 def preview_frontend_tree(config: Dict) -> Optional[Dict]:
-    fid = _norm(config.get('frontend_framework'), _FRONTEND_ALIASES)
+    config = resolve_config(config)
+    fid = config.frontend_id
     mod = _FRONTENDS.get(fid)
     if not mod:
         # Try dynamic import lazily (hot-reload safe)
@@ -115,25 +96,44 @@ def preview_frontend_tree(config: Dict) -> Optional[Dict]:
             return None
     return mod.preview(config)
 
-def build_backend(project_root: Path, config: Dict) -> Dict:
-    bid = _norm(config.get('backend_framework'), _BACKEND_ALIASES)
+def plan_backend(config: Dict) -> BuildPlan:
+    config = resolve_config(config)
+    bid = config.backend_id
     mod = _BACKENDS.get(bid)
     if not mod and bid:
         dyn = _opt(f'app.services.frameworks.backend.{bid}')
         if dyn:
             _BACKENDS[bid] = dyn
             mod = dyn
+    if not mod:
+        return BuildPlan(backend_type=bid)
     try:
-        return mod.build(project_root, config) if mod else { 'operations': [], 'errors': [], 'backend_type': bid }
+        plan = mod.plan(config)
     except Exception as e:
-        return { 'operations': [], 'errors': [str(e)], 'backend_type': bid }
+        plan = BuildPlan()
+        plan.errors.append(str(e))
+    plan.meta.setdefault('backend_type', bid)
+    return plan
 
-def build_frontend(project_root: Path, config: Dict) -> Dict:
-    fid = _norm(config.get('frontend_framework'), _FRONTEND_ALIASES)
+def plan_frontend(config: Dict) -> BuildPlan:
+    config = resolve_config(config)
+    fid = config.frontend_id
     mod = _FRONTENDS.get(fid)
     if not mod and fid:
         dyn = _opt(f'app.services.frameworks.frontend.{fid}')
         if dyn:
             _FRONTENDS[fid] = dyn
             mod = dyn
-    return mod.build(project_root, config) if mod else { 'operations': [], 'errors': [], 'frontend_type': fid }
+    if not mod:
+        return BuildPlan(frontend_type=fid)
+    plan = mod.plan(config)
+    plan.meta.setdefault('frontend_type', fid)
+    return plan
+
+def build_backend(target: Union[Path, OutputSink], config: Dict) -> Dict:
+    plan = plan_backend(config)
+    return { **apply_plan(plan, target), 'backend_type': plan.meta.get('backend_type') }
+
+def build_frontend(target: Union[Path, OutputSink], config: Dict) -> Dict:
+    plan = plan_frontend(config)
+    return { **apply_plan(plan, target), 'frontend_type': plan.meta.get('frontend_type') }
@@ -0,0 +1,118 @@
+# backend/app/services/incremental.py
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .build_plan import BuildPlan
+
+MANIFEST_PATH = ".projectmaker/manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(root: Path) -> Dict:
+    """Manifest left by the previous build in root, or an empty one."""
+    try:
+        with open(Path(root) / MANIFEST_PATH, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            data.setdefault("files", {})
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "created": None, "files": {}}
+
+
+def save_manifest(root: Path, plan: BuildPlan, previous: Dict, created: str, current: Iterable[str] = ()) -> None:
+    """
+    Record sha256 + size + mtime for the planned files known to match the plan on disk:
+    `current` holds the paths just written or verified unchanged. Every other file
+    (a conflict left alone, a write that failed) keeps its previous record, so the next
+    incremental run still sees it as out of date instead of trusting a hash it never got.
+    """
+    files: Dict[str, Dict] = {}
+    old = previous.get("files", {})
+    current = set(current)
+    for rel, f in plan.files.items():
+        if rel not in current:
+            if rel in old:
+                files[rel] = old[rel]
+            continue
+        try:
+            st = os.stat(Path(root) / rel)
+        except OSError:
+            continue
+        files[rel] = {"sha256": _sha256(f.data()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    fp = Path(root) / MANIFEST_PATH
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    tmp = fp.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"version": MANIFEST_VERSION, "created": created, "files": files}, fh, indent=1, sort_keys=True)
+    os.replace(tmp, fp)
+
+
+def _disk_state(fp: Path, record: Optional[Dict]) -> Tuple[Optional[str], Optional[os.stat_result]]:
+    """(sha256, stat) of a file on disk; trusts the manifest hash when size and mtime are unchanged."""
+    try:
+        st = fp.stat()
+    except OSError:
+        return None, None
+    if record and record.get("size") == st.st_size and record.get("mtime_ns") == st.st_mtime_ns:
+        return record.get("sha256"), st
+    with open(fp, "rb") as fh:
+        return _sha256(fh.read()), st
+
+
+def diff_plan(plan: BuildPlan, root: Path, manifest: Dict, overwrite_conflicts: bool = False) -> Tuple[BuildPlan, Dict]:
+    """
+    Compare a plan with what is on disk under root.
+    A file is created if missing, skipped if identical, updated if the disk copy is still
+    what we generated last time, and otherwise reported as a conflict (local edits are
+    kept unless overwrite_conflicts). Returns the plan of files to write plus a report.
+    """
+    root = Path(root)
+    records = manifest.get("files", {})
+    report: Dict[str, List[str]] = {"created": [], "updated": [], "unchanged": [], "conflicts": [], "orphaned": []}
+    messages: Dict[str, str] = {}
+
+    for rel, f in plan.files.items():
+        record = records.get(rel)
+        disk_hash, st = _disk_state(root / rel, record)
+        if disk_hash is None:
+            report["created"].append(rel)
+            continue
+        want = _sha256(f.data())
+        mode_ok = f.mode is None or (st.st_mode & 0o777) == f.mode
+        if disk_hash == want and mode_ok:
+            report["unchanged"].append(rel)
+        elif disk_hash == want or (record and record.get("sha256") == disk_hash):
+            report["updated"].append(rel)
+            messages[rel] = f"🔁 Updated: {rel}"
+        elif overwrite_conflicts:
+            report["updated"].append(rel)
+            messages[rel] = f"⚠️ Overwrote local changes: {rel}"
+        else:
+            report["conflicts"].append(rel)
+
+    report["orphaned"] = sorted(rel for rel in records if rel not in plan.files and (root / rel).exists())
+
+    skip = set(report["unchanged"]) | set(report["conflicts"])
+    todo = plan.subset(lambda f: f.path not in skip)
+    for rel in todo.directories:
+        if (root / rel).is_dir():
+            todo.directories[rel] = None  # still ensured, but not reported as created
+    for rel, msg in messages.items():
+        todo.files[rel].message = msg
+    for rel in report["conflicts"]:
+        todo.add_note(f"⚠️ Conflict, kept local changes: {rel}")
+    return todo, report
+
+
+def now_stamp() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
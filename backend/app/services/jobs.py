@@ -0,0 +1,157 @@
+# backend/app/services/jobs.py
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .executors import WorkloadExecutor, fs_executor
+
+# Finished jobs are kept this long (seconds) so clients can fetch the result
+JOB_TTL = int(os.getenv("PROJECTMAKER_JOB_TTL", "900") or 900)
+MAX_JOBS = 1000
+SSE_KEEPALIVE = 15.0
+
+
+class Job:
+    """
+    One background build. Events are appended from the worker thread and fanned
+    out to any number of async SSE subscribers.
+    """
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.events: List[Tuple[str, Dict]] = []
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def emit(self, event: str, data: Dict) -> None:
+        with self._lock:
+            self.events.append((event, data))
+            waiters = list(self._waiters)
+        for loop, ev in waiters:
+            try:
+                loop.call_soon_threadsafe(ev.set)
+            except RuntimeError:
+                pass  # subscriber's loop is gone
+
+    def summary(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created": self.created,
+            "finished": self.finished,
+            "events": len(self.events),
+            "result": self.result,
+            "error": self.error,
+        }
+
+    async def stream(self, start: int = 0) -> AsyncIterator[str]:
+        """Server-Sent Events for this job: replays past events, then follows live ones until done."""
+        ev = asyncio.Event()
+        entry = (asyncio.get_running_loop(), ev)
+        with self._lock:
+            self._waiters.append(entry)
+        try:
+            i = max(0, start)
+            while True:
+                ev.clear()
+                with self._lock:
+                    batch = self.events[i:]
+                for event, data in batch:
+                    yield f"id: {i}\nevent: {event}\ndata: {json.dumps(data, default=str, ensure_ascii=False)}\n\n"
+                    i += 1
+                    if event == "done":
+                        return
+                if batch:
+                    continue
+                try:
+                    await asyncio.wait_for(ev.wait(), timeout=SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            with self._lock:
+                self._waiters.remove(entry)
+
+
+class JobManager:
+    """
+    In-memory job registry (single process). Jobs are filesystem builds, so they run on
+    the shared filesystem executor and count against its worker and queue limits.
+    """
+
+    def __init__(self, executor: WorkloadExecutor = fs_executor, ttl: int = JOB_TTL):
+        self.ttl = ttl
+        self.executor = executor
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[[Callable[[str], None]], Dict]) -> Job:
+        """
+        Run fn(progress) on the executor; progress(message) becomes an 'operation' event.
+        Raises ExecutorBusy (and tracks nothing) when the executor's queue is full.
+        """
+        job = Job(kind)
+        job.emit("status", {"status": job.status})
+        self.executor.submit(self._run, job, fn)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {
+            "tracked": len(jobs),
+            "queued": sum(1 for j in jobs if j.status == "queued"),
+            "running": sum(1 for j in jobs if j.status == "running"),
+            "workers": self.executor.max_workers,
+        }
+
+    def _run(self, job: Job, fn: Callable[[Callable[[str], None]], Dict]) -> None:
+        job.status = "running"
+        job.emit("status", {"status": job.status})
+        try:
+            result = fn(lambda message: job.emit("operation", {"message": message}))
+            for err in result.get("errors", []):
+                job.emit("error", {"message": err})
+            job.result = result
+            job.status = "done" if result.get("success", True) else "failed"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+            job.emit("error", {"message": f"❌ Error: {e}"})
+        job.finished = time.time()
+        job.emit("done", {"status": job.status, "result_url": f"/api/projects/jobs/{job.id}"})
+
+    def _prune(self) -> None:
+        now = time.time()
+        for job_id in [j.id for j in self._jobs.values() if j.finished and now - j.finished > self.ttl]:
+            del self._jobs[job_id]
+        while len(self._jobs) >= MAX_JOBS:
+            oldest = next((j.id for j in self._jobs.values() if j.done), None)
+            if oldest is None:
+                break
+            del self._jobs[oldest]
+
+
+job_manager = JobManager()
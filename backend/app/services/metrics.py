@@ -0,0 +1,315 @@
+# backend/app/services/metrics.py
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers sub-ms template renders up to slow PDF/git steps
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BYTE_BUCKETS = (1 << 10, 1 << 14, 1 << 16, 1 << 18, 1 << 20, 1 << 22, 1 << 24, 1 << 26)
+
+# A sample from a collector: (name, kind, help, [(labels, value)])
+Sample = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) and not v.is_integer() else str(int(v))
+
+
+class _Family:
+    """A metric with a fixed label set; each label combination gets its own child."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            # Only series creation takes the family lock
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def drain(self) -> List[Tuple[Tuple[str, ...], object]]:
+        """Take and reset every series' observations (counters and histograms)."""
+        return [(key, child.drain()) for key, child in self._series()]
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for key, child in self._series():
+            yield from child.render(self.name, self.labelnames, key)
+
+
+class _Value:
+    __slots__ = ("value", "lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self.lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def drain(self) -> float:
+        with self.lock:
+            value, self.value = self.value, 0.0
+        return value
+
+    def merge(self, value: float) -> None:
+        self.inc(value)
+
+    def render(self, name, labelnames, key) -> Iterator[str]:
+        yield f"{name}{_labels(labelnames, key)} {_num(self.value)}"
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.labels(*labels).inc(amount)
+
+
+class Gauge(_Family):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.labels(*labels).inc(amount)
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.labels(*labels).dec(amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        self.labels(*labels).set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "count", "lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self.bounds, value)  # outside the lock
+        with self.lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def drain(self):
+        with self.lock:
+            if not self.count:
+                return None
+            data = (self.counts, self.sum, self.count)
+            self.counts, self.sum, self.count = [0] * (len(self.bounds) + 1), 0.0, 0
+        return data
+
+    def merge(self, data) -> None:
+        counts, total, n = data
+        with self.lock:
+            self.counts = [a + b for a, b in zip(self.counts, counts)]
+            self.sum += total
+            self.count += n
+
+    def render(self, name, labelnames, key) -> Iterator[str]:
+        with self.lock:
+            counts, total, n = list(self.counts), self.sum, self.count
+        running = 0
+        for bound, c in zip(self.bounds + (float("inf"),), counts):
+            running += c
+            le = 'le="%s"' % _num(bound)
+            yield f"{name}_bucket{_labels(labelnames, key, le)} {running}"
+        yield f"{name}_sum{_labels(labelnames, key)} {_num(total)}"
+        yield f"{name}_count{_labels(labelnames, key)} {n}"
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.bounds = tuple(sorted(float(b) for b in buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.bounds)
+
+    def observe(self, value: float, *labels: str) -> None:
+        self.labels(*labels).observe(value)
+
+
+class Registry:
+    """Metric families plus collectors that report existing stats() at scrape time."""
+
+    def __init__(self):
+        self._families: List[_Family] = []
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, family: _Family) -> _Family:
+        with self._lock:
+            self._families.append(family)
+        return family
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, fn: Callable[[], Iterable[Sample]]) -> None:
+        with self._lock:
+            self._collectors.append(fn)
+
+    def drain(self) -> List[Tuple[str, Tuple[str, ...], object]]:
+        """
+        Observations recorded since the last drain, reset to zero. Worker processes
+        return this with each task so the parent can merge() it into its registry.
+        Gauges describe the worker's own state and are left out.
+        """
+        with self._lock:
+            families = [f for f in self._families if f.kind in ("counter", "histogram")]
+        return [(f.name, key, data) for f in families for key, data in f.drain() if data]
+
+    def merge(self, delta: Iterable[Tuple[str, Tuple[str, ...], object]]) -> None:
+        with self._lock:
+            by_name = {f.name: f for f in self._families}
+        for name, key, data in delta:
+            family = by_name.get(name)
+            if family is not None:
+                family.labels(*key).merge(data)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            families, collectors = list(self._families), list(self._collectors)
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        # Collectors may report the same metric with different labels; emit each name once
+        merged: Dict[str, Tuple[str, str, List]] = {}
+        for collect in collectors:
+            try:
+                samples = list(collect())
+            except Exception:
+                continue  # a broken collector must not take /metrics down
+            for name, kind, help, series in samples:
+                merged.setdefault(name, (kind, help, []))[2].extend(series)
+        for name, (kind, help, series) in merged.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in series:
+                lines.append(f"{name}{_labels(list(labels), list(labels.values()))} {_num(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_seconds = registry.histogram(
+    "projectmaker_http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"))
+http_requests_total = registry.counter(
+    "projectmaker_http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"))
+http_in_flight = registry.gauge(
+    "projectmaker_http_requests_in_flight", "HTTP requests currently being served", ("method",))
+
+build_stage_seconds = registry.histogram(
+    "projectmaker_build_stage_seconds",
+    "Time per build stage; stages do not overlap (mkdir/write come from the disk writer)", ("stage",))
+build_files = registry.histogram(
+    "projectmaker_build_files", "Files written per build", (), COUNT_BUCKETS)
+build_bytes = registry.histogram(
+    "projectmaker_build_bytes", "Bytes written per build", (), BYTE_BUCKETS)
+builds_total = registry.counter(
+    "projectmaker_builds_total", "Builds by mode and outcome", ("mode", "outcome"))
+
+executor_wait_seconds = registry.histogram(
+    "projectmaker_executor_wait_seconds", "Time tasks waited for a worker, by executor", ("executor",))
+executor_run_seconds = registry.histogram(
+    "projectmaker_executor_run_seconds", "Task run time in the worker, by executor", ("executor",))
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block into projectmaker_build_stage_seconds{stage=name} (also on error)."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        build_stage_seconds.observe(time.perf_counter() - t0, name)
+
+
+def timed_stage(name: str) -> Callable:
+    """Decorator form of stage()."""
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def stats_samples(prefix: str, help: str, stats: Optional[Dict], counters: Iterable[str] = (), labels: Optional[Dict[str, str]] = None) -> List[Sample]:
+    """Turn a stats() dict into samples: numeric keys become gauges, `counters` become *_total counters."""
+    out: List[Sample] = []
+    counters = set(counters)
+    for key, value in (stats or {}).items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if key in counters:
+            out.append((f"{prefix}_{key}_total", "counter", f"{help}: {key}", [(dict(labels or {}), value)]))
+        else:
+            out.append((f"{prefix}_{key}", "gauge", f"{help}: {key}", [(dict(labels or {}), value)]))
+    return out
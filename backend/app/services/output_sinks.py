@@ -0,0 +1,214 @@
+# backend/app/services/output_sinks.py
+import io
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .file_writer import WriteEntry, unique_parents, write_files
+
+
+class OutputSink:
+    """
+    Destination for generated files. Generation code renders a BuildPlan and hands
+    the entries to a sink; only the sink decides whether bytes hit the disk.
+    """
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def makedirs(self, rel: str) -> None:
+        raise NotImplementedError
+
+    def write(self, rel: str, data: bytes, mode: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def write_many(self, entries: Sequence[WriteEntry], directories: Iterable[str] = ()) -> Dict:
+        """Write a batch; returns {'written', 'errors', 'stats'}. Sinks may override to parallelize."""
+        errs: List[str] = []
+        written: List[str] = []
+        t0 = time.perf_counter()
+        for d in unique_parents((e[0] for e in entries), directories):
+            try:
+                self.makedirs(d)
+            except Exception as e:
+                errs.append(f"❌ Folder error ({d}): {e}")
+        for rel, data, mode in entries:
+            try:
+                self.write(rel, data, mode)
+                written.append(rel)
+            except Exception as e:
+                errs.append(f"❌ Write error ({rel}): {e}")
+        return {
+            "written": written,
+            "errors": errs,
+            "stats": {
+                "files": len(entries),
+                "bytes": sum(len(e[1]) for e in entries),
+                "wall_seconds": round(time.perf_counter() - t0, 6),
+            },
+        }
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class DiskSink(OutputSink):
+    """Writes under a root directory using the parallel batched writer."""
+
+    def __init__(self, root: Path, max_workers: Optional[int] = None):
+        self.root = Path(root)
+        self.max_workers = max_workers
+
+    def open(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def makedirs(self, rel: str) -> None:
+        (self.root / rel).mkdir(parents=True, exist_ok=True)
+
+    def write(self, rel: str, data: bytes, mode: Optional[int] = None) -> None:
+        # The batched writer reports failures instead of raising; single writes raise like other sinks
+        errors = self.write_many([(rel, data, mode)])["errors"]
+        if errors:
+            raise OSError("; ".join(errors))
+
+    def write_many(self, entries: Sequence[WriteEntry], directories: Iterable[str] = ()) -> Dict:
+        return write_files(self.root, entries, max_workers=self.max_workers, directories=directories)
+
+
+class MemorySink(OutputSink):
+    """Keeps everything in a dict of bytes; for previews, tests and benchmarks."""
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+        self.modes: Dict[str, int] = {}
+        self.directories: Set[str] = set()
+
+    def makedirs(self, rel: str) -> None:
+        if rel:
+            self.directories.add(rel)
+
+    def write(self, rel: str, data: bytes, mode: Optional[int] = None) -> None:
+        self.files[rel] = bytes(data)
+        if mode is not None:
+            self.modes[rel] = mode
+
+
+class _StreamBuffer:
+    """Write-only, non-seekable buffer; archive sinks append to it and callers drain it."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._pos = 0
+
+    def write(self, data) -> int:
+        b = bytes(data)
+        self._chunks.append(b)
+        self._pos += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _ArchiveSink(OutputSink):
+    """Shared bits for archive sinks: optional top-level folder and drainable stream."""
+
+    def __init__(self, fileobj=None, root_name: str = ""):
+        self._buffer = _StreamBuffer() if fileobj is None else None
+        self.fileobj = fileobj if fileobj is not None else self._buffer
+        self.root_name = root_name.strip("/")
+
+    def _name(self, rel: str) -> str:
+        return f"{self.root_name}/{rel}" if self.root_name else rel
+
+    def drain(self) -> bytes:
+        """Bytes produced since the last drain (only when streaming into the internal buffer)."""
+        return self._buffer.drain() if self._buffer is not None else b""
+
+
+class ZipSink(_ArchiveSink):
+    """Zip archive sink; streams without seeking when no fileobj is given."""
+
+    def open(self) -> None:
+        self._zip = zipfile.ZipFile(self.fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+        self._now = time.localtime()[:6]
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def makedirs(self, rel: str) -> None:
+        info = zipfile.ZipInfo(self._name(rel) + "/", date_time=self._now)
+        info.external_attr = (0o40755 << 16) | 0x10
+        self._zip.writestr(info, b"")
+
+    def write(self, rel: str, data: bytes, mode: Optional[int] = None) -> None:
+        info = zipfile.ZipInfo(self._name(rel), date_time=self._now)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (0o100000 | (mode or 0o644)) << 16
+        self._zip.writestr(info, data)
+
+
+class TarSink(_ArchiveSink):
+    """Tar archive sink (gzip by default) in stream mode."""
+
+    def __init__(self, fileobj=None, root_name: str = "", compression: str = "gz"):
+        super().__init__(fileobj, root_name)
+        self.compression = compression
+
+    def open(self) -> None:
+        self._tar = tarfile.open(fileobj=self.fileobj, mode=f"w|{self.compression}")
+        self._mtime = int(time.time())
+
+    def close(self) -> None:
+        self._tar.close()
+
+    def makedirs(self, rel: str) -> None:
+        info = tarfile.TarInfo(self._name(rel))
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        info.mtime = self._mtime
+        self._tar.addfile(info)
+
+    def write(self, rel: str, data: bytes, mode: Optional[int] = None) -> None:
+        info = tarfile.TarInfo(self._name(rel))
+        info.size = len(data)
+        info.mode = mode or 0o644
+        info.mtime = self._mtime
+        self._tar.addfile(info, io.BytesIO(data))
+
+
+ARCHIVE_FORMATS = {
+    "zip": ("application/zip", ".zip"),
+    "tar.gz": ("application/gzip", ".tar.gz"),
+}
+
+
+def archive_sink(fmt: str, fileobj=None, root_name: str = "") -> _ArchiveSink:
+    if fmt == "zip":
+        return ZipSink(fileobj, root_name)
+    if fmt == "tar.gz":
+        return TarSink(fileobj, root_name, "gz")
+    raise ValueError(f"Unsupported archive format: {fmt}")
+
+
+def archive_root_name(project_name: str) -> str:
+    name = str(project_name or "").replace("\\", "_").replace("/", "_").strip(" .")
+    return name or "project"
@@ -0,0 +1,171 @@
+# backend/app/services/path_normalizer.py
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+DEFAULT_CUSTOM_FOLDERS = ["docs", "tests"]
+
+
+def _has_suffix(rel: str) -> bool:
+    """Same answer as bool(Path(rel).suffix), without building a Path per entry."""
+    name = rel[rel.rfind("/") + 1:]
+    dot = name.rfind(".")
+    return 0 < dot < len(name) - 1
+
+
+class NormalizedPath:
+    """One user-supplied entry after normalization."""
+
+    __slots__ = ('source', 'raw', 'path', 'kind', 'content')
+
+    def __init__(self, source: str, raw: str, path: str, kind: str, content: Optional[str] = None):
+        self.source = source      # 'custom_folders' | 'custom_files'
+        self.raw = raw
+        self.path = path          # project-relative POSIX path
+        self.kind = kind          # 'file' | 'directory'
+        self.content = content
+
+
+class PathReport:
+    """
+    Result of normalizing a batch of user paths: the accepted entries in input order
+    plus duplicates, file/directory conflicts and entries that normalized to nothing.
+    """
+
+    __slots__ = ('entries', 'duplicates', 'conflicts', 'dropped')
+
+    def __init__(self):
+        self.entries: List[NormalizedPath] = []
+        self.duplicates: List[Dict] = []
+        self.conflicts: List[Dict] = []
+        self.dropped: List[str] = []
+
+    def has_issues(self) -> bool:
+        return bool(self.duplicates or self.conflicts or self.dropped)
+
+    def as_dict(self) -> Dict:
+        return {"duplicates": self.duplicates, "conflicts": self.conflicts, "dropped": self.dropped}
+
+
+class PathNormalizer:
+    """
+    Component-wise path normalizer for one project config:
+    - splits on / and \\, drops empty, '.' and '..' components (names like 'a..b' are kept)
+    - strips everything up to and including the first <project_name> component (case-insensitive)
+    - slices from the first 'backend' component (else 'frontend') and maps it to the
+      configured folder name
+    Results are memoized per raw string, so pasted layouts with repeated prefixes stay cheap.
+    """
+
+    def __init__(self, project_name: str = "", backend_folder: str = "backend", frontend_folder: str = "frontend"):
+        self.project = str(project_name or "").lower()
+        self.backend_folder = backend_folder or "backend"
+        self.frontend_folder = frontend_folder or "frontend"
+        self._memo: Dict[str, str] = {}
+
+    @classmethod
+    def for_config(cls, config: Mapping) -> "PathNormalizer":
+        return cls(
+            config.get("project_name") or "",
+            config.get("backend_folder_name", "backend"),
+            config.get("frontend_folder_name", "frontend"),
+        )
+
+    def normalize(self, raw) -> str:
+        key = str(raw)
+        hit = self._memo.get(key)
+        if hit is not None:
+            return hit
+
+        parts = [p for p in key.replace("\\", "/").strip().split("/") if p and p != "." and p != ".."]
+        start = 0
+        if self.project:
+            for i, part in enumerate(parts):
+                if part.lower() == self.project:
+                    start = i + 1
+                    break
+        backend_at = frontend_at = -1
+        for i in range(start, len(parts)):
+            low = parts[i].lower()
+            if low == "backend":
+                backend_at = i
+                break
+            if low == "frontend" and frontend_at < 0:
+                frontend_at = i
+
+        if backend_at >= 0:
+            parts = [self.backend_folder] + parts[backend_at + 1:]
+        elif frontend_at >= 0:
+            parts = [self.frontend_folder] + parts[frontend_at + 1:]
+        else:
+            parts = parts[start:]
+
+        rel = "/".join(parts)
+        self._memo[key] = rel
+        return rel
+
+    def normalize_all(self, items: Iterable[Tuple[str, str, Optional[str], Optional[str]]]) -> PathReport:
+        """
+        Normalize (source, raw, kind, content) items in one pass; kind None means
+        "file if the last component has a suffix, else directory".
+        Duplicate paths keep the last entry (as the build does) at the position of the
+        first, and a path that is both a file and a directory (explicitly or as a
+        parent) stays a directory.
+        """
+        report = PathReport()
+        winners: Dict[str, NormalizedPath] = {}      # path -> last entry, at first-seen position
+        repeats: Dict[str, List[NormalizedPath]] = {}  # only paths given more than once
+        dirs: Dict[str, str] = {}                     # directory path -> first raw entry implying it
+
+        for source, raw, kind, content in items:
+            raw = str(raw)
+            rel = self.normalize(raw)
+            if not rel:
+                report.dropped.append(raw)
+                continue
+            if kind is None:
+                kind = "file" if _has_suffix(rel) else "directory"
+            entry = NormalizedPath(source, raw, rel, kind, content)
+            prev = winners.get(rel)
+            if prev is not None:
+                repeats.setdefault(rel, [prev]).append(entry)
+            winners[rel] = entry
+            cut = len(rel) if kind == "directory" else rel.rfind("/")
+            while cut > 0:
+                parent = rel[:cut]
+                if parent in dirs:
+                    break
+                dirs[parent] = raw
+                cut = parent.rfind("/")
+
+        for rel, entry in winners.items():
+            group = repeats.get(rel)
+            if rel in dirs and (entry.kind == "file" or group):
+                group = group or [entry]
+                files = [e.raw for e in group if e.kind == "file"]
+                if files:
+                    folders = [e for e in group if e.kind == "directory"]
+                    report.conflicts.append({
+                        "path": rel,
+                        "file": files,
+                        "directory": [e.raw for e in folders] or [dirs[rel]],
+                    })
+                    group = folders
+                    if not folders:
+                        continue
+                    entry = folders[-1]
+            if group and len(group) > 1:
+                report.duplicates.append({"path": rel, "kind": entry.kind, "sources": [e.raw for e in group]})
+            report.entries.append(entry)
+        return report
+
+
+def normalize_paths(config: Mapping) -> PathReport:
+    """Normalize a config's custom_folders and custom_files together."""
+    items = []
+    for entry in config.get("custom_folders", DEFAULT_CUSTOM_FOLDERS) or ():
+        if entry:
+            items.append(("custom_folders", entry, None, None))
+    for f in config.get("custom_files", []) or ():
+        name = str((f or {}).get("name", "") or "").strip()
+        if name:
+            items.append(("custom_files", name, "file", (f or {}).get("content", "") or ""))
+    return PathNormalizer.for_config(config).normalize_all(items)
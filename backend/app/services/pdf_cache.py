@@ -0,0 +1,193 @@
+# backend/app/services/pdf_cache.py
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .etag import TEMPLATE_VERSION
+
+DEFAULT_MEMORY_BYTES = int(os.getenv("PROJECTMAKER_PDF_CACHE_MEMORY", str(32 << 20)) or 0)
+DEFAULT_DISK_BYTES = int(os.getenv("PROJECTMAKER_PDF_CACHE_DISK", str(256 << 20)) or 0)
+DEFAULT_DISK_DIR = os.getenv("PROJECTMAKER_PDF_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "projectmaker-pdf")
+# Stable output: no "Generated:" timestamp and a fixed PDF creation date
+DETERMINISTIC = os.getenv("PROJECTMAKER_PDF_DETERMINISTIC", "true").lower() in ("1", "true", "yes", "on")
+
+
+def pdf_key(digest: str, layout_version: str, deterministic: bool = DETERMINISTIC) -> str:
+    """Cache key: config digest + PDF layout version + generator sources + mode."""
+    raw = f"pdf:{TEMPLATE_VERSION}:{layout_version}:{int(deterministic)}:{digest}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:40]
+
+
+class PDFCache:
+    """
+    Two-tier, byte-bounded cache of rendered PDFs.
+    Memory is an LRU bounded by total bytes; entries evicted from it spill to a
+    disk directory (also byte-bounded, least recently used first), and disk hits
+    are promoted back to memory. Either tier is disabled with a limit of 0.
+    """
+
+    def __init__(self, memory_bytes: int = DEFAULT_MEMORY_BYTES, disk_bytes: int = DEFAULT_DISK_BYTES,
+                 directory: str = DEFAULT_DISK_DIR):
+        self.memory_bytes = max(0, int(memory_bytes))
+        self.disk_bytes = max(0, int(disk_bytes))
+        self.directory = directory
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+        self._mem_size = 0
+        self._disk: Optional["OrderedDict[str, int]"] = None  # key -> size, loaded lazily
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        self.evictions = {"memory": 0, "disk": 0}
+        self.disk_errors = 0
+
+    # -- public -----------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+                self.hits["memory"] += 1
+                return data
+        data = self._disk_get(key)
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits["disk"] += 1
+        self._mem_put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        data = bytes(data)
+        if self.memory_bytes and len(data) <= self.memory_bytes:
+            self._mem_put(key, data)
+        else:
+            self._disk_put(key, data)  # too big for memory (or memory off): straight to disk
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            self._mem_size = 0
+            keys = list(self._disk or ())
+            self._disk = OrderedDict()
+            self._disk_size = 0
+        for key in keys:
+            self._unlink(key)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "memory": {"entries": len(self._mem), "bytes": self._mem_size, "max_bytes": self.memory_bytes,
+                           "hits": self.hits["memory"], "evictions": self.evictions["memory"]},
+                "disk": {"entries": len(self._disk or ()), "bytes": self._disk_size, "max_bytes": self.disk_bytes,
+                         "hits": self.hits["disk"], "evictions": self.evictions["disk"], "errors": self.disk_errors},
+                "misses": self.misses,
+            }
+
+    # -- memory tier ------------------------------------------------------------
+
+    def _mem_put(self, key: str, data: bytes) -> None:
+        if not self.memory_bytes or len(data) > self.memory_bytes:
+            return
+        spill = []
+        with self._lock:
+            old = self._mem.pop(key, None)
+            if old is not None:
+                self._mem_size -= len(old)
+            self._mem[key] = data
+            self._mem_size += len(data)
+            while self._mem_size > self.memory_bytes:
+                k, v = self._mem.popitem(last=False)
+                self._mem_size -= len(v)
+                self.evictions["memory"] += 1
+                spill.append((k, v))
+        for k, v in spill:  # disk I/O outside the lock
+            self._disk_put(k, v)
+
+    # -- disk tier --------------------------------------------------------------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def _index(self) -> "OrderedDict[str, int]":
+        """Disk entries oldest-first (by mtime); called with the lock held."""
+        if self._disk is None:
+            entries = []
+            try:
+                with os.scandir(self.directory) as it:
+                    for e in it:
+                        if e.name.endswith(".pdf") and e.is_file():
+                            st = e.stat()
+                            entries.append((st.st_mtime, e.name[:-4], st.st_size))
+            except OSError:
+                pass
+            entries.sort()
+            self._disk = OrderedDict((k, size) for _, k, size in entries)
+            self._disk_size = sum(self._disk.values())
+        return self._disk
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        if not self.disk_bytes:
+            return None
+        with self._lock:
+            if key not in self._index():
+                return None
+            self._disk.move_to_end(key)
+        try:
+            with open(self._path(key), "rb") as fh:
+                data = fh.read()
+            os.utime(self._path(key))  # keep LRU order across restarts
+            return data
+        except OSError:
+            with self._lock:
+                self.disk_errors += 1
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_size -= size
+            return None
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if not self.disk_bytes or len(data) > self.disk_bytes:
+            return
+        with self._lock:
+            index = self._index()
+            if key in index:
+                index.move_to_end(key)
+                return  # content is fully determined by the key
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            with self._lock:
+                self.disk_errors += 1
+            return
+        evict = []
+        with self._lock:
+            if key not in self._disk:
+                self._disk[key] = len(data)
+                self._disk_size += len(data)
+            while self._disk_size > self.disk_bytes and len(self._disk) > 1:
+                k, size = self._disk.popitem(last=False)
+                self._disk_size -= size
+                self.evictions["disk"] += 1
+                evict.append(k)
+        for k in evict:
+            self._unlink(k)
+
+    def _unlink(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+
+pdf_cache = PDFCache()
@@ -0,0 +1,263 @@
+# backend/app/services/pdf_fonts.py
+# Unicode TTF fonts for the summary PDF. Each font file is read and parsed once per
+# process; per document only a small pre-subset copy (the 128-codepoint blocks the
+# document's text touches) is handed to fpdf2, and those subsets are cached across
+# requests, so embedding stays cheap after the first render of a given script mix.
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from loguru import logger
+
+from .single_flight import SingleFlight
+
+# auto: use TrueType fonts when found (else core fonts + latin-1); off: always core fonts
+PDF_UNICODE = os.getenv("PROJECTMAKER_PDF_UNICODE", "auto").lower()
+SUBSET_CACHE_SIZE = int(os.getenv("PROJECTMAKER_PDF_FONT_CACHE", "64") or 0)
+SUBSET_DIR = os.getenv("PROJECTMAKER_PDF_FONT_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "projectmaker-fonts")
+
+FONT_DIRS = (
+    "/usr/share/fonts/truetype/dejavu",
+    "/usr/share/fonts/dejavu",
+    "/usr/share/fonts/TTF",
+    "/usr/share/fonts/truetype/noto",
+    "/usr/share/fonts/noto",
+    "/Library/Fonts",
+    "C:/Windows/Fonts",
+)
+# (env var, file names tried in FONT_DIRS)
+FONT_FILES = {
+    ("sans", ""): ("PROJECTMAKER_PDF_FONT", ("DejaVuSans.ttf", "NotoSans-Regular.ttf")),
+    ("sans", "B"): ("PROJECTMAKER_PDF_FONT_BOLD", ("DejaVuSans-Bold.ttf", "NotoSans-Bold.ttf")),
+    ("sans", "I"): ("PROJECTMAKER_PDF_FONT_ITALIC", ("DejaVuSans-Oblique.ttf", "NotoSans-Italic.ttf")),
+    ("mono", ""): ("PROJECTMAKER_PDF_FONT_MONO", ("DejaVuSansMono.ttf", "NotoSansMono-Regular.ttf")),
+}
+# Comma-separated extra fonts for glyphs the main font lacks (emoji, CJK, ...)
+FALLBACK_FONTS = [p.strip() for p in os.getenv("PROJECTMAKER_PDF_FALLBACK_FONTS", "").split(",") if p.strip()]
+
+BLOCK_BITS = 7  # subsets are keyed on 128-codepoint blocks, not exact characters
+
+
+class FontFace:
+    """One font file: bytes kept in memory, cmap and metrics parsed once."""
+
+    def __init__(self, path: str):
+        from fontTools.ttLib import TTFont
+
+        self.path = path
+        with open(path, "rb") as fh:
+            self.data = fh.read()
+        self.digest = hashlib.sha256(self.data).hexdigest()[:16]
+        font = TTFont(io.BytesIO(self.data), lazy=True, recalcTimestamp=False)
+        try:
+            self.codepoints: FrozenSet[int] = frozenset(font.getBestCmap() or ())
+            self.blocks: FrozenSet[int] = frozenset(cp >> BLOCK_BITS for cp in self.codepoints)
+            self.monospace = bool(font["post"].isFixedPitch)
+        finally:
+            font.close()
+
+    def covering(self, blocks: FrozenSet[int]) -> FrozenSet[int]:
+        return frozenset(cp for cp in self.codepoints if cp >> BLOCK_BITS in blocks)
+
+
+class SubsetCache:
+    """
+    LRU of subset font files keyed on (font, codepoint blocks). fpdf2's add_font()
+    takes a path, so subsets live as small .ttf files; a file left by an earlier
+    process with the same key is reused as is. Worker processes share the directory,
+    so another one may evict a file this one still lists: hits are checked on disk
+    and rebuilt when the file is gone.
+    """
+
+    def __init__(self, maxsize: int = SUBSET_CACHE_SIZE, directory: str = SUBSET_DIR):
+        self.maxsize = max(0, maxsize)
+        self.directory = directory
+        self._paths: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._builds = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, face: FontFace, blocks: FrozenSet[int]) -> str:
+        blocks = blocks & face.blocks  # blocks the font cannot serve do not change the subset
+        key = face.digest + "-" + hashlib.sha256(",".join(map(str, sorted(blocks))).encode()).hexdigest()[:16]
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                if os.path.exists(path):
+                    self._paths.move_to_end(key)
+                    self.hits += 1
+                    return path
+                del self._paths[key]  # evicted by another process
+            self.misses += 1
+        path = self._builds.do(key, lambda: self._build(face, blocks, key))
+        evict = []
+        with self._lock:
+            self._paths[key] = path
+            self._paths.move_to_end(key)
+            while self.maxsize and len(self._paths) > self.maxsize:
+                evict.append(self._paths.popitem(last=False)[1])
+                self.evictions += 1
+        for old in evict:
+            try:
+                os.unlink(old)
+            except OSError:
+                pass
+        return path
+
+    def _build(self, face: FontFace, blocks: FrozenSet[int], key: str) -> str:
+        path = os.path.join(self.directory, f"{key}.ttf")
+        if os.path.exists(path):
+            return path
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+
+        font = TTFont(io.BytesIO(face.data), recalcTimestamp=False)  # subsetting works in place
+        # No hinting: PDF viewers rasterize outlines themselves, and both passes get cheaper
+        options = subset.Options(notdef_outline=True, recommended_glyphs=True, hinting=False)
+        options.drop_tables += ["GSUB", "GPOS", "GDEF", "FFTM", "hdmx", "meta"]  # fpdf2 drops these too
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=face.covering(blocks))
+        subsetter.subset(font)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            font.save(fh)
+        os.replace(tmp, path)
+        return path
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"size": len(self._paths), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class PDFFonts:
+    """Font family names for one document and the text filter that goes with them."""
+
+    def __init__(self, sans: str = "Arial", serif: str = "Times", mono: str = "Courier",
+                 unicode: bool = False, mono_unicode: bool = False, italic: str = "I"):
+        self.sans = sans
+        self.serif = serif
+        self.mono = mono
+        self.italic = italic  # "" when the TTF family has no italic face (upright instead of a second copy)
+        self.unicode = unicode
+        self.mono_unicode = mono_unicode
+
+    @staticmethod
+    def _latin1(s) -> str:
+        try:
+            return str(s).encode('latin-1', 'replace').decode('latin-1')
+        except Exception:
+            return str(s)
+
+    def text(self, s) -> str:
+        return str(s) if self.unicode else self._latin1(s)
+
+    def mono_text(self, s) -> str:
+        return str(s) if self.mono_unicode else self._latin1(s)
+
+
+CORE_FONTS = PDFFonts()
+
+_faces: Optional[Dict[str, FontFace]] = None
+_faces_lock = threading.Lock()
+subset_cache = SubsetCache()
+
+
+def _find(env: str, names: Iterable[str]) -> Optional[str]:
+    explicit = os.getenv(env)
+    if explicit:
+        return explicit if os.path.isfile(explicit) else None
+    for folder in FONT_DIRS:
+        for name in names:
+            candidate = os.path.join(folder, name)
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+def faces() -> Dict[str, FontFace]:
+    """Configured font faces ('sans', 'sansB', 'sansI', 'mono', 'fallback0', ...), loaded once."""
+    global _faces
+    if _faces is None:
+        with _faces_lock:
+            if _faces is None:
+                loaded: Dict[str, FontFace] = {}
+                if PDF_UNICODE != "off":
+                    found = {f"{family}{style}": _find(env, names) for (family, style), (env, names) in FONT_FILES.items()}
+                    found.update({f"fallback{i}": p for i, p in enumerate(FALLBACK_FONTS)})
+                    for name, path in found.items():
+                        if not path:
+                            continue
+                        try:
+                            loaded[name] = FontFace(path)
+                        except Exception as e:
+                            logger.warning(f"PDF font {path} not usable: {e}")
+                    if "sans" not in loaded:
+                        loaded = {}
+                    elif "mono" in loaded and not loaded["mono"].monospace:
+                        del loaded["mono"]  # the tree layout needs a fixed-pitch font
+                _faces = loaded
+    return _faces
+
+
+def fonts_fingerprint() -> str:
+    """Identifies the font setup; part of the PDF cache key."""
+    loaded = faces()
+    if not loaded:
+        return "core"
+    return hashlib.sha256("|".join(f"{k}={v.digest}" for k, v in sorted(loaded.items())).encode()).hexdigest()[:12]
+
+
+def text_blocks(texts: Iterable[str]) -> FrozenSet[int]:
+    """Codepoint blocks used by the given strings (ASCII's block always included)."""
+    blocks: Set[int] = {0}
+    for s in texts:
+        if s and not s.isascii():
+            blocks.update(ord(ch) >> BLOCK_BITS for ch in s)
+    return frozenset(blocks)
+
+
+def install_fonts(pdf, texts: Iterable[str]) -> PDFFonts:
+    """
+    Register Unicode fonts on `pdf`, subset to the blocks `texts` touch, and return
+    the family names to use. Falls back to the core fonts when no TTF is configured.
+    """
+    loaded = faces()
+    if not loaded:
+        return CORE_FONTS
+    blocks = text_blocks(texts)
+
+    def add(family: str, style: str, face: FontFace) -> None:
+        try:
+            pdf.add_font(family, style, subset_cache.path_for(face, blocks))
+        except FileNotFoundError:
+            # Another worker evicted the subset between the lookup and the read; rebuild once
+            pdf.add_font(family, style, subset_cache.path_for(face, blocks))
+
+    sans = loaded["sans"]
+    add("pm-sans", "", sans)
+    add("pm-sans", "B", loaded.get("sansB", sans))
+    italic = loaded.get("sansI")
+    if italic is not None:
+        add("pm-sans", "I", italic)
+    mono = loaded.get("mono")
+    if mono is not None:
+        add("pm-mono", "", mono)
+    fallbacks: List[str] = []
+    beyond_ascii = blocks - {0}
+    for name, face in sorted(loaded.items()):
+        if name.startswith("fallback") and beyond_ascii & face.blocks:
+            family = f"pm-{name}"
+            add(family, "", face)
+            fallbacks.append(family)
+    if fallbacks:
+        pdf.set_fallback_fonts(fallbacks, exact_match=False)
+    return PDFFonts(sans="pm-sans", serif="pm-sans", mono="pm-mono" if mono is not None else "Courier",
+                    unicode=True, mono_unicode=mono is not None, italic="I" if italic is not None else "")
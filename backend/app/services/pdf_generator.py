@@ -1,18 +1,61 @@
 # backend/app/services/pdf_generator.py
+import os
 from fpdf import FPDF
-from typing import Dict
-from datetime import datetime
+from typing import Dict, Mapping
+from datetime import datetime, timezone
+from loguru import logger
+from .resolved_config import resolve_config, thaw
+from .metrics import timed_stage
+from .pdf_fonts import CORE_FONTS, install_fonts
+from .pdf_tree_layout import render_tree, tree_rows
+
+# Bump whenever the document layout changes; part of the PDF cache key
+PDF_LAYOUT_VERSION = "3"
+# CreationDate written in deterministic mode
+FIXED_CREATION_DATE = datetime(2000, 1, 1, tzinfo=timezone.utc)
+# Long lists in the Configuration section show this many items, then "+N more"
+CONFIG_LIST_ITEMS = 12
+CONFIG_VALUE_CHARS = 400
+DESCRIPTION_MAX_CHARS = int(os.getenv("PROJECTMAKER_PDF_DESCRIPTION_MAX", "8000") or 0)
 
 class PDFGenerator:
     @staticmethod
-    def generate_summary_pdf(config: Dict, tree: Dict, requirements: str) -> bytes:
-        def _ascii(s) -> str:
-            try:
-                return str(s).encode('latin-1', 'replace').decode('latin-1')
-            except Exception:
-                return str(s)
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
+    @timed_stage("pdf_render")
+    def generate_summary_pdf(config: Dict, tree: Dict, requirements: str, deterministic: bool = False) -> bytes:
+        """
+        Render the summary PDF from the shared report model (see report.build_report).
+        deterministic=True drops the "Generated:" timestamp and pins the document
+        creation date, so the same config always yields the same bytes.
+        """
+        from .report import build_report
+
+        report = build_report(config, tree, requirements)
+        sections = {s["id"]: s for s in report.sections}
+        db_info = sections.get("database", {}).get("lines")
+        deps = sections.get("dependencies", {}).get("lines")
+        table = sections.get("ports_scripts", {}).get("rows")
+        steps = sections.get("next_steps", {}).get("lines")
+        desc = sections.get("description", {}).get("text")
+        def new_pdf() -> FPDF:
+            doc = FPDF()
+            if deterministic and hasattr(doc, "set_creation_date"):
+                doc.set_creation_date(FIXED_CREATION_DATE)
+            doc.set_auto_page_break(auto=True, margin=15)
+            return doc
+
+        # Unicode TTF fonts subset to the document's text when available, else core fonts + latin-1
+        pdf = new_pdf()
+        try:
+            fonts = install_fonts(pdf, PDFGenerator._texts(report.as_dict(), tree))
+        except Exception as e:
+            logger.warning(f"PDF fonts could not be installed, using core fonts: {e}")
+            pdf, fonts = new_pdf(), CORE_FONTS  # a fresh document: no half-registered fonts
+        _ascii = fonts.text
+
+        def paragraph(h: float, text: str):
+            # fpdf2 leaves the cursor at the right edge after multi_cell; start the next line at the margin
+            pdf.multi_cell(0, h, txt=text)
+            pdf.set_x(pdf.l_margin)
         pdf.add_page()
 
         # Header banner (Material Blue) — full width, fixed height
@@ -20,15 +63,16 @@ class PDFGenerator:
         pdf.rect(0, 0, pdf.w, 20, 'F')
         pdf.set_xy(10, 5)
         pdf.set_text_color(255, 255, 255)
-        pdf.set_font("Arial", 'B', 14)
+        pdf.set_font(fonts.sans, 'B', 14)
         pdf.cell(0, 10, _ascii("ProjectMaker Report"), ln=True)
 
         # Reset for body
         pdf.set_text_color(0, 0, 0)
         pdf.ln(10)
 
-        pdf.set_font("Arial", size=12)
-        pdf.cell(0, 8, txt=_ascii(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"), ln=True)
+        if not deterministic:
+            pdf.set_font(fonts.sans, size=12)
+            pdf.cell(0, 8, txt=_ascii(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"), ln=True)
         pdf.ln(4)
 
         # Sections helper: colored header + divider
@@ -37,7 +81,7 @@ class PDFGenerator:
             pdf.line(10, pdf.get_y(), pdf.w - 10, pdf.get_y())
             pdf.ln(4)
             pdf.set_text_color(0, 102, 204)
-            pdf.set_font("Arial", 'B', 14)
+            pdf.set_font(fonts.sans, 'B', 14)
             pdf.set_fill_color(245, 245, 245)
             pdf.cell(0, 8, txt=_ascii(title), ln=True, fill=True)
             pdf.set_text_color(0, 0, 0)
@@ -45,126 +89,134 @@ class PDFGenerator:
 
         # Config section
         section_header("Configuration")
-        pdf.set_font("Arial", size=11)
-        for key, value in config.items():
-            # Skip the plain description here; it is rendered in a dedicated section at the end
-            if str(key).lower() == 'description':
-                continue
-            pdf.multi_cell(0, 6, txt=_ascii(f"- {key}: {value}"))
+        pdf.set_font(fonts.sans, size=11)
+        # The description is not among these; it is rendered in a dedicated section at the end
+        for item in sections["configuration"]["items"]:
+            paragraph(6, _ascii(f"- {item['key']}: {PDFGenerator._summarize(item['value'])}"))
         pdf.ln(2)
 
-        # Tree section
+        # Tree section: multi-column, depth/size-limited, within a page budget
         section_header("Project Structure")
-        pdf.set_font("Arial", size=11)
-        for line in PDFGenerator._format_tree_lines(tree):
-            pdf.cell(0, 6, txt=_ascii(line), ln=True)
+        render_tree(pdf, tree, clean=fonts.mono_text, font=fonts.mono)
         pdf.ln(2)
 
         # Database section
-        db_info = PDFGenerator._extract_database_info(config)
         if db_info:
             section_header("Database Configuration")
-            pdf.set_font("Arial", size=11)
+            pdf.set_font(fonts.sans, size=11)
             for line in db_info:
                 pdf.cell(0, 6, txt=_ascii(line), ln=True)
             pdf.ln(2)
 
         # Requirements
-        if requirements:
+        if deps:
             section_header("Dependencies")
-            pdf.set_font("Arial", size=11)
-            for line in requirements.split('\n'):
-                if line.strip():
-                    pdf.cell(0, 6, txt=_ascii(f"- {line}"), ln=True)
+            pdf.set_font(fonts.sans, size=11)
+            for line in deps:
+                pdf.cell(0, 6, txt=_ascii(f"- {line}"), ln=True)
             pdf.ln(2)
 
         # Ports & Scripts table
-        table = PDFGenerator._ports_scripts(config)
         if table:
             try:
                 section_header("Ports & Scripts")
-                pdf.set_font("Arial", 'B', 11)
+                pdf.set_font(fonts.sans, 'B', 11)
                 pdf.set_fill_color(240,240,240)
                 pdf.cell(60, 8, _ascii("Component"), 1, 0, 'L', True)
                 pdf.cell(80, 8, _ascii("Dev Command"), 1, 0, 'L', True)
                 pdf.cell(40, 8, _ascii("Port"), 1, 1, 'L', True)
-                pdf.set_font("Courier", size=10)
+                pdf.set_font(fonts.mono, size=10)
                 for row in table:
                     comp, cmd, port = row
-                    pdf.cell(60, 7, _ascii(comp), 1)
-                    pdf.cell(80, 7, _ascii(cmd), 1)
-                    pdf.cell(40, 7, _ascii(port), 1, 1)
+                    pdf.cell(60, 7, fonts.mono_text(comp), 1)
+                    pdf.cell(80, 7, fonts.mono_text(cmd), 1)
+                    pdf.cell(40, 7, fonts.mono_text(port), 1, 1)
                 pdf.ln(2)
             except Exception:
                 # Gracefully skip table rendering if any issue arises
                 pass
 
         # Next Steps
-        steps = PDFGenerator._next_steps(config)
         if steps:
             section_header("Next Steps")
             for line in steps:
-                # Use Courier for command-like lines
+                # Use the monospaced font for command-like lines
                 stripped = line.strip().lower()
+                clean = _ascii
                 if stripped.startswith(("cd ", "npm ", "bun ", "uvicorn ", "python ", "./gradlew", "java -jar", "git ")):
-                    pdf.set_font("Courier", size=11)
+                    pdf.set_font(fonts.mono, size=11)
+                    clean = fonts.mono_text
                 elif stripped.startswith("(optional) initialize git"):
-                    pdf.set_font("Arial", 'B', 11)
+                    pdf.set_font(fonts.sans, 'B', 11)
                 elif stripped.startswith("your project is ready"):
-                    pdf.set_font("Arial", 'I', 11)
+                    pdf.set_font(fonts.sans, fonts.italic, 11)
                 else:
-                    pdf.set_font("Arial", size=11)
-                pdf.multi_cell(0, 6, txt=_ascii(line))
+                    pdf.set_font(fonts.sans, size=11)
+                paragraph(6, clean(line))
             pdf.ln(2)
 
         # ---------------------------------------------------------------------
         # Feature: Append the user's Project Description at the very end
         # Beautiful header + long, wrapped body text
         # ---------------------------------------------------------------------
-        desc = (config or {}).get('description')
         if desc:
             section_header("Project Description")
             # Use a more elegant font for the description body
-            pdf.set_font("Times", 'I', 12)
+            pdf.set_font(fonts.serif, fonts.italic, 12)
             pdf.set_text_color(60, 60, 60)
-            pdf.multi_cell(0, 6, txt=_ascii(str(desc)))
+            if DESCRIPTION_MAX_CHARS and len(desc) > DESCRIPTION_MAX_CHARS:
+                desc = desc[:DESCRIPTION_MAX_CHARS].rstrip() + f" ... ({len(desc) - DESCRIPTION_MAX_CHARS} more characters)"
+            paragraph(6, _ascii(desc))
             pdf.set_text_color(0, 0, 0)
             pdf.ln(2)
 
         # Branding footer (centered, subtle)
         pdf.set_y(-25)
-        pdf.set_font("Arial", 'I', 9)
+        pdf.set_font(fonts.sans, fonts.italic, 9)
         pdf.set_text_color(120, 120, 120)
         pdf.cell(0, 8, _ascii("Generated by ProjectMaker  |  (c) 2025 SwagCode4U"), 0, 0, 'C')
         pdf.set_text_color(0, 0, 0)
 
-        # Output as bytes
-        return pdf.output(dest='S').encode('latin-1', 'replace')
+        # Output as bytes (PyFPDF returns a latin-1 str, fpdf2 a bytearray)
+        out = pdf.output(dest='S')
+        return out.encode('latin-1', 'replace') if isinstance(out, str) else bytes(out)
 
     @staticmethod
     def _format_tree_lines(node: Dict) -> list[str]:
         """Return a list of ASCII tree lines using |-- and `-- connectors.
         Uses only ASCII so it renders with built-in FPDF fonts.
         """
-        lines: list[str] = []
+        return [prefix + label for prefix, label in tree_rows(node)]
 
-        def format_name(n: Dict) -> str:
-            name = str(n.get('name', ''))
-            ntype = str(n.get('type', ''))
-            # Add trailing slash for directories
-            return name + ('/' if ntype == 'directory' else '')
-
-        def walk_children(children: list, prefix: str = '') -> None:
-            for idx, child in enumerate(children or []):
-                last = idx == len(children) - 1
-                connector = '`-- ' if last else '|-- '
-                lines.append(f"{prefix}{connector}{format_name(child)}")
-                walk_children(child.get('children', []), prefix + ('    ' if last else '|   '))
-
-        # Start with root line, then recurse into its children
-        lines.append(format_name(node))
-        walk_children(list(node.get('children', []) or []), '')
-        return lines
+    @staticmethod
+    def _texts(*values):
+        """Every string in nested configs/trees/lists, for picking the font subset."""
+        stack = list(values)
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, Mapping):
+                for k, v in value.items():
+                    yield str(k)
+                    stack.append(v)
+            elif isinstance(value, (list, tuple, set)):
+                stack.extend(value)
+            elif value is not None:
+                yield str(value)
+
+    @staticmethod
+    def _summarize(value) -> str:
+        """One-line config value: long lists show their first items and a count, long text is cut."""
+        value = thaw(value)  # resolved configs hold tuples/FrozenDicts; show them as lists/dicts
+        if isinstance(value, list) and len(value) > CONFIG_LIST_ITEMS:
+            shown = ", ".join(str(v) for v in value[:CONFIG_LIST_ITEMS])
+            text = f"[{shown}, ... +{len(value) - CONFIG_LIST_ITEMS} more]"
+        else:
+            text = str(value)
+        if len(text) > CONFIG_VALUE_CHARS:
+            text = text[:CONFIG_VALUE_CHARS] + "..."
+        return text
 
     @staticmethod
     def _extract_database_info(config: Dict) -> list[str]:
@@ -205,15 +257,16 @@ class PDFGenerator:
 
     @staticmethod
     def _ports_scripts(config: Dict) -> list[tuple[str,str,str]]:
-        be = (config.get('backend_framework') or '').lower()
-        fe = (config.get('frontend_framework') or '').lower()
+        rc = resolve_config(config)
+        be = rc.backend_id
+        fe = rc.frontend_id
         rows: list[tuple[str,str,str]] = []
         # Backend
-        be_install, be_start = PDFGenerator._backend_commands(be, config.get('backend_folder_name','backend'))
+        be_install, be_start = PDFGenerator._backend_commands(be, rc.backend_folder)
         if be_start:
             rows.append(("Backend", be_start, PDFGenerator._backend_port(be)))
         # Frontend
-        fe_install, fe_start = PDFGenerator._frontend_commands(fe, config.get('frontend_folder_name','frontend'))
+        fe_install, fe_start = PDFGenerator._frontend_commands(fe, rc.frontend_folder)
         if fe_start:
             rows.append(("Frontend", fe_start, PDFGenerator._frontend_port(fe)))
         return rows
@@ -222,10 +275,11 @@ class PDFGenerator:
     def _next_steps(config: Dict) -> list[str]:
         lines: list[str] = []
         proj_dir = str(config.get('target_directory') or f"./{config.get('project_name','project')}")
-        be = (config.get('backend_framework') or '').lower()
-        fe = (config.get('frontend_framework') or '').lower()
-        backend_dir = config.get('backend_folder_name', 'backend')
-        frontend_dir = config.get('frontend_folder_name', 'frontend')
+        rc = resolve_config(config)
+        be = rc.backend_id
+        fe = rc.frontend_id
+        backend_dir = rc.backend_folder
+        frontend_dir = rc.frontend_folder
 
         # Header
         lines.append(f"1) Navigate to your project directory:\n   cd {proj_dir}")
@@ -0,0 +1,147 @@
+# backend/app/services/pdf_tree_layout.py
+import os
+from typing import Callable, Dict, List, Tuple
+
+# 0 disables a limit
+TREE_MAX_DEPTH = int(os.getenv("PROJECTMAKER_PDF_TREE_DEPTH", "8") or 0)
+TREE_DIR_LIMIT = int(os.getenv("PROJECTMAKER_PDF_TREE_DIR_LIMIT", "40") or 0)
+TREE_PAGE_BUDGET = int(os.getenv("PROJECTMAKER_PDF_TREE_PAGES", "6") or 0)
+TREE_MAX_COLUMNS = max(1, int(os.getenv("PROJECTMAKER_PDF_TREE_COLUMNS", "3") or 1))
+
+FONT = "Courier"        # monospaced: line width is len(text) * char width, no per-line measuring
+FONT_SIZE = 8
+LINE_H = 3.6            # mm
+GUTTER = 4.0            # mm between columns
+MIN_COLUMN_CHARS = 40   # only go multi-column if lines (up to this long) still fit
+ELLIPSIS = "..."
+
+Row = Tuple[str, str]   # (connector prefix, label)
+
+
+def _label(node: Dict) -> str:
+    name = str(node.get('name', ''))
+    return name + ('/' if str(node.get('type', '')) == 'directory' else '')
+
+
+def _subtree_size(node: Dict) -> int:
+    """Number of descendants (iterative; each collapsed subtree is counted once)."""
+    total, stack = 0, [node]
+    while stack:
+        children = stack.pop().get('children') or ()
+        total += len(children)
+        stack.extend(children)
+    return total
+
+
+def tree_rows(tree: Dict, max_depth: int = 0, dir_limit: int = 0) -> List[Row]:
+    """
+    Flatten a preview tree into |-- / `-- rows in one iterative pass.
+    Directories at max_depth are collapsed to "name/ (+N)"; a directory with more than
+    dir_limit children shows the first dir_limit - 1 and a "... k more" row.
+    With no limits the rows match the classic recursive ASCII tree.
+    """
+    def frame(node: Dict, prefix: str, depth: int) -> list:
+        children = list(node.get('children') or ())
+        hidden: list = []
+        if dir_limit and len(children) > dir_limit:
+            children, hidden = children[:max(1, dir_limit - 1)], children[max(1, dir_limit - 1):]
+        return [children, 0, prefix, depth, hidden]
+
+    rows: List[Row] = [("", _label(tree))]
+    stack = [frame(tree, "", 1)]
+    while stack:
+        top = stack[-1]
+        children, i, prefix, depth, hidden = top
+        if i < len(children):
+            top[1] = i + 1
+            child = children[i]
+            last = i == len(children) - 1 and not hidden
+            label = _label(child)
+            descend = bool(child.get('children'))
+            if descend and max_depth and depth >= max_depth:
+                label += f" (+{_subtree_size(child)})"
+                descend = False
+            rows.append((prefix + ('`-- ' if last else '|-- '), label))
+            if descend:
+                stack.append(frame(child, prefix + ('    ' if last else '|   '), depth + 1))
+            continue
+        stack.pop()
+        if hidden:
+            total = len(hidden) + sum(_subtree_size(h) for h in hidden)
+            more = f"... {len(hidden)} more" + (f" ({total} entries)" if total > len(hidden) else "")
+            rows.append((prefix + '`-- ', more))
+    return rows
+
+
+def fit_row(prefix: str, label: str, width: int) -> str:
+    """Fit a row into `width` characters: shorten the label in the middle, then the indent."""
+    if len(prefix) + len(label) <= width:
+        return prefix + label
+    keep = max(0, width - 12)  # leave room for a readable label
+    if len(prefix) > keep:
+        prefix = prefix[len(prefix) - keep:]
+    room = width - len(prefix)
+    if len(label) <= room:
+        return prefix + label
+    if room <= len(ELLIPSIS) + 2:
+        return prefix + label[:max(0, room)]
+    head = (room - len(ELLIPSIS) + 1) // 2
+    tail = room - len(ELLIPSIS) - head
+    return prefix + label[:head] + ELLIPSIS + (label[-tail:] if tail else "")
+
+
+def render_tree(pdf, tree: Dict, clean: Callable[[str], str] = str, font: str = FONT,
+                max_depth: int = TREE_MAX_DEPTH, dir_limit: int = TREE_DIR_LIMIT,
+                page_budget: int = TREE_PAGE_BUDGET, max_columns: int = TREE_MAX_COLUMNS) -> Dict:
+    """
+    Draw the tree section at the current position: rows flow down up to max_columns
+    columns per page (column-major, last page balanced), long rows are shortened to the
+    column width, and at most page_budget pages are used. Linear in the number of rows;
+    each row is a single pdf.text() call. `font` must be monospaced. Returns layout stats.
+    """
+    rows = tree_rows(tree, max_depth, dir_limit)
+    pdf.set_font(font, size=FONT_SIZE)
+    char_w = pdf.get_string_width("M") or 1.0
+    usable = pdf.w - pdf.l_margin - pdf.r_margin
+    bottom = pdf.h - pdf.b_margin
+    page_rows = max(1, int((bottom - pdf.t_margin) // LINE_H))
+    if int((bottom - pdf.get_y()) // LINE_H) < 3:
+        pdf.add_page()
+    first_rows = max(1, int((bottom - pdf.get_y()) // LINE_H))
+
+    columns = 1
+    if len(rows) > first_rows:
+        longest = max(len(p) + len(l) for p, l in rows)
+        for n in range(max_columns, 1, -1):
+            if (usable - (n - 1) * GUTTER) / n / char_w >= min(longest, MIN_COLUMN_CHARS):
+                columns = n
+                break
+    col_w = (usable - (columns - 1) * GUTTER) / columns
+    width = max(1, int(col_w / char_w))
+
+    omitted = 0
+    if page_budget:
+        capacity = (first_rows + (page_budget - 1) * page_rows) * columns
+        if len(rows) > capacity:
+            omitted = len(rows) - capacity + 1
+            rows = rows[:capacity - 1] + [("", f"... {omitted} more lines not shown (page limit)")]
+
+    baseline = LINE_H * 0.75
+    pos, pages, per_column = 0, 1, first_rows
+    y0 = pdf.get_y()
+    used = 0
+    while pos < len(rows):
+        if pos:
+            pdf.add_page()
+            pdf.set_font(font, size=FONT_SIZE)
+            pages += 1
+            y0, per_column = pdf.get_y(), page_rows
+        chunk = rows[pos:pos + per_column * columns]
+        used = -(-len(chunk) // columns)  # balance the last page's columns
+        for c in range(columns):
+            x = pdf.l_margin + c * (col_w + GUTTER)
+            for j, (prefix, label) in enumerate(chunk[c * used:(c + 1) * used]):
+                pdf.text(x, y0 + j * LINE_H + baseline, clean(fit_row(prefix, label, width)))
+        pos += len(chunk)
+    pdf.set_xy(pdf.l_margin, y0 + used * LINE_H)
+    return {"rows": len(rows), "columns": columns, "pages": pages, "width": width, "omitted": omitted}
@@ -0,0 +1,59 @@
+# backend/app/services/preview_cache.py
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from .frameworks.registry import preview_backend_tree, preview_frontend_tree
+
+# Framework preview trees only vary by their folder name. Each framework's tree is
+# rendered once with this placeholder as the folder name and kept as nested tuples;
+# a request then only expands the tuples and substitutes the real name.
+_SLOT = "\x00folder\x00"
+
+# (name, type, children or None)
+Node = Tuple[str, str, Optional[tuple]]
+
+
+def _freeze(node: Dict) -> Node:
+    children = node.get("children")
+    return (
+        str(node.get("name", "")),
+        node.get("type", "file"),
+        tuple(_freeze(c) for c in children) if children is not None else None,
+    )
+
+
+def _thaw(node: Node, folder: str) -> Dict:
+    name, kind, children = node
+    out = {"name": name.replace(_SLOT, folder) if _SLOT in name else name, "type": kind}
+    if children is not None:
+        out["children"] = [_thaw(c, folder) for c in children]
+    return out
+
+
+@lru_cache(maxsize=64)
+def backend_skeleton(backend_id: str) -> Optional[Node]:
+    tree = preview_backend_tree({"backend_framework": backend_id, "backend_folder_name": _SLOT}) if backend_id else None
+    return _freeze(tree) if tree else None
+
+
+@lru_cache(maxsize=64)
+def frontend_skeleton(frontend_id: str) -> Optional[Node]:
+    tree = preview_frontend_tree({"frontend_framework": frontend_id, "frontend_folder_name": _SLOT}) if frontend_id else None
+    return _freeze(tree) if tree else None
+
+
+def backend_tree(backend_id: str, folder: str) -> Optional[Dict]:
+    """Fresh preview subtree for a backend id (callers may mutate it)."""
+    skel = backend_skeleton(backend_id)
+    return _thaw(skel, folder) if skel else None
+
+
+def frontend_tree(frontend_id: str, folder: str) -> Optional[Dict]:
+    skel = frontend_skeleton(frontend_id)
+    return _thaw(skel, folder) if skel else None
+
+
+def clear() -> None:
+    """Drop memoized skeletons, e.g. after hot-reloading a framework module."""
+    backend_skeleton.cache_clear()
+    frontend_skeleton.cache_clear()
@@ -1,150 +1,81 @@
 # backend/app/services/project_generator.py
+import functools
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from .build_plan import BuildPlan, apply_plan
+from .output_sinks import DiskSink, OutputSink
+from .incremental import diff_plan, load_manifest, now_stamp, save_manifest
+from .resolved_config import resolve_config
+from .tree_builder import TreeBuilder
+from .path_normalizer import PathNormalizer, normalize_paths
+from .metrics import build_bytes, build_files, build_stage_seconds, builds_total, stage
+from .frameworks.aliases import normalize_backend
+from . import preview_cache
 from .frameworks.registry import (
-    preview_backend_tree,
-    preview_frontend_tree,
-    build_backend as registry_build_backend,
-    build_frontend as registry_build_frontend,
+    plan_backend as registry_plan_backend,
+    plan_frontend as registry_plan_frontend,
 )
 
 
+# Where projects are built when no target_directory is given
+DEFAULT_OUTPUT_DIR = "/tmp/generated_projects"
+
+
 class ProjectGenerator:
     """
     Core service for generating project structures with files and folders
     """
     
-    def __init__(self, base_output_dir: str = "/tmp/generated_projects"):
+    def __init__(self, base_output_dir: str = DEFAULT_OUTPUT_DIR, write_workers: Optional[int] = None):
         self.base_output_dir = base_output_dir
-        os.makedirs(base_output_dir, exist_ok=True)
+        self.write_workers = write_workers
+        # The output dir is created on demand by build_project (parents=True),
+        # so in-memory uses (preview, export) never touch the disk
     
+    def default_target(self, config: Dict) -> str:
+        """Directory build_project writes to when it is not given one."""
+        return os.path.join(self.base_output_dir, config["project_name"])
+
     def _normalize_rel(self, raw: str, config: Dict) -> str:
-        """Normalize any user path to a safe project-relative path.
-        - Strips everything up to <project_name>/ if present (case-insensitive)
-        - If 'backend' or 'frontend' appears anywhere, slices from that anchor and maps
-          to configured folder names
-        - Removes parent traversals
-        """
-        s = str(raw).replace('\\', '/').strip()
-        parts = [p for p in s.split('/') if p]
-        lowers = [p.lower() for p in parts]
-        proj = (config.get('project_name') or '').lower()
-        
-# If project name appears, remove everything before it
-        if proj in lowers:
-            i = lowers.index(proj)
-            parts = parts[i+1:]
-            lowers = lowers[i+1:]
-        # anchor slice
-        if 'backend' in lowers or 'frontend' in lowers:
-            if 'backend' in lowers:
-                i = lowers.index('backend')
-                parts = parts[i:]
-                lowers = lowers[i:]
-                parts[0] = config.get('backend_folder_name', 'backend')
-            else:
-                i = lowers.index('frontend')
-                parts = parts[i:]
-                lowers = lowers[i:]
-                parts[0] = config.get('frontend_folder_name', 'frontend')
-        # join cleaned parts, remove any parent traversal markers and
-        # ensure the returned path is always a relative path (no leading slash)
-        rel = '/'.join(parts)
-        # remove any parent traversal remnants
-        rel = rel.replace('..', '')
-        # strip any leading path separators just in case an absolute-like
-        # component slipped through (prevents Path(project_root) / rel
-        # from becoming absolute)
-        rel = rel.lstrip('/\\')
-        # collapse repeated separators and empty segments
-        rel = '/'.join([p for p in rel.split('/') if p])
-        return rel
+        """Normalize one user path to a safe project-relative path (see PathNormalizer)."""
+        return PathNormalizer.for_config(config).normalize(raw)
     
     def generate_project_tree(self, config: Dict) -> Dict:
         """
         Generate a preview of the project structure without creating files
         Returns a tree structure representation
         """
+        config = resolve_config(config)
+        builder = TreeBuilder(config["project_name"])
+
         # Special-case: Next.js fullstack (single app) when both sides selected as Next.js
-        bf = str((config.get('backend_framework') or '').lower())
-        ff = str((config.get('frontend_framework') or '').lower())
-        bnorm = 'nextjs' if bf in ['nextjs','next','next.js','nextjs-api','nextjs_api','nextjsapi'] else bf
-        fnorm = 'nextjs' if ff in ['nextjs','next','next.js'] else ff
-        if bnorm == 'nextjs' and fnorm == 'nextjs':
-            return self._next_fullstack_tree(config)
-
-        tree = {
-            "name": config["project_name"],
-            "type": "directory",
-            "children": []
-        }
-        
-        # Backend tree via registry
-        be_tree = preview_backend_tree(config)
-        if be_tree:
-            tree["children"].append(be_tree)
-        
-        # Frontend tree via registry
-        fe_tree = preview_frontend_tree(config)
-        if fe_tree:
-            tree["children"].append(fe_tree)
-        
-        # Add common folders and any file-like entries passed via custom_folders
-        def _is_file_like(name: str) -> bool:
-            from pathlib import Path as _P
-            return bool(_P(str(name)).suffix)
-        
-        for entry in config.get("custom_folders", ["docs", "tests"]):
-            rel = self._normalize_rel(entry, config)
-            if rel and _is_file_like(rel):
-                tree["children"].append({
-                    "name": rel,
-                    "type": "file"
-                })
-            elif rel:
-                tree["children"].append({
-                    "name": rel,
-                    "type": "directory",
-                    "children": []
-                })
-        
-        # Add explicitly specified custom files (if any)
-        for f in config.get("custom_files", []):
-            name = (f or {}).get("name")
-            if name:
-                relname = self._normalize_rel(name, config)
-                if relname:
-                    tree["children"].append({
-                        "name": relname,
-                        "type": "file"
-                    })
-        
-        # Add root files
-        root_files = ["README.md", ".gitignore"]
+        if config.is_next_fullstack:
+            builder.merge_children(self._next_fullstack_tree(config))
+        else:
+            # Framework trees via registry (memoized per framework, folder name spliced in)
+            builder.merge(preview_cache.backend_tree(config.backend_id, config.backend_folder))
+            builder.merge(preview_cache.frontend_tree(config.frontend_id, config.frontend_folder))
+
+        # custom_folders (folders and file-like entries) and custom_files, normalized together;
+        # nested entries like docs/api/v1 are merged into the tree, not listed flat
+        for entry in normalize_paths(config).entries:
+            builder.add(entry.path, entry.kind)
+
+        # Root files
+        builder.add_all(["README.md", ".gitignore"])
         if config.get("initialize_git"):
-            root_files.append(".git")
-        
-        for file in root_files:
-            tree["children"].append({
-                "name": file,
-                "type": "file"
-            })
-        
-        return tree
+            builder.add(".git")
+
+        return builder.to_tree()
     
     def _generate_backend_tree(self, framework: str, config: Dict) -> Dict:
         """Generate backend folder structure based on framework"""
         backend_name = config.get("backend_folder_name", "backend")
         # Apply same alias normalization used in preview
-        aliases = {
-            "express.js": "express", "expressjs": "express", "node": "express", "nodejs": "express",
-            "nest": "nestjs", "nestjs.js": "nestjs",
-            "next": "nextjs", "next.js": "nextjs", "nextjs-api": "nextjs", "nextjs_api": "nextjs", "nextjsapi": "nextjs"
-        }
-        fw = aliases.get(framework.lower(), framework.lower())
+        fw = normalize_backend(framework)
         
         if fw == "fastapi":
             return {
@@ -375,15 +306,109 @@ class ProjectGenerator:
                 ]
             }
     
-    def build_project(self, config: Dict, target_directory: Optional[str] = None) -> Dict:
+    def plan_project(self, config: Dict, created_at: Optional[str] = None) -> BuildPlan:
+        """
+        Render the whole project into an in-memory BuildPlan without touching disk.
+        Preview, build and export can all consume the same plan.
+        Template-backed files stay lazy until read (or plan.render_all()), so a single file
+        can be previewed without rendering the rest.
+        created_at pins the README timestamp (incremental builds reuse the manifest's).
+        """
+        config = resolve_config(config)
+        plan = BuildPlan()
+
+        # Special-case: Next.js fullstack single app
+        if config.is_next_fullstack:
+            plan.add_note("🔧 Backend: nextjs (fullstack)")
+            plan.add_note("🎨 Frontend: nextjs (fullstack)")
+            plan.extend(self._next_fullstack_plan(config))
+        else:
+            # Backend
+            if config.get("backend_framework"):
+                be_plan = registry_plan_backend(config)
+                bt = be_plan.meta.get("backend_type")
+                if bt:
+                    plan.add_note(f"🔧 Backend: {bt}")
+                plan.extend(be_plan)
+                # Fallback: if the registry rendered nothing for the backend, use the legacy scaffold
+                if not be_plan.files:
+                    try:
+                        plan.extend(self._legacy_backend_plan(config))
+                    except Exception as _e:
+                        plan.errors.append(f"❌ Backend fallback error: {_e}")
+
+            # Frontend
+            ffw_raw = str(config.get("frontend_framework") or "").strip()
+            if ffw_raw:
+                fe_plan = registry_plan_frontend(config)
+                ft = fe_plan.meta.get("frontend_type")
+                if ft:
+                    plan.add_note(f"🎨 Frontend: {ft}")
+                plan.extend(fe_plan)
+
+        # Custom folders, file-like entries and explicit custom files, normalized in one batch
+        paths = normalize_paths(config)
+        for entry in paths.entries:
+            if entry.kind == "directory":
+                plan.add_dir(entry.path, message=f"✅ Created folder: {entry.path}")
+            elif entry.source == "custom_files":
+                plan.add_file(entry.path, entry.content, message=f"✅ Created file: {entry.path}")
+            else:
+                plan.add_file(entry.path, "", message=f"✅ Created file: {entry.path}")
+        for dup in paths.duplicates:
+            plan.add_note(f"⚠️ Duplicate path, kept the last entry: {dup['path']}")
+        for conflict in paths.conflicts:
+            plan.add_note(f"⚠️ Path is both a file and a folder, kept the folder: {conflict['path']}")
+        for raw in paths.dropped:
+            plan.add_note(f"⚠️ Ignored path that resolves to the project root: {raw}")
+        if paths.has_issues():
+            plan.meta["paths"] = paths.as_dict()
+
+        # Root files
+        plan.add_file("README.md", lambda: self._readme_content(config, created_at), message="✅ Created README.md")
+        plan.add_file(".gitignore", lambda: self._gitignore_content(config), message="✅ Created .gitignore")
+
+        # Helper scripts (setup.sh, setup.bat, db_setup.sh, Docker, etc.), rendered on first read
+        try:
+            from .script_generator import ScriptGenerator
+            renderers = ScriptGenerator.setup_script_renderers(config)
+            for name, render in renderers.items():
+                plan.add_file(name, functools.partial(render, config),
+                              mode=ScriptGenerator.script_mode(name), message=f"✅ Created script: {name}")
+            plan.meta["scripts"] = tuple(renderers)
+        except Exception as se:
+            plan.errors.append(f"❌ Script generation error: {str(se)}")
+
+        return plan
+
+    def build_project(
+        self,
+        config: Dict,
+        target_directory: Optional[str] = None,
+        sink: Optional[OutputSink] = None,
+        mode: str = "full",
+        overwrite_conflicts: bool = False,
+        progress: Optional[Callable[[str], None]] = None,
+    ) -> Dict:
         """
-        Actually create the project files and folders on disk
+        Actually create the project files and folders
+        Writes to disk by default; pass a sink (memory, zip, tar) to generate without disk I/O.
+        mode="incremental" only rewrites files whose content changed since the last build
+        (see incremental.diff_plan); locally edited files are reported as conflicts.
+        progress, if given, is called with each operation as it is recorded.
         Returns status of operations
         """
+        if mode not in ("full", "incremental"):
+            raise ValueError(f"Unknown build mode: {mode}")
+        config = resolve_config(config)
         if target_directory is None:
-            target_directory = os.path.join(self.base_output_dir, config["project_name"])
+            target_directory = self.default_target(config)
         
         project_root = Path(target_directory)
+        to_disk = sink is None
+        if to_disk:
+            sink = DiskSink(project_root, self.write_workers)
+        incremental = mode == "incremental" and to_disk
         
         status = {
             "success": True,
@@ -391,158 +416,85 @@ class ProjectGenerator:
             "operations": [],
             "errors": []
         }
+
+        def _op(message: str) -> None:
+            status["operations"].append(message)
+            if progress:
+                progress(message)
         
         try:
-            # Create root directory
-            project_root.mkdir(parents=True, exist_ok=True)
-            status["operations"].append(f"✅ Created project root: {project_root}")
-
-            # Special-case: Next.js fullstack single app
-            bf = str((config.get('backend_framework') or '').lower())
-            ff = str((config.get('frontend_framework') or '').lower())
-            bnorm = 'nextjs' if bf in ['nextjs','next','next.js','nextjs-api','nextjs_api','nextjsapi'] else bf
-            fnorm = 'nextjs' if ff in ['nextjs','next','next.js'] else ff
-            if bnorm == 'nextjs' and fnorm == 'nextjs':
-                fs = self._create_next_fullstack(project_root, config)
-                status["operations"].append("🔧 Backend: nextjs (fullstack)")
-                status["operations"].append("🎨 Frontend: nextjs (fullstack)")
-                status["operations"].extend(fs["operations"])
-                status["errors"].extend(fs.get("errors", []))
-            else:
-                # Create backend
-                if config.get("backend_framework"):
-                    backend_status = registry_build_backend(project_root, config)
-                    bt = backend_status.get("backend_type")
-                    if bt:
-                        status["operations"].append(f"🔧 Backend: {bt}")
-                    status["operations"].extend(backend_status["operations"])
-                    status["errors"].extend(backend_status.get("errors", []))
-                    # Fallback: if registry produced nothing OR the backend folder is effectively empty
-                    try:
-                        backend_name = config.get("backend_folder_name", "backend")
-                        backend_path = project_root / backend_name
-                        is_empty = True
-                        if backend_path.exists():
-                            for _p in backend_path.rglob('*'):
-                                is_empty = False
-                                break
-                        if (not backend_status.get("operations")) or is_empty:
-                            legacy = self._create_backend(project_root, config)
-                            status["operations"].extend(legacy.get("operations", []))
-                            status["errors"].extend(legacy.get("errors", []))
-                    except Exception as _e:
-                        status["errors"].append(f"❌ Backend fallback error: {_e}")
-                
-                # Create frontend
-                ffw_raw = str(config.get("frontend_framework") or "").strip()
-                if ffw_raw:
-                    frontend_status = registry_build_frontend(project_root, config)
-                    ft = frontend_status.get("frontend_type")
-                    if ft:
-                        status["operations"].append(f"🎨 Frontend: {ft}")
-                    status["operations"].extend(frontend_status["operations"])
-                    status["errors"].extend(frontend_status.get("errors", []))
-            
-            # Create custom folders and file-like entries
-            def _is_file_like(name: str) -> bool:
-                from pathlib import Path as _P
-                return bool(_P(str(name)).suffix)
-            
-            for entry in config.get("custom_folders", ["docs", "tests"]):
-                if not entry:
-                    continue
-                rel_norm = self._normalize_rel(entry, config)
-                if _is_file_like(rel_norm):
-                    rel = rel_norm.replace('..', '')
-                    file_path = project_root / rel
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                    file_path.write_text("")
-                    status["operations"].append(f"✅ Created file: {rel}")
-                elif rel_norm:
-                    rel_dir = rel_norm.replace('..', '')
-                    folder_path = project_root / rel_dir
-                    folder_path.mkdir(parents=True, exist_ok=True)
-                    status["operations"].append(f"✅ Created folder: {rel_dir}")
-            
-            # Create explicitly specified custom files
-            for f in config.get("custom_files", []):
-                try:
-                    name = str((f or {}).get("name", "")).strip()
-                    if not name:
-                        continue
-                    content = (f or {}).get("content", "")
-                    from pathlib import Path as _P
-                    rel = self._normalize_rel(name, config)
-                    dest = project_root / rel
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    dest.write_text(content)
-                    status["operations"].append(f"✅ Created file: {rel}")
-                except Exception as ce:
-                    status["errors"].append(f"❌ Custom file error ({(f or {}).get('name')}): {str(ce)}")
+            # Render everything first, then write it in one pass
+            manifest = load_manifest(project_root) if to_disk else {}
+            created = manifest.get("created") or now_stamp()
+            # Disjoint stages (they sum to the build time): templates, then helper scripts
+            with stage("render"):
+                plan = self.plan_project(config, created_at=created)
+                scripts = plan.meta.get("scripts", ())
+                plan.render_all(lambda f: f.path not in scripts)
+            with stage("scripts"):
+                plan.render_all()
+            todo, report = plan, None
+            if incremental:
+                with stage("diff"):
+                    todo, report = diff_plan(plan, project_root, manifest, overwrite_conflicts)
+            with sink:
+                if to_disk and not incremental:
+                    _op(f"✅ Created project root: {project_root}")
+                result = apply_plan(todo, sink)
+            for message in result["operations"]:
+                _op(message)
+            status["errors"].extend(result["errors"])
+            status["write_stats"] = stats = result["stats"]
+            self._observe_write(stats)
+            if "paths" in plan.meta:
+                status["paths"] = plan.meta["paths"]
+            if report is not None:
+                status["incremental"] = {k: len(v) for k, v in report.items()}
+                status["conflicts"] = report["conflicts"]
+                status["orphaned"] = report["orphaned"]
+            if to_disk:
+                # Only files written now, or verified identical, get a fresh record
+                current = set(result["written"]) | set(report["unchanged"] if report else ())
+                save_manifest(project_root, plan, manifest, created, current=current)
             
-            # Create root files
-            self._create_readme(project_root, config)
-            status["operations"].append("✅ Created README.md")
-            
-            self._create_gitignore(project_root, config)
-            status["operations"].append("✅ Created .gitignore")
-
-            # Generate helper scripts (setup.sh, setup.bat, db_setup.sh, Docker, etc.)
-            try:
-                from .script_generator import ScriptGenerator
-                scripts = ScriptGenerator.generate_setup_scripts(config)
-                for name, content in scripts.items():
-                    fp = project_root / name
-                    fp.write_text(content)
-                    # Make shell scripts executable
-                    if name.endswith('.sh'):
-                        try:
-                            import os, stat
-                            os.chmod(fp, os.stat(fp).st_mode | stat.S_IXUSR)
-                        except Exception:
-                            pass
-                    status["operations"].append(f"✅ Created script: {name}")
-            except Exception as se:
-                status["errors"].append(f"❌ Script generation error: {str(se)}")
-            
-            # Initialize git if requested
-            if config.get("initialize_git"):
+            # Initialize git if requested (only meaningful for a real directory, and only once)
+            if config.get("initialize_git") and to_disk and not (project_root / ".git").exists():
                 import subprocess
-                subprocess.run(["git", "init"], cwd=project_root, capture_output=True)
-                status["operations"].append("✅ Initialized Git repository")
+                with stage("git_init"):
+                    subprocess.run(["git", "init"], cwd=project_root, capture_output=True)
+                _op("✅ Initialized Git repository")
             
         except Exception as e:
             status["success"] = False
             status["errors"].append(f"❌ Error: {str(e)}")
-            
+
+        builds_total.inc(mode, "success" if status["success"] else "failed")
         return status
+
+    @staticmethod
+    def _observe_write(stats: Dict) -> None:
+        """Feed a sink's write stats into the build metrics (disk sinks split mkdir/write)."""
+        if "mkdir_seconds" in stats:
+            build_stage_seconds.observe(stats["mkdir_seconds"], "mkdir")
+            build_stage_seconds.observe(stats["write_seconds"], "write")
+        elif "wall_seconds" in stats:
+            build_stage_seconds.observe(stats["wall_seconds"], "write")
+        build_files.observe(stats.get("files", 0))
+        build_bytes.observe(stats.get("bytes", 0))
     
-    def _create_backend(self, project_root: Path, config: Dict) -> Dict:
-        """Create backend structure and files"""
+    def _legacy_backend_plan(self, config: Dict) -> BuildPlan:
+        """Legacy backend scaffold, used when the registry renders nothing"""
         from .templates import BackendTemplates
         
-        backend_name = config.get("backend_folder_name", "backend")
-        backend_path = project_root / backend_name
-        fw_raw = str(config.get("backend_framework") or "").strip().lower()
-        aliases = {
-            "express.js": "express", "expressjs": "express", "node": "express", "nodejs": "express",
-            "nest": "nestjs", "nestjs.js": "nestjs",
-            "next": "nextjs", "next.js": "nextjs", "nextjs-api": "nextjs", "nextjs_api": "nextjs", "nextjsapi": "nextjs"
-        }
-        framework = aliases.get(fw_raw, fw_raw)
+        config = resolve_config(config)
+        backend_name = config.backend_folder
+        framework = config.backend_id
         
-        status = {"operations": [], "errors": [], "backend_type": framework}
+        plan = BuildPlan(backend_type=framework)
         
         try:
             if framework == "fastapi":
-                # Create structure
-                app_path = backend_path / "app"
-                routes_path = app_path / "routes"
-                
-                app_path.mkdir(parents=True, exist_ok=True)
-                routes_path.mkdir(exist_ok=True)
-                
-                # Create files
+                plan.add_dir(f"{backend_name}/app/routes")
                 files = {
                     "app.py": BackendTemplates.fastapi_root_app(config),
                     "app/__init__.py": "",
@@ -558,13 +510,10 @@ class ProjectGenerator:
                 }
                 
                 for file_path, content in files.items():
-                    full_path = backend_path / file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(content)
-                    status["operations"].append(f"✅ Created: {backend_name}/{file_path}")
+                    plan.add_file(f"{backend_name}/{file_path}", content)
             
             elif framework == "flask":
-                backend_path.mkdir(parents=True, exist_ok=True)
+                plan.add_dir(backend_name)
                 files = {
                     "app.py": BackendTemplates.flask_app(config),
                     "config.py": BackendTemplates.flask_config(config),
@@ -575,13 +524,10 @@ class ProjectGenerator:
                 }
                 
                 for file_path, content in files.items():
-                    (backend_path / file_path).write_text(content)
-                    status["operations"].append(f"✅ Created: {backend_name}/{file_path}")
+                    plan.add_file(f"{backend_name}/{file_path}", content)
             
             elif framework == "django":
-                backend_path.mkdir(parents=True, exist_ok=True)
-                core_path = backend_path / "core"
-                core_path.mkdir(exist_ok=True)
+                plan.add_dir(f"{backend_name}/core")
                 
                 files = {
                     "manage.py": BackendTemplates.django_manage(config),
@@ -593,16 +539,12 @@ class ProjectGenerator:
                 }
                 
                 for file_path, content in files.items():
-                    (backend_path / file_path).write_text(content)
-                    status["operations"].append(f"✅ Created: {backend_name}/{file_path}")
+                    plan.add_file(f"{backend_name}/{file_path}", content)
             
             elif framework == "express":
-                backend_path.mkdir(parents=True, exist_ok=True)
-                # Create modular structure
-                (backend_path / "src" / "routes").mkdir(parents=True, exist_ok=True)
-                (backend_path / "src" / "controllers").mkdir(parents=True, exist_ok=True)
-                (backend_path / "src" / "middlewares").mkdir(parents=True, exist_ok=True)
-                (backend_path / "src" / "utils").mkdir(parents=True, exist_ok=True)
+                # Modular structure
+                for d in ["routes", "controllers", "middlewares", "utils"]:
+                    plan.add_dir(f"{backend_name}/src/{d}")
                 files = {
                     "package.json": BackendTemplates.express_package_json(config),
                     "src/app.js": BackendTemplates.express_app_js(config),
@@ -615,17 +557,12 @@ class ProjectGenerator:
                     "README.md": BackendTemplates.express_readme(config)
                 }
                 for file_path, content in files.items():
-                    full = backend_path / file_path
-                    full.parent.mkdir(parents=True, exist_ok=True)
-                    full.write_text(content)
-                    status["operations"].append(f"✅ Created: {backend_name}/{file_path}")
+                    plan.add_file(f"{backend_name}/{file_path}", content)
             
             elif framework in ["nextjs", "nextjs-api", "nextjs_api", "nextjsapi"]:
-                backend_path.mkdir(parents=True, exist_ok=True)
+                plan.add_dir(backend_name)
                 # Minimal Next.js project focused on API routes (backend port 5177)
-                pages_api = backend_path / "pages" / "api"
-                pages_api.mkdir(parents=True, exist_ok=True)
-                (backend_path / "package.json").write_text("""{
+                plan.add_file(f"{backend_name}/package.json", """{
   \"name\": \"nextjs-api-backend\",
   \"private\": true,
   \"version\": \"1.0.0\",
@@ -641,28 +578,27 @@ class ProjectGenerator:
     \"react-dom\": \"^18\"
   }
 }\n""")
-                (backend_path / "next.config.mjs").write_text("""/** @type {import('next').NextConfig} */
+                plan.add_file(f"{backend_name}/next.config.mjs", """/** @type {import('next').NextConfig} */
 const nextConfig = { reactStrictMode: true }
 export default nextConfig
 """)
                 # API routes
-                (pages_api / "hello.js").write_text("""export default function handler(req, res) {
+                plan.add_file(f"{backend_name}/pages/api/hello.js", """export default function handler(req, res) {
   res.status(200).json({ message: 'Hello from Next.js API' })
 }
 """)
-                (pages_api / "items.js").write_text("""let items = [{ id: 1, title: 'Sample item' }]
+                plan.add_file(f"{backend_name}/pages/api/items.js", """let items = [{ id: 1, title: 'Sample item' }]
 export default function handler(req, res) {
   if (req.method === 'GET') return res.status(200).json(items)
   if (req.method === 'POST') { const item = { id: Date.now(), ...(req.body||{}) }; items.push(item); return res.status(201).json(item) }
   res.status(405).json({ error: 'Method not allowed' })
 }
 """)
-                status["operations"].append(f"✅ Created: {backend_name}/Next.js API scaffold")
             
         except Exception as e:
-            status["errors"].append(f"❌ Backend error: {str(e)}")
+            plan.errors.append(f"❌ Backend error: {str(e)}")
         
-        return status
+        return plan
     
     def _next_fullstack_tree(self, config: Dict) -> Dict:
         name = config.get('project_name')
@@ -700,13 +636,10 @@ export default function handler(req, res) {
             ]
         }
 
-    def _create_next_fullstack(self, project_root: Path, config: Dict) -> Dict:
-        ops, errs = [], []
+    def _next_fullstack_plan(self, config: Dict) -> BuildPlan:
+        plan = BuildPlan()
         try:
-            (project_root / 'app' / 'api' / 'v1' / 'hello').mkdir(parents=True, exist_ok=True)
-            (project_root / 'app' / 'api' / 'v1' / 'users').mkdir(parents=True, exist_ok=True)
-            (project_root / 'app' / 'components').mkdir(parents=True, exist_ok=True)
-            (project_root / 'public' / 'images').mkdir(parents=True, exist_ok=True)
+            plan.add_dir('public/images')
             files = {
                 'package.json': """{
   "name": "nextjs-boilerplate",
@@ -772,162 +705,12 @@ body { font-family: 'Inter', sans-serif; }
                 'public/favicon.ico': 'placeholder',
             }
             for rel, content in files.items():
-                fp = project_root / rel
-                fp.parent.mkdir(parents=True, exist_ok=True)
-                fp.write_text(content)
-                ops.append(f"✅ Created: {rel}")
+                plan.add_file(rel, content)
         except Exception as e:
-            errs.append(str(e))
-        return { "operations": ops, "errors": errs }
-
-    def _create_frontend(self, project_root: Path, config: Dict) -> Dict:
-        """Create frontend structure and files"""
-        from .templates import FrontendTemplates
-        
-        frontend_name = config.get("frontend_folder_name", "frontend")
-        frontend_path = project_root / frontend_name
-        ffw_raw = str(config.get("frontend_framework") or "").strip().lower()
-        aliases = {
-            "next": "nextjs", "next.js": "nextjs",
-            "solid": "solidjs", "solid.js": "solidjs",
-        }
-        framework = aliases.get(ffw_raw, ffw_raw)
-        
-        status = {"operations": [], "errors": [], "frontend_type": framework}
-        
-        try:
-            if framework == "react":
-                src_path = frontend_path / "src"
-                public_path = frontend_path / "public"
-                src_path.mkdir(parents=True, exist_ok=True)
-                public_path.mkdir(exist_ok=True)
-                
-                files = {
-                    "package.json": FrontendTemplates.react_package_json(config),
-                    "index.html": FrontendTemplates.react_index_html(config),
-                    "src/App.jsx": FrontendTemplates.react_app(config),
-                    "src/main.jsx": FrontendTemplates.react_main(config),
-                    "src/index.css": FrontendTemplates.react_css(config),
-                    "src/components/Navbar.jsx": FrontendTemplates.react_navbar(config),
-                    "src/components/Hero.jsx": FrontendTemplates.react_hero(config),
-                    "src/components/Footer.jsx": FrontendTemplates.react_footer(config),
-                    "src/hooks/useLenis.js": FrontendTemplates.react_use_lenis(config),
-                    "src/styles/theme.js": FrontendTemplates.react_theme(config),
-                    "tailwind.config.js": FrontendTemplates.tailwind_config(config, framework="react"),
-                    "postcss.config.js": FrontendTemplates.postcss_config(),
-                    "README.md": FrontendTemplates.react_readme(config)
-                }
-                
-                for file_path, content in files.items():
-                    full_path = frontend_path / file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-            
-            elif framework == "vue":
-                src_path = frontend_path / "src"
-                src_path.mkdir(parents=True, exist_ok=True)
-                
-                files = {
-                    "package.json": FrontendTemplates.vue_package_json(config),
-                    "index.html": FrontendTemplates.vue_index_html(config),
-                    "src/App.vue": FrontendTemplates.vue_app(config),
-                    "src/main.js": FrontendTemplates.vue_main(config)
-                }
-                
-                for file_path, content in files.items():
-                    (frontend_path / file_path).write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-            
-            elif framework == "svelte":
-                (frontend_path / "src" / "lib").mkdir(parents=True, exist_ok=True)
-                (frontend_path / "src" / "routes").mkdir(parents=True, exist_ok=True)
-                (frontend_path / "public").mkdir(parents=True, exist_ok=True)
-
-                files = {
-                    "package.json": FrontendTemplates.svelte_package_json(config),
-                    "vite.config.js": FrontendTemplates.svelte_vite_config(config),
-                    "index.html": FrontendTemplates.svelte_index_html(config),
-                    "tailwind.config.js": FrontendTemplates.tailwind_config(config, framework="svelte"),
-                    "postcss.config.js": FrontendTemplates.postcss_config(),
-                    "src/App.svelte": FrontendTemplates.svelte_app(config),
-                    "src/app.css": FrontendTemplates.svelte_app_css(config),
-                    "src/main.js": FrontendTemplates.svelte_main_js(config),
-                    "src/lib/api.js": FrontendTemplates.svelte_lib_api_js(config),
-                    "src/lib/utils.js": FrontendTemplates.svelte_lib_utils_js(config),
-                    "src/routes/Home.svelte": FrontendTemplates.svelte_home(config),
-                    "src/routes/Explorer.svelte": FrontendTemplates.svelte_explorer(config),
-                    "src/routes/CreateFile.svelte": FrontendTemplates.svelte_create_file(config),
-                    "src/routes/DBDesigner.svelte": FrontendTemplates.svelte_db_designer(config)
-                }
+            plan.errors.append(str(e))
+        return plan
 
-                for file_path, content in files.items():
-                    full = frontend_path / file_path
-                    full.parent.mkdir(parents=True, exist_ok=True)
-                    full.write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-                # placeholder logo
-                (frontend_path / "public" / "logo.png").write_text("placeholder")
-            
-            elif framework == "angular":
-                src_path = frontend_path / "src" / "app"
-                src_path.mkdir(parents=True, exist_ok=True)
-                
-                files = {
-                    "package.json": FrontendTemplates.angular_package_json(config),
-                    "angular.json": FrontendTemplates.angular_json(config),
-                    "src/index.html": FrontendTemplates.angular_index_html(config),
-                    "src/main.ts": FrontendTemplates.angular_main(config),
-                    "src/app/app.component.ts": FrontendTemplates.angular_component(config)
-                }
-                
-                for file_path, content in files.items():
-                    full_path = frontend_path / file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-            
-            elif framework == "nextjs":
-                frontend_path.mkdir(parents=True, exist_ok=True)
-                app_path = frontend_path / "app"
-                app_path.mkdir(parents=True, exist_ok=True)
-                files = {
-                    "package.json": FrontendTemplates.nextjs_package_json(config),
-                    "next.config.mjs": FrontendTemplates.nextjs_config(config),
-                    "app/layout.jsx": FrontendTemplates.nextjs_layout(config),
-                    "app/page.jsx": FrontendTemplates.nextjs_page(config)
-                }
-                for file_path, content in files.items():
-                    full_path = frontend_path / file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-            
-            else:  # Plain HTML/CSS/JS
-                frontend_path.mkdir(parents=True, exist_ok=True)
-                files = {
-                    "index.html": FrontendTemplates.plain_html(config),
-                    "style.css": FrontendTemplates.plain_css(config),
-                    "script.js": FrontendTemplates.plain_js(config)
-                }
-                
-                for file_path, content in files.items():
-                    (frontend_path / file_path).write_text(content)
-                    status["operations"].append(f"✅ Created: {frontend_name}/{file_path}")
-        
-        except Exception as e:
-            status["errors"].append(f"❌ Frontend error: {str(e)}")
-        
-        # Ensure frontend .gitignore exists
-        try:
-            (frontend_path / '.gitignore').write_text("node_modules\ndist\n.env\n")
-            status["operations"].append(f"✅ Created: {frontend_name}/.gitignore")
-        except Exception as _:
-            pass
-        
-        return status
-    
-    def _create_readme(self, project_root: Path, config: Dict):
+    def _readme_content(self, config: Dict, created_at: Optional[str] = None) -> str:
         """Generate README.md"""
         readme_content = f"""# {config['project_name']}
 
@@ -960,11 +743,11 @@ npm run dev
 
 Generated with [ProjectMaker](https://github.com/SwagCode4U/projectmaker)
 
-Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Created: {created_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        (project_root / "README.md").write_text(readme_content)
+        return readme_content
     
-    def _create_gitignore(self, project_root: Path, config: Dict):
+    def _gitignore_content(self, config: Dict) -> str:
         """Generate .gitignore"""
         gitignore_content = """# Python
 __pycache__/
@@ -994,5 +777,8 @@ Thumbs.db
 # Database
 *.db
 *.sqlite3
+
+# ProjectMaker build manifest (incremental builds)
+.projectmaker/
 """
-        (project_root / ".gitignore").write_text(gitignore_content)
+        return gitignore_content
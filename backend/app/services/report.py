@@ -0,0 +1,267 @@
+# backend/app/services/report.py
+import base64
+import hashlib
+import html
+import os
+import re
+from typing import Dict, List, Mapping, Optional
+
+from .pdf_cache import DETERMINISTIC
+from .pdf_generator import PDFGenerator
+from .pdf_tree_layout import TREE_DIR_LIMIT, TREE_MAX_DEPTH, tree_rows
+from .resolved_config import resolve_config
+from .json_codec import dumps
+
+# Text formats have no page budget; cap the structure listing instead
+REPORT_TREE_LINES = int(os.getenv("PROJECTMAKER_REPORT_TREE_LINES", "2000") or 0)
+
+REPORT_FORMATS = {
+    "json": "application/json",
+    "markdown": "text/markdown; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+    "pdf": "application/pdf",
+}
+# Accept media type -> report format
+_ACCEPT = {
+    "application/json": "json",
+    "text/markdown": "markdown",
+    "text/x-markdown": "markdown",
+    "text/plain": "markdown",
+    "text/html": "html",
+    "application/xhtml+xml": "html",
+    "application/pdf": "pdf",
+    "text/*": "markdown",
+    "application/*": "json",
+}
+PORT_COLUMNS = ["Component", "Dev Command", "Port"]
+# Config keys whose values never appear in a report, in any format (PDF included)
+SECRET_KEY = re.compile(r"password|secret|token", re.IGNORECASE)
+# Local-only keys left out of reports entirely
+PRIVATE_KEYS = ("target_directory",)
+MASK = "[CONFIGURED]"
+
+
+def mask_secrets(config: Mapping) -> Dict:
+    """
+    The config with secret values masked the way the Database section shows the password
+    (set values become [CONFIGURED]). Reports render the same from it, so PDFs are keyed,
+    rendered and cached from this copy and a secret never reaches a worker or the disk cache.
+    """
+    return {k: (MASK if v else v) if SECRET_KEY.search(str(k)) else v for k, v in config.items()}
+
+
+def public_config(config: Mapping) -> Dict:
+    """The config as the Configuration section shows it: secrets masked, local paths dropped."""
+    return {k: v for k, v in mask_secrets(config).items() if k not in PRIVATE_KEYS}
+
+
+def requirements_for(config: Mapping) -> str:
+    """Backend requirements listed in the Dependencies section (Python backends only)."""
+    from .templates import BackendTemplates
+
+    backend = resolve_config(config).backend_id
+    if backend == "fastapi":
+        return BackendTemplates.fastapi_requirements()
+    if backend == "flask":
+        return BackendTemplates.flask_requirements()
+    return ""
+
+
+class Report:
+    """
+    The project summary as data: the sections the PDF shows, in order.
+    Each section has an id and title plus one of items (key/value pairs), lines,
+    columns + rows, or text. The tree stays attached for the PDF's own layout.
+    """
+
+    __slots__ = ('title', 'project_name', 'config_hash', 'sections', 'tree')
+
+    def __init__(self, project_name: str, config_hash: str, tree: Dict):
+        self.title = "ProjectMaker Report"
+        self.project_name = project_name
+        self.config_hash = config_hash
+        self.sections: List[Dict] = []
+        self.tree = tree
+
+    def section(self, section_id: str) -> Optional[Dict]:
+        for section in self.sections:
+            if section["id"] == section_id:
+                return section
+        return None
+
+    def as_dict(self) -> Dict:
+        return {"title": self.title, "project_name": self.project_name,
+                "config_hash": self.config_hash, "sections": self.sections}
+
+
+def build_report(config: Mapping, tree: Optional[Dict] = None, requirements: Optional[str] = None) -> Report:
+    """Collect every section once; all formats (PDF included) render from this."""
+    config = resolve_config(config)
+    if tree is None:
+        from .project_generator import ProjectGenerator
+        tree = ProjectGenerator().generate_project_tree(config)
+    if requirements is None:
+        requirements = requirements_for(config)
+
+    report = Report(config.get("project_name") or "", config.digest, tree)
+    add = report.sections.append
+    add({"id": "configuration", "title": "Configuration",
+         "items": [{"key": str(k), "value": v} for k, v in public_config(config).items()
+                   if str(k).lower() != "description"]})
+
+    rows = tree_rows(tree, TREE_MAX_DEPTH, TREE_DIR_LIMIT)
+    omitted = 0
+    if REPORT_TREE_LINES and len(rows) > REPORT_TREE_LINES:
+        omitted = len(rows) - REPORT_TREE_LINES
+        rows = rows[:REPORT_TREE_LINES]
+    add({"id": "structure", "title": "Project Structure",
+         "lines": [prefix + label for prefix, label in rows], "omitted": omitted})
+
+    db_info = PDFGenerator._extract_database_info(config)
+    if db_info:
+        add({"id": "database", "title": "Database Configuration", "lines": db_info})
+    if requirements:
+        add({"id": "dependencies", "title": "Dependencies",
+             "lines": [line for line in requirements.split("\n") if line.strip()]})
+    table = PDFGenerator._ports_scripts(config)
+    if table:
+        add({"id": "ports_scripts", "title": "Ports & Scripts", "columns": PORT_COLUMNS,
+             "rows": [list(row) for row in table]})
+    steps = PDFGenerator._next_steps(config)
+    if steps:
+        add({"id": "next_steps", "title": "Next Steps", "lines": steps})
+    desc = config.get("description")
+    if desc:
+        add({"id": "description", "title": "Project Description", "text": str(desc)})
+    return report
+
+
+def summary_pdf(config: Mapping) -> bytes:
+    """The full PDF for a plain config dict; picklable entry point for the CPU process pool."""
+    from .project_generator import ProjectGenerator
+
+    config = resolve_config(config)
+    tree = ProjectGenerator().generate_project_tree(config)
+    return PDFGenerator.generate_summary_pdf(config, tree, requirements_for(config), deterministic=DETERMINISTIC)
+
+
+def negotiate(accept: Optional[str], default: str = "json") -> Optional[str]:
+    """Pick a report format from an Accept header (q-values honoured); None if nothing fits."""
+    if not accept or not accept.strip():
+        return default
+    ranked = []
+    for order, part in enumerate(accept.split(",")):
+        media, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            ranked.append((-q, order, media.lower()))
+    for _, _, media in sorted(ranked):
+        if media == "*/*":
+            return default
+        fmt = _ACCEPT.get(media)
+        if fmt:
+            return fmt
+    return None
+
+
+# -- renderers ---------------------------------------------------------------------
+
+
+def render_json(report: Report) -> bytes:
+    return dumps(report.as_dict())
+
+
+def _md_cell(value) -> str:
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def render_markdown(report: Report) -> str:
+    out = [f"# {report.title}: {report.project_name}", ""]
+    for section in report.sections:
+        out += [f"## {section['title']}", ""]
+        sid = section["id"]
+        if sid == "configuration":
+            out += [f"- **{item['key']}**: {PDFGenerator._summarize(item['value'])}" for item in section["items"]]
+        elif sid == "structure":
+            out += ["```text", *section["lines"]]
+            if section["omitted"]:
+                out.append(f"... {section['omitted']} more lines")
+            out.append("```")
+        elif sid == "dependencies":
+            out += [f"- {line}" for line in section["lines"]]
+        elif sid == "ports_scripts":
+            out.append("| " + " | ".join(section["columns"]) + " |")
+            out.append("|" + "---|" * len(section["columns"]))
+            out += [f"| {_md_cell(c)} | `{_md_cell(cmd)}` | {_md_cell(p)} |" for c, cmd, p in section["rows"]]
+        elif sid == "next_steps":
+            for step in section["lines"]:
+                head, *commands = step.split("\n")
+                out.append(head)
+                if commands:
+                    out += ["", "```sh", *(c.strip() for c in commands), "```"]
+                out.append("")
+        elif "lines" in section:
+            out += section["lines"]
+        elif "text" in section:
+            out.append(section["text"])
+        out.append("")
+    return "\n".join(out).rstrip() + "\n"
+
+
+_HTML_STYLE = (
+    "body{font-family:system-ui,sans-serif;max-width:60rem;margin:2rem auto;padding:0 1rem;color:#222}"
+    "h1{background:#2196f3;color:#fff;padding:.5rem 1rem}h2{color:#0066cc;border-bottom:1px solid #ccc}"
+    "pre{background:#f5f5f5;padding:.5rem;overflow:auto}table{border-collapse:collapse}"
+    "td,th{border:1px solid #ccc;padding:.25rem .5rem;text-align:left}.desc{font-style:italic;color:#3c3c3c}"
+)
+# The edge CSP (default-src 'self') blocks inline styles; HTML reports send their own
+# policy that allows exactly this stylesheet by hash and nothing else.
+HTML_CSP = "default-src 'none'; style-src 'sha256-%s'; frame-ancestors 'none'" % (
+    base64.b64encode(hashlib.sha256(_HTML_STYLE.encode("utf-8")).digest()).decode("ascii"))
+
+
+def render_html(report: Report) -> str:
+    e = html.escape
+    out = ["<!DOCTYPE html>", "<html><head><meta charset=\"utf-8\">",
+           f"<title>{e(report.title)}: {e(report.project_name)}</title>",
+           f"<style>{_HTML_STYLE}</style></head><body>",
+           f"<h1>{e(report.title)}: {e(report.project_name)}</h1>"]
+    for section in report.sections:
+        out.append(f"<h2 id=\"{section['id']}\">{e(section['title'])}</h2>")
+        sid = section["id"]
+        if sid == "configuration":
+            out.append("<ul>")
+            out += [f"<li><b>{e(item['key'])}</b>: {e(PDFGenerator._summarize(item['value']))}</li>"
+                    for item in section["items"]]
+            out.append("</ul>")
+        elif sid == "structure":
+            lines = list(section["lines"])
+            if section["omitted"]:
+                lines.append(f"... {section['omitted']} more lines")
+            out.append("<pre>" + e("\n".join(lines)) + "</pre>")
+        elif sid == "dependencies":
+            out.append("<ul>" + "".join(f"<li><code>{e(line)}</code></li>" for line in section["lines"]) + "</ul>")
+        elif sid == "ports_scripts":
+            out.append("<table><tr>" + "".join(f"<th>{e(c)}</th>" for c in section["columns"]) + "</tr>")
+            out += [f"<tr><td>{e(c)}</td><td><code>{e(cmd)}</code></td><td>{e(p)}</td></tr>"
+                    for c, cmd, p in section["rows"]]
+            out.append("</table>")
+        elif sid == "next_steps":
+            for step in section["lines"]:
+                head, *commands = step.split("\n")
+                out.append(f"<p>{e(head)}</p>")
+                if commands:
+                    out.append("<pre>" + e("\n".join(c.strip() for c in commands)) + "</pre>")
+        elif "lines" in section:
+            out.append("<pre>" + e("\n".join(section["lines"])) + "</pre>")
+        elif "text" in section:
+            out.append(f"<p class=\"desc\">{e(section['text'])}</p>")
+    out.append("</body></html>")
+    return "\n".join(out) + "\n"
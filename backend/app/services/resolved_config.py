@@ -0,0 +1,121 @@
+# backend/app/services/resolved_config.py
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterator
+
+from .frameworks.aliases import NEXT_BACKENDS, normalize_backend, normalize_frontend
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation (nested config mappings such as custom_files entries)."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("resolved config values are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: lists become tuples, dicts FrozenDicts, sets frozensets."""
+    if isinstance(value, Mapping):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of freeze: plain, mutable dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(thaw(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ResolvedConfig(Mapping):
+    """
+    A project config normalized once per request. It reads like the raw config dict
+    (a read-only Mapping over a deep-frozen copy, so the digest always matches it), so
+    templates and generators keep using config.get(...), and also carries the resolved
+    framework ids, folder names, slug, the Next.js fullstack flag and a stable digest
+    that caches can key on.
+    """
+
+    raw: Mapping
+    backend_id: str
+    frontend_id: str
+    backend_folder: str
+    frontend_folder: str
+    slug: str
+    is_next_fullstack: bool
+    digest: str
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResolvedConfig):
+            return self.digest == other.digest
+        return Mapping.__eq__(self, other)
+
+    def __reduce__(self):
+        # MappingProxyType does not pickle; rebuild from a plain dict (process pools)
+        return (resolve_config, (self.to_dict(),))
+
+    def to_dict(self) -> dict:
+        """A plain, mutable deep copy of the config."""
+        return thaw(self.raw)
+
+
+def config_digest(config: Mapping) -> str:
+    """sha256 over the canonical JSON form of a config (key order does not matter)."""
+    blob = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def resolve_config(config: Any) -> ResolvedConfig:
+    """
+    Build a ResolvedConfig from a ProjectConfig model or a plain dict.
+    Already-resolved configs are returned as-is, so every layer can call this cheaply.
+    """
+    if isinstance(config, ResolvedConfig):
+        return config
+    if hasattr(config, "model_dump") and not isinstance(config, Mapping):
+        config = config.model_dump()
+    raw = freeze(config or {})
+    backend_id = normalize_backend(raw.get("backend_framework"))
+    frontend_id = normalize_frontend(raw.get("frontend_framework"))
+    return ResolvedConfig(
+        raw=MappingProxyType(dict(raw)),
+        backend_id=backend_id,
+        frontend_id=frontend_id,
+        backend_folder=raw.get("backend_folder_name", "backend"),
+        frontend_folder=raw.get("frontend_folder_name", "frontend"),
+        slug=str(raw.get("project_name") or "project").lower().replace(" ", "-"),
+        is_next_fullstack=backend_id in NEXT_BACKENDS and frontend_id == "nextjs",
+        digest=config_digest(raw),
+    )
@@ -1,5 +1,10 @@
 # backend/app/services/script_generator.py
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+
+from .resolved_config import resolve_config
+
+if TYPE_CHECKING:
+    from .output_sinks import OutputSink
 
 
 class ScriptGenerator:
@@ -9,35 +14,55 @@ class ScriptGenerator:
     """
     
     @staticmethod
-    def generate_setup_scripts(config: Dict) -> Dict[str, str]:
+    def generate_setup_scripts(config: Dict, sink: Optional["OutputSink"] = None) -> Dict[str, str]:
         """
         Generate all setup scripts based on configuration
-        Returns dict with script names and their contents
+        Returns dict with script names and their contents; when a sink is given
+        the scripts are also written through it (shell scripts executable)
         """
-        scripts = {}
+        config = resolve_config(config)
+        scripts = {name: render(config) for name, render in ScriptGenerator.setup_script_renderers(config).items()}
+        
+        if sink is not None:
+            sink.write_many([
+                (name, content.encode('utf-8'), ScriptGenerator.script_mode(name))
+                for name, content in scripts.items()
+            ])
         
-        # Generate main setup script for Linux/Mac
-        scripts['setup.sh'] = ScriptGenerator._generate_bash_setup(config)
+        return scripts
+    
+    @staticmethod
+    def setup_script_renderers(config: Dict) -> Dict[str, Callable[[Dict], str]]:
+        """
+        Script names for a config and the function that renders each one, without
+        rendering anything (build plans call them lazily)
+        """
+        renderers = {}
         
-        # Generate Windows batch script
-        scripts['setup.bat'] = ScriptGenerator._generate_windows_setup(config)
+        # Main setup script for Linux/Mac and Windows batch script
+        renderers['setup.sh'] = ScriptGenerator._generate_bash_setup
+        renderers['setup.bat'] = ScriptGenerator._generate_windows_setup
         
-        # Generate database setup script if needed
+        # Database setup script if needed
         if config.get('database_type'):
-            scripts['db_setup.sh'] = ScriptGenerator._generate_db_setup(config)
+            renderers['db_setup.sh'] = ScriptGenerator._generate_db_setup
             
-        # Generate Alembic scripts if needed
+        # Alembic scripts if needed
         if config.get('use_alembic'):
-            scripts['alembic_init.sh'] = ScriptGenerator._generate_alembic_setup(config)
+            renderers['alembic_init.sh'] = ScriptGenerator._generate_alembic_setup
             
-        # Generate Docker files if requested
-        scripts['Dockerfile'] = ScriptGenerator._generate_dockerfile(config)
-        scripts['docker-compose.yml'] = ScriptGenerator._generate_docker_compose(config)
-        
-        # Generate README with all commands
-        scripts['INSTALL_GUIDE.md'] = ScriptGenerator._generate_install_guide(config)
+        # Docker files
+        renderers['Dockerfile'] = ScriptGenerator._generate_dockerfile
+        renderers['docker-compose.yml'] = ScriptGenerator._generate_docker_compose
         
-        return scripts
+        # README with all commands
+        renderers['INSTALL_GUIDE.md'] = ScriptGenerator._generate_install_guide
+        return renderers
+    
+    @staticmethod
+    def script_mode(name: str) -> Optional[int]:
+        """File mode for a generated script (shell scripts are executable)"""
+        return 0o755 if name.endswith('.sh') else None
     
     @staticmethod
     def _generate_bash_setup(config: Dict) -> str:
@@ -956,7 +981,7 @@ setup.bat
             guide += f"""#### 1. Clone Repository
 ```bash
 git clone {git_repo}
-cd {config.get('project_name', 'project').lower().replace(' ', '-')}
+cd {resolve_config(config).slug}
 ```
 
 """
@@ -0,0 +1,105 @@
+# backend/app/services/template_cache.py
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+DEFAULT_TEMPLATE_CACHE_SIZE = int(os.getenv("PROJECTMAKER_TEMPLATE_CACHE_SIZE", "1024") or 1024)
+
+_MISSING = object()
+
+
+class TemplateCache:
+    """Bounded, thread-safe LRU of rendered template strings with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE):
+        self.maxsize = max(0, int(maxsize))
+        self._data: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+template_cache = TemplateCache()
+
+
+def _project(config: Optional[Mapping], keys: Tuple[str, ...]) -> Dict:
+    if not config:
+        return {}
+    return {k: config[k] for k in keys if k in config}
+
+
+def cached_template(*keys: str) -> Callable:
+    """
+    Declare the config keys a template reads and cache its output on exactly those values.
+    The template is rendered against a config holding only the declared keys, so an
+    undeclared read falls back to its default instead of leaking into a stale cache entry.
+    Templates without a config argument (e.g. *_requirements) take no keys.
+    """
+    keys = tuple(keys)
+
+    def decorator(fn: Callable[..., str]) -> Callable[..., str]:
+        name = fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if args and isinstance(args[0], Mapping):
+                view = _project(args[0], keys)
+                args = (view,) + args[1:]
+                key = (name, tuple(view.get(k, _MISSING) for k in keys), args[1:], tuple(sorted(kwargs.items())))
+            else:
+                key = (name, (), args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            value = template_cache.get(key)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                template_cache.put(key, value)
+            return value
+
+        wrapper.config_keys = keys
+        return wrapper
+
+    return decorator
@@ -1,11 +1,14 @@
 # backend/app/services/templates.py
 from typing import Dict
 
+from .template_cache import cached_template
+
 
 class BackendTemplates:
     """Templates for backend frameworks"""
     
     @staticmethod
+    @cached_template()
     def fastapi_root_app(config: Dict) -> str:
         return '''"""
 FastAPI root runner for convenience
@@ -18,6 +21,7 @@ if __name__ == "__main__":
 '''
 
     @staticmethod
+    @cached_template("project_name")
     def fastapi_main(config: Dict) -> str:
         project_name = config.get("project_name", "ProjectMaker")
         return f'''from fastapi import FastAPI
@@ -48,6 +52,7 @@ app.include_router(project_routes.router)
 '''
 
     @staticmethod
+    @cached_template("project_name")
     def express_package_json(config: Dict) -> str:
         project_name = config.get("project_name", "express-boilerplate").lower().replace(" ", "-")
         return f'''{{
@@ -70,6 +75,7 @@ app.include_router(project_routes.router)
 }}\n'''
 
     @staticmethod
+    @cached_template()
     def express_app_js(config: Dict) -> str:
         return '''import express from 'express'
 import cors from 'cors'
@@ -86,6 +92,7 @@ export default app
 '''
 
     @staticmethod
+    @cached_template()
     def express_server_js(config: Dict) -> str:
         return '''import dotenv from 'dotenv'
 import app from './app.js'
@@ -100,6 +107,7 @@ app.listen(PORT, () => {
 '''
 
     @staticmethod
+    @cached_template()
     def express_routes_index_js(config: Dict) -> str:
         return '''import { Router } from 'express'
 import { home } from '../controllers/homeController.js'
@@ -110,6 +118,7 @@ export default router
 '''
 
     @staticmethod
+    @cached_template()
     def express_home_controller_js(config: Dict) -> str:
         return '''export const home = (req, res) => {
   res.json({ message: 'Welcome to Express Boilerplate!' })
@@ -117,6 +126,7 @@ export default router
 '''
 
     @staticmethod
+    @cached_template()
     def express_error_handler_js(config: Dict) -> str:
         return '''export const errorHandler = (err, req, res, next) => {
   console.error(err.stack)
@@ -125,16 +135,19 @@ export default router
 '''
 
     @staticmethod
+    @cached_template()
     def express_logger_js(config: Dict) -> str:
         return '''export const log = (msg) => console.log(`[LOG]: ${msg}`)
 '''
 
     @staticmethod
+    @cached_template()
     def express_env_example(config: Dict) -> str:
         return '''PORT=5177
 '''
 
     @staticmethod
+    @cached_template()
     def express_readme(config: Dict) -> str:
         return '''# 🚀 Express.js Boilerplate
 
@@ -160,6 +173,7 @@ npm run dev
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_database(config: Dict) -> str:
         return '''from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
@@ -178,6 +192,7 @@ def get_db():
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_models(config: Dict) -> str:
         return '''from sqlalchemy import Column, Integer, String, Text, DateTime
 from datetime import datetime
@@ -195,6 +210,7 @@ class Project(Base):
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_schemas(config: Dict) -> str:
         return '''from pydantic import BaseModel
 from datetime import datetime
@@ -217,6 +233,7 @@ class ProjectResponse(ProjectBase):
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_crud(config: Dict) -> str:
         return '''from sqlalchemy.orm import Session
 from app import models, schemas
@@ -235,6 +252,7 @@ def get_projects(db: Session):
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_routes(config: Dict) -> str:
         return '''from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
@@ -252,6 +270,7 @@ def list_projects(db: Session = Depends(database.get_db)):
 '''
     
     @staticmethod
+    @cached_template()
     def fastapi_requirements() -> str:
         return '''fastapi==0.119.0
 uvicorn[standard]==0.38.0
@@ -263,6 +282,7 @@ pymysql==1.1.0
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def flask_app(config: Dict) -> str:
         project_name = config.get("project_name", "MyProject")
         return f'''"""
@@ -302,6 +322,7 @@ if __name__ == '__main__':
 '''
     
     @staticmethod
+    @cached_template()
     def flask_config(config: Dict) -> str:
         return '''"""
 Flask configuration
@@ -319,6 +340,7 @@ class Config:
 '''
     
     @staticmethod
+    @cached_template()
     def flask_models(config: Dict) -> str:
         return '''"""
 Flask-SQLAlchemy models
@@ -350,6 +372,7 @@ class Item(db.Model):
 '''
     
     @staticmethod
+    @cached_template()
     def flask_routes(config: Dict) -> str:
         return '''"""
 Flask API routes
@@ -412,6 +435,7 @@ def delete_item(item_id):
 '''
     
     @staticmethod
+    @cached_template()
     def flask_requirements() -> str:
         return '''Flask==3.0.0
 Flask-SQLAlchemy==3.1.1
@@ -421,6 +445,7 @@ pymysql==1.1.0
 '''
     
     @staticmethod
+    @cached_template()
     def django_manage(config: Dict) -> str:
         return '''#!/usr/bin/env python
 """Django's command-line utility for administrative tasks."""
@@ -447,6 +472,7 @@ if __name__ == '__main__':
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def django_settings(config: Dict) -> str:
         project_name = config.get("project_name", "myproject")
         return f'''"""
@@ -525,6 +551,7 @@ CORS_ALLOW_ALL_ORIGINS = True  # Update in production
 '''
     
     @staticmethod
+    @cached_template()
     def django_urls(config: Dict) -> str:
         return '''"""
 URL configuration
@@ -538,6 +565,7 @@ urlpatterns = [
 '''
     
     @staticmethod
+    @cached_template()
     def django_wsgi(config: Dict) -> str:
         return '''"""
 WSGI config
@@ -551,6 +579,7 @@ application = get_wsgi_application()
 '''
     
     @staticmethod
+    @cached_template()
     def django_requirements() -> str:
         return '''Django==5.0
 djangorestframework==3.14.0
@@ -560,6 +589,7 @@ pymysql==1.1.0
 '''
     
     @staticmethod
+    @cached_template()
     def env_example(config: Dict) -> str:
         return '''# Database Configuration
 DATABASE_URL=sqlite:///./app.db
@@ -577,6 +607,7 @@ class FrontendTemplates:
     
     # ---------------- Svelte (Vite) ----------------
     @staticmethod
+    @cached_template()
     def svelte_package_json(config: Dict) -> str:
         return '''{
   "name": "project-maker-frontend",
@@ -599,6 +630,7 @@ class FrontendTemplates:
 '''
 
     @staticmethod
+    @cached_template()
     def tailwind_config(config: Dict, framework: str = "react") -> str:
         content_glob = "./src/**/*.{js,jsx,ts,tsx,html}"
         return f'''/** @type {{import('tailwindcss').Config}} */
@@ -610,6 +642,7 @@ export default {{
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_vite_config(config: Dict) -> str:
         return '''import { defineConfig } from 'vite';
 import { svelte } from '@sveltejs/vite-plugin-svelte';
@@ -621,6 +654,7 @@ export default defineConfig({
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_index_html(config: Dict) -> str:
         return '''<!DOCTYPE html>
 <html lang="en">
@@ -639,6 +673,7 @@ export default defineConfig({
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_main_js(config: Dict) -> str:
         return '''import App from './App.svelte';
 
@@ -647,6 +682,7 @@ export default app;
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_app(config: Dict) -> str:
         return '''<script>
   import { onMount } from 'svelte';
@@ -669,6 +705,7 @@ export default app;
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_app_css(config: Dict) -> str:
         return '''/* Global styles for your application */
 body {
@@ -681,6 +718,7 @@ body {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_lib_api_js(config: Dict) -> str:
         return '''// API utility functions for your application
 const BASE_URL = 'http://localhost:3000/api';
@@ -693,6 +731,7 @@ export async function fetchData(endpoint) {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_lib_utils_js(config: Dict) -> str:
         return '''// Utility functions for common tasks
 export function formatDate(date) {
@@ -702,6 +741,7 @@ export function formatDate(date) {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_home(config: Dict) -> str:
         return '''<script>
   // Home component script section
@@ -718,6 +758,7 @@ export function formatDate(date) {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_explorer(config: Dict) -> str:
         return '''<script>
   // Explorer component script section
@@ -734,6 +775,7 @@ export function formatDate(date) {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_create_file(config: Dict) -> str:
         return '''<script>
   // CreateFile component script section
@@ -750,6 +792,7 @@ export function formatDate(date) {
 '''
 
     @staticmethod
+    @cached_template()
     def svelte_db_designer(config: Dict) -> str:
         return '''<script>
   // DBDesigner component script section
@@ -767,6 +810,7 @@ export function formatDate(date) {
 
     # ---------------- Next.js ----------------
     @staticmethod
+    @cached_template("project_name")
     def nextjs_package_json(config: Dict) -> str:
         project_name = config.get("project_name", "my-app").lower().replace(" ", "-")
         return f'''{{
@@ -787,6 +831,7 @@ export function formatDate(date) {
 }}\n'''
 
     @staticmethod
+    @cached_template("description", "project_name")
     def nextjs_layout(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         return f'''export const metadata = {{
@@ -804,6 +849,7 @@ export default function RootLayout({{ children }}) {{
 '''
 
     @staticmethod
+    @cached_template()
     def nextjs_page(config: Dict) -> str:
         return '''"use client";
 import { useEffect, useState } from 'react'
@@ -826,6 +872,7 @@ export default function Page() {
 '''
 
     @staticmethod
+    @cached_template()
     def nextjs_config(config: Dict) -> str:
         return '''/** @type {import('next').NextConfig} */
 const nextConfig = {
@@ -835,6 +882,7 @@ export default nextConfig
 '''
 
     @staticmethod
+    @cached_template("project_name")
     def react_package_json(config: Dict) -> str:
         project_name = config.get("project_name", "my-app").lower().replace(" ", "-")
         return f'''{{
@@ -867,6 +915,7 @@ export default nextConfig
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def react_index_html(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         return f'''<!DOCTYPE html>
@@ -885,6 +934,7 @@ export default nextConfig
 '''
     
     @staticmethod
+    @cached_template("description", "project_name")
     def react_app(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         description = config.get("description", "Built with React")
@@ -935,6 +985,7 @@ export default App
         return template.replace('__PROJECT_NAME__', project_name).replace('__DESCRIPTION__', description)
     
     @staticmethod
+    @cached_template()
     def react_main(config: Dict) -> str:
         return '''import React from 'react'
 import ReactDOM from 'react-dom/client'
@@ -949,6 +1000,7 @@ ReactDOM.createRoot(document.getElementById('root')).render(
 '''
     
     @staticmethod
+    @cached_template()
     def react_css(config: Dict) -> str:
         return '''@tailwind base;
 @tailwind components;
@@ -962,6 +1014,7 @@ body { @apply min-h-screen bg-gradient-to-br from-indigo-400 to-purple-600 antia
 '''
     
     @staticmethod
+    @cached_template()
     def react_navbar(config: Dict) -> str:
         return '''/** @jsxImportSource @emotion/react */
 import styled from '@emotion/styled'
@@ -990,6 +1043,7 @@ export default function Navbar() {
 '''
 
     @staticmethod
+    @cached_template()
     def react_hero(config: Dict) -> str:
         return '''import { motion } from 'framer-motion'
 
@@ -1013,6 +1067,7 @@ export default function Hero({ title, subtitle }) {
 '''
 
     @staticmethod
+    @cached_template()
     def react_use_lenis(config: Dict) -> str:
         return '''import { useEffect } from 'react'
 import Lenis from 'lenis'
@@ -1029,6 +1084,7 @@ export default function useLenis() {
 '''
 
     @staticmethod
+    @cached_template()
     def react_theme(config: Dict) -> str:
         return '''const theme = {
   colors: {
@@ -1042,6 +1098,7 @@ export default theme
 '''
 
     @staticmethod
+    @cached_template()
     def react_footer(config: Dict) -> str:
         return '''export default function Footer() {
   return (
@@ -1053,6 +1110,7 @@ export default theme
 '''
 
     @staticmethod
+    @cached_template()
     def react_readme(config: Dict) -> str:
         return '''# ⚛️ React Boilerplate
 
@@ -1096,6 +1154,7 @@ Built with ❤️ for the developer community by SwagCode4U.
 '''
 
     @staticmethod
+    @cached_template("project_name")
     def vue_package_json(config: Dict) -> str:
         project_name = config.get("project_name", "my-app").lower().replace(" ", "-")
         return f'''{{
@@ -1119,6 +1178,7 @@ Built with ❤️ for the developer community by SwagCode4U.
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def vue_index_html(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         return f'''<!DOCTYPE html>
@@ -1137,6 +1197,7 @@ Built with ❤️ for the developer community by SwagCode4U.
 '''
     
     @staticmethod
+    @cached_template("description", "project_name")
     def vue_app(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         description = config.get("description", "Built with Vue")
@@ -1190,6 +1251,7 @@ export default {{
 '''
     
     @staticmethod
+    @cached_template()
     def vue_main(config: Dict) -> str:
         return '''import { createApp } from 'vue'
 import App from './App.vue'
@@ -1198,6 +1260,7 @@ createApp(App).mount('#app')
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def angular_package_json(config: Dict) -> str:
         project_name = config.get("project_name", "my-app").lower().replace(" ", "-")
         return f'''{{
@@ -1232,6 +1295,7 @@ createApp(App).mount('#app')
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def angular_json(config: Dict) -> str:
         project_name = config.get("project_name", "my-app").lower().replace(" ", "-")
         return f'''{{
@@ -1264,6 +1328,7 @@ createApp(App).mount('#app')
 '''
     
     @staticmethod
+    @cached_template("project_name")
     def angular_index_html(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         return f'''<!doctype html>
@@ -1281,6 +1346,7 @@ createApp(App).mount('#app')
 '''
     
     @staticmethod
+    @cached_template()
     def angular_main(config: Dict) -> str:
         return '''import { platformBrowserDynamic } from '@angular/platform-browser-dynamic';
 import { AppModule } from './app/app.module';
@@ -1290,6 +1356,7 @@ platformBrowserDynamic().bootstrapModule(AppModule)
 '''
 
     @staticmethod
+    @cached_template()
     def angular_app_module(config: Dict) -> str:
         return '''import { NgModule } from '@angular/core';
 import { BrowserModule } from '@angular/platform-browser';
@@ -1310,6 +1377,7 @@ export class AppModule {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_app_routing_module(config: Dict) -> str:
         return '''import { NgModule } from '@angular/core';
 import { RouterModule, Routes } from '@angular/router';
@@ -1329,6 +1397,7 @@ export class AppRoutingModule {}
 '''
 
     @staticmethod
+    @cached_template("project_name")
     def angular_component(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         return f'''import {{ Component }} from '@angular/core';
@@ -1349,6 +1418,7 @@ export class AppComponent {{
 '''
 
     @staticmethod
+    @cached_template()
     def angular_header_component_ts(config: Dict) -> str:
         return '''import { Component } from '@angular/core';
 
@@ -1360,6 +1430,7 @@ export class HeaderComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_header_component_html(config: Dict) -> str:
         return '''<header class="p-4 shadow bg-white">
   <div class="max-w-5xl mx-auto flex items-center justify-between">
@@ -1374,6 +1445,7 @@ export class HeaderComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_footer_component_ts(config: Dict) -> str:
         return '''import { Component } from '@angular/core';
 
@@ -1385,6 +1457,7 @@ export class FooterComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_footer_component_html(config: Dict) -> str:
         return '''<footer class="text-center p-4 text-gray-500">
   Built with ❤️ for the developer community by SwagCode4U.
@@ -1392,6 +1465,7 @@ export class FooterComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_home_component_ts(config: Dict) -> str:
         return '''import { Component } from '@angular/core';
 
@@ -1400,6 +1474,7 @@ export class HomeComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_home_component_html(config: Dict) -> str:
         return '''<section class="text-center">
   <h1 class="text-4xl font-bold text-blue-600">⚡ Angular Boilerplate</h1>
@@ -1408,6 +1483,7 @@ export class HomeComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_about_component_ts(config: Dict) -> str:
         return '''import { Component } from '@angular/core';
 
@@ -1416,6 +1492,7 @@ export class AboutComponent {}
 '''
 
     @staticmethod
+    @cached_template()
     def angular_about_component_html(config: Dict) -> str:
         return '''<section class="text-center">
   <h1 class="text-3xl font-semibold text-purple-600">About</h1>
@@ -1424,6 +1501,7 @@ export class AboutComponent {}
 '''
 
     @staticmethod
+    @cached_template("description", "project_name")
     def plain_html(config: Dict) -> str:
         project_name = config.get("project_name", "My App")
         description = config.get("description", "A simple web application")
@@ -1455,6 +1533,7 @@ export class AboutComponent {}
 '''
     
     @staticmethod
+    @cached_template()
     def plain_css(config: Dict) -> str:
         return '''* {
     margin: 0;
@@ -1514,6 +1593,7 @@ code {
 '''
     
     @staticmethod
+    @cached_template()
     def plain_js(config: Dict) -> str:
         return '''// Check backend connection
 fetch('http://localhost:8000/')
@@ -0,0 +1,111 @@
+# backend/app/services/tree_builder.py
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+DIRECTORY = "directory"
+FILE = "file"
+
+
+class _Node:
+    __slots__ = ("kind", "children")
+
+    def __init__(self, kind: str, children: Optional[Dict[str, "_Node"]] = None):
+        self.kind = kind
+        # None for files and for directories that never received children (rendered without a list)
+        self.children = children
+
+
+class TreeBuilder:
+    """
+    Path trie for preview trees. Framework subtrees, "a/b/c" style custom entries and
+    root files are merged into one nested tree: every path appears once, siblings keep
+    the order in which they were first added, and each insert costs O(depth).
+    A path that is a file in one source and a directory in another becomes a directory.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._root = _Node(DIRECTORY, {})
+
+    @staticmethod
+    def _split(path: Union[str, Sequence[str]]) -> list:
+        if isinstance(path, str):
+            return [p for p in path.replace("\\", "/").split("/") if p]
+        return [str(p) for p in path if p]
+
+    @staticmethod
+    def _child(parent: _Node, name: str, kind: str, with_children: bool) -> _Node:
+        if parent.children is None:
+            parent.children = {}
+        node = parent.children.get(name)
+        if node is None:
+            node = parent.children[name] = _Node(kind, {} if with_children else None)
+        else:
+            if kind == DIRECTORY:
+                node.kind = DIRECTORY
+            if with_children and node.children is None:
+                node.children = {}
+        return node
+
+    def _dir(self, path: Union[str, Sequence[str]]) -> _Node:
+        node = self._root
+        for part in self._split(path):
+            node = self._child(node, part, DIRECTORY, True)
+        return node
+
+    def add(self, path: Union[str, Sequence[str]], kind: str = FILE) -> None:
+        """Insert one path, creating missing parent directories."""
+        parts = self._split(path)
+        if not parts:
+            return
+        node = self._root
+        for part in parts[:-1]:
+            # Fast path: an existing directory that already has a children map
+            child = node.children.get(part) if node.children is not None else None
+            if child is None or child.children is None or child.kind != DIRECTORY:
+                child = self._child(node, part, DIRECTORY, True)
+            node = child
+        self._child(node, parts[-1], kind, kind == DIRECTORY)
+
+    def add_all(self, paths: Iterable[Union[str, Sequence[str]]], kind: str = FILE) -> None:
+        for path in paths:
+            self.add(path, kind)
+
+    def merge(self, tree: Optional[Dict], under: Union[str, Sequence[str]] = ()) -> None:
+        """
+        Merge a nested {"name", "type", "children"} node (and its subtree) below `under`.
+        A name like "com/example" is a path: it nests like add() does, so it merges with
+        the same folders coming from other sources.
+        """
+        if not tree:
+            return
+        stack = [(self._dir(under), tree)]
+        while stack:
+            parent, src = stack.pop()
+            children = src.get("children")
+            kind = DIRECTORY if children is not None or src.get("type") == DIRECTORY else FILE
+            name = str(src.get("name", ""))
+            parts = self._split(name) or [name]
+            for part in parts[:-1]:
+                parent = self._child(parent, part, DIRECTORY, True)
+            node = self._child(parent, parts[-1], kind, children is not None)
+            if children:
+                # Pushed in reverse so siblings are inserted in source order
+                stack.extend((node, c) for c in reversed(children))
+
+    def merge_children(self, tree: Optional[Dict]) -> None:
+        """Merge the children of a tree directly into the root (e.g. a whole-project tree)."""
+        for child in (tree or {}).get("children") or ():
+            self.merge(child)
+
+    def to_tree(self) -> Dict:
+        out = {"name": self.name, "type": DIRECTORY, "children": []}
+        stack = [(out, self._root)]
+        while stack:
+            dst, node = stack.pop()
+            for name, child in node.children.items():
+                item = {"name": name, "type": child.kind}
+                if child.children is not None:
+                    item["children"] = []
+                    stack.append((item, child))
+                dst["children"].append(item)
+        return out
@@ -0,0 +1,63 @@
+# backend/app/services/tree_codec.py
+import base64
+from typing import Dict, List
+
+from .json_codec import dumps  # noqa: F401  (re-exported for the preview routes)
+
+TREE_FORMATS = ("tree", "columnar")
+
+
+def encode_columnar(tree: Dict) -> Dict:
+    """
+    Flatten a nested preview tree into parallel columns, in pre-order:
+    names[i], parents[i] (index of the parent node, -1 for the root) and a
+    base64 bitmap where bit i (LSB first) marks node i as a directory.
+    A parent always precedes its children, so a client rebuilds the tree in one pass.
+    Directories that carry no children list at all are listed in "bare".
+    """
+    names: List[str] = []
+    parents: List[int] = []
+    bare: List[int] = []
+    bits = bytearray()
+
+    stack = [(tree, -1)]
+    while stack:
+        node, parent = stack.pop()
+        i = len(names)
+        names.append(str(node.get("name", "")))
+        parents.append(parent)
+        if i % 8 == 0:
+            bits.append(0)
+        children = node.get("children")
+        if children is not None or node.get("type") == "directory":
+            bits[-1] |= 1 << (i % 8)
+            if children is None:
+                bare.append(i)
+        if children:
+            stack.extend((child, i) for child in reversed(children))
+
+    out = {
+        "format": "columnar",
+        "names": names,
+        "parents": parents,
+        "dirs": base64.b64encode(bytes(bits)).decode("ascii"),
+    }
+    if bare:
+        out["bare"] = bare
+    return out
+
+
+def decode_columnar(data: Dict) -> Dict:
+    """Inverse of encode_columnar (reference implementation for clients and tooling)."""
+    bits = base64.b64decode(data["dirs"])
+    bare = set(data.get("bare") or ())
+    nodes: List[Dict] = []
+    for i, (name, parent) in enumerate(zip(data["names"], data["parents"])):
+        is_dir = bits[i // 8] >> (i % 8) & 1
+        node = {"name": name, "type": "directory" if is_dir else "file"}
+        if is_dir and i not in bare:
+            node["children"] = []
+        nodes.append(node)
+        if parent >= 0:
+            nodes[parent]["children"].append(node)
+    return nodes[0] if nodes else {}
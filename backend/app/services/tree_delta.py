@@ -0,0 +1,158 @@
+# backend/app/services/tree_delta.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DELTA_CACHE_SIZE = int(os.getenv("PROJECTMAKER_PREVIEW_DELTA_CACHE", "512") or 512)
+
+Path = Tuple[str, ...]
+
+
+def payload_hash(tree: Dict, requirements: str) -> str:
+    """Content hash of a preview payload (tree + requirements); the client echoes it back as base_hash."""
+    blob = json.dumps([tree, requirements], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+class PreviewStore:
+    """Bounded LRU of recently served preview payloads, keyed by payload hash."""
+
+    def __init__(self, maxsize: int = DEFAULT_DELTA_CACHE_SIZE):
+        self.maxsize = max(1, maxsize)
+        self._data: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def remember(self, key: str, payload: Dict) -> None:
+        with self._lock:
+            self._data[key] = payload
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            payload = self._data.get(key)
+            if payload is not None:
+                self._data.move_to_end(key)
+            return payload
+
+
+preview_store = PreviewStore()
+
+
+class _Ambiguous(Exception):
+    """Tree cannot be patched by path (duplicate sibling names)."""
+
+
+def _index(tree: Dict) -> Dict[Path, Tuple[Dict, int]]:
+    out: Dict[Path, Tuple[Dict, int]] = {}
+
+    def walk(prefix: Path, node: Dict) -> None:
+        for i, child in enumerate(node.get("children") or ()):
+            p = prefix + (str(child.get("name", "")),)
+            if p in out:
+                raise _Ambiguous(p)
+            out[p] = (child, i)
+            if child.get("children") is not None:
+                walk(p, child)
+
+    walk((), tree)
+    return out
+
+
+def _signature(node: Dict) -> frozenset:
+    """Shape of a subtree relative to its root (names and types), used to spot renamed folders."""
+    sig = set()
+
+    def walk(prefix: Path, n: Dict) -> None:
+        for child in n.get("children") or ():
+            p = prefix + (str(child.get("name", "")),)
+            sig.add((p, child.get("type")))
+            walk(p, child)
+
+    walk((), node)
+    return frozenset(sig)
+
+
+def _count(node: Dict) -> int:
+    return 1 + sum(_count(c) for c in node.get("children") or ())
+
+
+def diff_trees(old: Dict, new: Dict) -> Optional[Dict]:
+    """
+    Structural patch from old to new: top-level removed paths, renamed folders and
+    added subtrees (with their index in the parent). Apply removals, then renames,
+    then additions in order. Returns None when a patch would be ambiguous or not
+    smaller than the tree itself.
+    """
+    try:
+        old_idx, new_idx = _index(old), _index(new)
+    except _Ambiguous:
+        return None
+
+    def kind(idx, p):
+        return idx[p][0].get("type")
+
+    gone = {p for p in old_idx if p not in new_idx or kind(old_idx, p) != kind(new_idx, p)}
+    born = {p for p in new_idx if p not in old_idx or kind(old_idx, p) != kind(new_idx, p)}
+    top_gone = [p for p in old_idx if p in gone and p[:-1] not in gone]
+    top_born = [p for p in new_idx if p in born and p[:-1] not in born]
+
+    # Surviving siblings must keep their relative order, otherwise index-based inserts are wrong
+    def kept(idx, changed) -> Dict[Path, List[str]]:
+        order: Dict[Path, List[str]] = {}
+        for p in idx:
+            if p not in changed:
+                order.setdefault(p[:-1], []).append(p[-1])
+        return order
+
+    if kept(old_idx, gone) != kept(new_idx, born):
+        return None
+
+    renamed: List[Dict] = []
+    used = set()
+    born_dirs = {p: _signature(new_idx[p][0]) for p in top_born if new_idx[p][0].get("children") is not None}
+    for p in top_gone:
+        node = old_idx[p][0]
+        if node.get("children") is None:
+            continue
+        sig = _signature(node)
+        for q, qsig in born_dirs.items():
+            if q not in used and q[:-1] == p[:-1] and qsig == sig:
+                used.add(q)
+                renamed.append({"from": list(p), "to": q[-1], "index": new_idx[q][1]})
+                break
+    renamed_from = {tuple(r["from"]) for r in renamed}
+
+    removed = [list(p) for p in top_gone if p not in renamed_from]
+    added = [
+        {"parent": list(q[:-1]), "index": new_idx[q][1], "node": new_idx[q][0]}
+        for q in top_born if q not in used
+    ]
+    patch_size = len(removed) + len(renamed) + sum(_count(a["node"]) for a in added)
+    if patch_size >= _count(new):
+        return None
+    out = {"removed": removed, "renamed": renamed, "added": added}
+    if old.get("name") != new.get("name"):
+        out["root"] = new.get("name")
+    return out
+
+
+def preview_delta(base_hash: str, payload: Dict) -> Optional[Dict]:
+    """Delta response against a previously served payload, or None to fall back to the full tree."""
+    base = preview_store.get(base_hash)
+    if base is None:
+        return None
+    if base_hash == payload["hash"]:
+        patch = {"removed": [], "renamed": [], "added": []}
+    else:
+        patch = diff_trees(base["tree"], payload["tree"])
+        if patch is None:
+            return None
+    out = {"delta": True, "base_hash": base_hash, "hash": payload["hash"], **patch}
+    if base.get("requirements") != payload.get("requirements"):
+        out["requirements"] = payload.get("requirements")
+    return out
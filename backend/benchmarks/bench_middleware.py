@@ -0,0 +1,147 @@
+# backend/benchmarks/bench_middleware.py
+"""
+Latency / throughput of the middleware stack: the previous @app.middleware("http")
+(BaseHTTPMiddleware) security-header + logging pair and SlowAPIMiddleware, versus the
+pure ASGI EdgeMiddleware (sampled, enqueued JSON request log) + SlowAPIASGIMiddleware
+now used by app.main. Both log every request; the new stack writes to os.devnull.
+
+Runs in-process over httpx's ASGI transport, so it measures framework overhead,
+not the network. Usage (from backend/):
+
+    python -m benchmarks.bench_middleware --requests 2000 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from loguru import logger  # noqa: E402
+from slowapi import Limiter  # noqa: E402
+from slowapi.util import get_remote_address  # noqa: E402
+
+from app.middleware import EdgeMiddleware  # noqa: E402
+from app.request_log import RequestLog  # noqa: E402
+from app.routes import generator_routes  # noqa: E402
+
+PREVIEW_BODY = {
+    "project_name": "Bench",
+    "description": "benchmark project",
+    "backend_framework": "fastapi",
+    "frontend_framework": "react",
+    "custom_folders": ["docs", "tests", "scripts/ci", "docs/api"],
+}
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"], allow_methods=["*"], allow_headers=["*"])
+    app.include_router(generator_routes.router)
+
+    @app.get("/health")
+    def health():
+        return {"status": "healthy"}
+
+    app.state.limiter = Limiter(key_func=get_remote_address, default_limits=["1000000/minute"])
+    return app
+
+
+def legacy_app() -> FastAPI:
+    """The stack as it was: two BaseHTTPMiddleware decorators + SlowAPIMiddleware."""
+    from slowapi.middleware import SlowAPIMiddleware
+
+    app = _base_app()
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        response.headers.setdefault("X-Content-Type-Options", "nosniff")
+        response.headers.setdefault("X-Frame-Options", "DENY")
+        response.headers.setdefault("X-XSS-Protection", "1; mode=block")
+        response.headers.setdefault("Content-Security-Policy", "default-src 'self' data: blob:")
+        return response
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        logger.info(f"Request: {request.method} {request.url}")
+        response = await call_next(request)
+        logger.info(f"Response: {response.status_code} {request.method} {request.url}")
+        return response
+
+    app.add_middleware(SlowAPIMiddleware)
+    return app
+
+
+def asgi_app() -> FastAPI:
+    """The current stack: one pure ASGI edge layer (enqueued JSON request log) + SlowAPIASGIMiddleware."""
+    from slowapi.middleware import SlowAPIASGIMiddleware
+
+    app = _base_app()
+    app.add_middleware(EdgeMiddleware, request_log=RequestLog(path=os.devnull, sampling="*=1"))
+    app.add_middleware(SlowAPIASGIMiddleware)
+    return app
+
+
+async def _run(app: FastAPI, method: str, path: str, body, requests: int, concurrency: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one() -> float:
+            t0 = time.perf_counter()
+            r = await client.request(method, path, json=body)
+            assert r.status_code == 200, r.text
+            return time.perf_counter() - t0
+
+        for _ in range(min(50, requests)):  # warm-up (caches, lazy imports)
+            await one()
+
+        # Sequential latency
+        lat = [await one() for _ in range(requests)]
+
+        # Throughput under concurrency
+        sem = asyncio.Semaphore(concurrency)
+
+        async def bounded():
+            async with sem:
+                await one()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(bounded() for _ in range(requests)))
+        rps = requests / (time.perf_counter() - t0)
+
+    lat.sort()
+    return {
+        "p50_ms": statistics.median(lat) * 1000,
+        "p95_ms": lat[int(len(lat) * 0.95) - 1] * 1000,
+        "rps": rps,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    # Keep log formatting (part of the cost) but drop the I/O
+    logger.remove()
+    logger.add(lambda _msg: None, level="INFO")
+
+    targets = [("GET", "/health", None), ("POST", "/api/projects/preview", PREVIEW_BODY)]
+    print(f"{'endpoint':<28}{'stack':<8}{'p50 ms':>9}{'p95 ms':>9}{'req/s':>10}")
+    for method, path, body in targets:
+        results = {}
+        for name, factory in (("legacy", legacy_app), ("asgi", asgi_app)):
+            results[name] = r = asyncio.run(_run(factory(), method, path, body, args.requests, args.concurrency))
+            print(f"{method + ' ' + path:<28}{name:<8}{r['p50_ms']:>9.3f}{r['p95_ms']:>9.3f}{r['rps']:>10.0f}")
+        gain = results["asgi"]["rps"] / results["legacy"]["rps"] - 1
+        print(f"{'':<28}{'delta':<8}{'':>18}{gain:>+10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# backend/benchmarks/bench_pdf_tree.py
+"""
+PDF "Project Structure" layout on large trees: the previous one-cell-per-line ASCII
+tree versus pdf_tree_layout.render_tree (multi-column, depth/size-limited, page budget).
+Also renders the full summary PDF for a config with that many custom folders.
+
+Shapes: wide (few directories with thousands of files), deep (long nested chains
+with long names) and mixed (random). Usage (from backend/):
+
+    python -m benchmarks.bench_pdf_tree --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpdf import FPDF  # noqa: E402
+
+from app.services.pdf_generator import PDFGenerator  # noqa: E402
+from app.services.pdf_tree_layout import render_tree  # noqa: E402
+
+
+def wide(n: int) -> dict:
+    dirs = max(1, n // 1000)
+    per = n // dirs
+    return {"name": "proj", "type": "directory", "children": [
+        {"name": f"pkg{d}", "type": "directory",
+         "children": [{"name": f"module_{d}_{i}.py", "type": "file"} for i in range(per)]}
+        for d in range(dirs)]}
+
+
+def deep(n: int, depth: int = 40) -> dict:
+    root = {"name": "proj", "type": "directory", "children": []}
+    made = 0
+    while made < n:
+        node = root
+        for level in range(depth):
+            child = {"name": f"very_long_directory_name_level_{level}_{made}", "type": "directory", "children": []}
+            node["children"].append(child)
+            node = child
+            made += 1
+        node["children"].append({"name": "leaf_with_an_unusually_long_file_name_component.tsx", "type": "file"})
+        made += 1
+    return root
+
+
+def mixed(n: int, seed: int = 7) -> dict:
+    rnd = random.Random(seed)
+    root = {"name": "proj", "type": "directory", "children": []}
+    dirs = [root]
+    for i in range(n):
+        parent = rnd.choice(dirs)
+        if rnd.random() < 0.2:
+            node = {"name": f"dir{i}", "type": "directory", "children": []}
+            dirs.append(node)
+        else:
+            node = {"name": f"file{i}.txt", "type": "file"}
+        parent["children"].append(node)
+    return root
+
+
+def _pdf() -> FPDF:
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    return pdf
+
+
+def legacy(tree: dict):
+    pdf = _pdf()
+    pdf.set_font("Helvetica", size=11)
+    for line in PDFGenerator._format_tree_lines(tree):
+        pdf.cell(0, 6, txt=line.encode("latin-1", "replace").decode("latin-1"), ln=True)
+    return pdf, len(bytes(pdf.output()))
+
+
+def scalable(tree: dict):
+    pdf = _pdf()
+    render_tree(pdf, tree)
+    return pdf, len(bytes(pdf.output()))
+
+
+def full_summary(n: int):
+    folders = [f"custom/area{i % 50}/folder_{i}" for i in range(n)]
+    config = {"project_name": "Bench", "description": "x" * 50000, "backend_framework": "fastapi",
+              "frontend_framework": "react", "custom_folders": folders}
+    from app.services.project_generator import ProjectGenerator
+    tree = ProjectGenerator().generate_project_tree(config)
+    t0 = time.perf_counter()
+    data = PDFGenerator.generate_summary_pdf(config, tree, "", deterministic=True)
+    return time.perf_counter() - t0, data.count(b"/Type /Page\n") or data.count(b"/Type /Page"), len(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the new layout")
+    args = parser.parse_args()
+
+    print(f"{'shape':<8}{'nodes':>8}  {'layout':<9}{'ms':>10}{'us/node':>10}{'pages':>7}{'KiB':>9}")
+    for n in args.sizes:
+        for shape in (wide, deep, mixed):
+            tree = shape(n)
+            runs = [("scalable", scalable)] if args.skip_legacy else [("legacy", legacy), ("scalable", scalable)]
+            for name, fn in runs:
+                t0 = time.perf_counter()
+                pdf, size = fn(tree)
+                dt = time.perf_counter() - t0
+                print(f"{shape.__name__:<8}{n:>8}  {name:<9}{dt * 1000:>10.1f}{dt / n * 1e6:>10.2f}{pdf.pages_count:>7}{size / 1024:>9.0f}")
+        dt, pages, size = full_summary(n)
+        print(f"{'summary':<8}{n:>8}  {'scalable':<9}{dt * 1000:>10.1f}{dt / n * 1e6:>10.2f}{pages:>7}{size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
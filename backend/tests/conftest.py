@@ -0,0 +1,22 @@
+# backend/tests/conftest.py
+import os
+import sys
+
+# Tests import the app the way the server does: with backend/ on the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Generator routes only; app.main also connects to the configured database."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routes import generator_routes
+
+    app = FastAPI()
+    app.include_router(generator_routes.router)
+    with TestClient(app) as c:
+        yield c
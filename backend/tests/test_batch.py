@@ -0,0 +1,25 @@
+# backend/tests/test_batch.py
+import os
+
+from app.services.project_generator import DEFAULT_OUTPUT_DIR, ProjectGenerator
+
+CONFIG = {"project_name": "demo", "description": "d", "initialize_git": False}
+
+
+def test_default_target():
+    assert ProjectGenerator().default_target(CONFIG) == os.path.join(DEFAULT_OUTPUT_DIR, "demo")
+    assert ProjectGenerator("/srv/out").default_target(CONFIG) == os.path.join("/srv/out", "demo")
+
+
+def test_duplicate_targets_are_rejected_before_building(client):
+    explicit = dict(CONFIG, target_directory=os.path.join(DEFAULT_OUTPUT_DIR, "demo", "."))
+    resp = client.post("/api/projects/build-batch", json=[CONFIG, explicit])
+    assert resp.status_code == 400
+    assert resp.json()["detail"]["index"] == 1
+    assert "Duplicate target directory" in resp.json()["detail"]["errors"]
+
+
+def test_invalid_batches(client):
+    assert client.post("/api/projects/build-batch", json=[]).status_code == 400
+    assert client.post("/api/projects/build-batch", json=[{"description": "no name"}]).status_code == 422
+    assert client.post("/api/projects/build-batch", json=[CONFIG], params={"mode": "other"}).status_code == 400
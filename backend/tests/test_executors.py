@@ -0,0 +1,86 @@
+# backend/tests/test_executors.py
+import asyncio
+import os
+import threading
+
+import pytest
+
+from app.services.executors import ExecutorBusy, WorkloadExecutor
+from app.services.metrics import builds_total, registry
+
+
+@pytest.fixture
+def ex():
+    ex = WorkloadExecutor("test", processes=False, max_workers=1, max_queue=2)
+    yield ex
+    ex.shutdown()
+
+
+def test_queue_limit_rejects_then_recovers(ex):
+    gate = threading.Event()
+    futures = [ex.submit(gate.wait, 5) for _ in range(3)]  # one running, two queued
+    assert ex.stats()["running"] == 1 and ex.stats()["queued"] == 2
+    with pytest.raises(ExecutorBusy):
+        ex.submit(gate.wait, 5)
+    unbounded = ex.submit(gate.wait, 5, bounded=False)
+    gate.set()
+    for fut in futures + [unbounded]:
+        assert fut.result(5) is True
+    stats = ex.stats()
+    assert stats["rejected"] == 1 and stats["completed"] == 4 and stats["queued"] == 0
+    assert ex.submit(lambda: "ok").result(5) == "ok"
+
+
+def test_same_key_shares_one_task(ex):
+    gate = threading.Event()
+    seen = []
+    first = ex.submit(gate.wait, 5, key="k", on_result=seen.append)
+    second = ex.submit(gate.wait, 5, key="k", on_result=seen.append)
+    assert first is second
+    gate.set()
+    assert first.result(5) is True
+    assert seen == [True]
+    assert ex.stats()["coalesced"] == 1 and ex.stats()["completed"] == 1
+
+
+def test_failures_are_counted_and_raised(ex):
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        ex.submit(boom).result(5)
+    assert ex.stats()["failed"] == 1
+
+
+def test_cancelled_caller_does_not_cancel_shared_task(ex):
+    gate = threading.Event()
+
+    async def main():
+        waiter = asyncio.ensure_future(ex.run(gate.wait, 5, key="k"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        other = asyncio.ensure_future(ex.run(gate.wait, 5, key="k"))
+        await asyncio.sleep(0.01)
+        gate.set()
+        return await other
+
+    assert asyncio.run(main()) is True
+    assert ex.stats()["failed"] == 0
+
+
+def _count_build(mode):
+    """Runs in a worker process (module-level so it pickles)."""
+    builds_total.inc(mode, "success")
+    return os.getpid()
+
+
+def test_process_worker_metrics_reach_parent_registry():
+    ex = WorkloadExecutor("test-proc", processes=True, max_workers=1)
+    try:
+        assert ex.submit(_count_build, "executor-test").result(60) != os.getpid()
+        assert ex.submit(_count_build, "executor-test").result(60) != os.getpid()
+    finally:
+        ex.shutdown()
+    text = registry.render()
+    assert 'projectmaker_builds_total{mode="executor-test",outcome="success"} 2' in text
+    assert 'projectmaker_executor_run_seconds_count{executor="test-proc"} 2' in text
@@ -0,0 +1,108 @@
+# backend/tests/test_incremental.py
+import json
+
+import pytest
+
+from app.services import file_writer
+from app.services.project_generator import ProjectGenerator
+
+CONFIG = {
+    "project_name": "demo",
+    "description": "first",
+    "backend_framework": "fastapi",
+    "frontend_framework": "react",
+    "initialize_git": False,
+}
+
+
+@pytest.fixture
+def gen(tmp_path):
+    return ProjectGenerator(str(tmp_path / "out"))
+
+
+@pytest.fixture
+def root(tmp_path, gen):
+    root = tmp_path / "demo"
+    status = gen.build_project(CONFIG, str(root))
+    assert status["success"] and not status["errors"]
+    return root
+
+
+def manifest(root):
+    return json.loads((root / ".projectmaker" / "manifest.json").read_text())["files"]
+
+
+def test_full_build_ignores_manifest(root):
+    assert ".projectmaker/" in (root / ".gitignore").read_text()
+    assert "README.md" in manifest(root)
+
+
+def test_noop_reports_no_changes(gen, root):
+    status = gen.build_project(CONFIG, str(root), mode="incremental")
+    assert status["incremental"]["created"] == status["incremental"]["updated"] == 0
+    assert status["incremental"]["conflicts"] == 0
+    assert not [op for op in status["operations"] if "Created" in op or "Updated" in op]
+
+
+def test_changed_config_updates_only_affected_files(gen, root):
+    before = manifest(root)
+    status = gen.build_project(dict(CONFIG, description="second"), str(root), mode="incremental")
+    report = status["incremental"]
+    assert report["updated"] > 0 and report["created"] == 0 and report["conflicts"] == 0
+    assert "second" in (root / "README.md").read_text()
+    assert manifest(root)["README.md"] != before["README.md"]
+
+
+def test_missing_file_is_recreated(gen, root):
+    (root / "README.md").unlink()
+    status = gen.build_project(CONFIG, str(root), mode="incremental")
+    assert status["incremental"]["created"] == 1
+    assert "✅ Created README.md" in status["operations"]
+    assert (root / "README.md").exists()
+
+
+def test_local_edit_is_a_conflict_and_kept(gen, root):
+    (root / "README.md").write_text("mine")
+    for config in (CONFIG, dict(CONFIG, description="second")):
+        status = gen.build_project(config, str(root), mode="incremental")
+        assert status["conflicts"] == ["README.md"]
+        assert (root / "README.md").read_text() == "mine"
+
+
+def test_overwrite_conflicts(gen, root):
+    (root / "README.md").write_text("mine")
+    status = gen.build_project(CONFIG, str(root), mode="incremental", overwrite_conflicts=True)
+    assert status["conflicts"] == []
+    assert "⚠️ Overwrote local changes: README.md" in status["operations"]
+    assert (root / "README.md").read_text() != "mine"
+    status = gen.build_project(CONFIG, str(root), mode="incremental")
+    assert status["incremental"]["updated"] == 0
+
+
+def test_orphaned_files_are_reported_not_deleted(gen, root):
+    gen.build_project(dict(CONFIG, custom_files=[{"name": "extra.txt", "content": "x"}]), str(root), mode="incremental")
+    status = gen.build_project(CONFIG, str(root), mode="incremental")
+    assert status["orphaned"] == ["extra.txt"]
+    assert (root / "extra.txt").exists()
+
+
+def test_failed_write_is_not_recorded(gen, root, monkeypatch):
+    before = manifest(root)
+    write_batch = file_writer._write_batch
+
+    def failing(base, batch):
+        out = []
+        for entry in batch:
+            out.extend([(entry[0], "disk full")] if entry[0] == "README.md" else write_batch(base, [entry]))
+        return out
+
+    changed = dict(CONFIG, description="second")
+    monkeypatch.setattr(file_writer, "_write_batch", failing)
+    status = gen.build_project(changed, str(root), mode="incremental")
+    assert "❌ Write error (README.md): disk full" in status["errors"]
+    assert manifest(root)["README.md"] == before["README.md"]
+
+    monkeypatch.setattr(file_writer, "_write_batch", write_batch)
+    status = gen.build_project(changed, str(root), mode="incremental")
+    assert "🔁 Updated: README.md" in status["operations"]
+    assert status["incremental"]["conflicts"] == 0
@@ -0,0 +1,33 @@
+# backend/tests/test_output_sinks.py
+import pytest
+
+from app.services.output_sinks import DiskSink, MemorySink
+
+
+def test_disk_sink_write(tmp_path):
+    with DiskSink(tmp_path) as sink:
+        sink.write("a/b.txt", b"hi", 0o755)
+    assert (tmp_path / "a" / "b.txt").read_bytes() == b"hi"
+    assert (tmp_path / "a" / "b.txt").stat().st_mode & 0o777 == 0o755
+
+
+def test_disk_sink_write_failure_raises(tmp_path):
+    (tmp_path / "a").write_text("a file, not a folder")
+    with DiskSink(tmp_path) as sink:
+        with pytest.raises(OSError, match="a/b.txt"):
+            sink.write("a/b.txt", b"hi")
+
+
+def test_write_many_reports_failures(tmp_path):
+    (tmp_path / "taken").mkdir()
+    with DiskSink(tmp_path) as sink:
+        result = sink.write_many([("ok.txt", b"1", None), ("taken", b"2", None)])
+    assert result["written"] == ["ok.txt"]
+    assert len(result["errors"]) == 1 and "taken" in result["errors"][0]
+
+
+def test_memory_sink():
+    with MemorySink() as sink:
+        sink.write_many([("x/y.txt", b"1", 0o644)], directories=["empty"])
+    assert sink.files == {"x/y.txt": b"1"}
+    assert "empty" in sink.directories
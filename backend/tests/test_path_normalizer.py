@@ -0,0 +1,74 @@
+# backend/tests/test_path_normalizer.py
+import pytest
+
+from app.services.path_normalizer import PathNormalizer, normalize_paths
+
+
+@pytest.fixture
+def norm():
+    return PathNormalizer("Demo", backend_folder="api", frontend_folder="web")
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("docs", "docs"),
+    ("docs/", "docs"),
+    ("./docs//guides/", "docs/guides"),
+    ("..\\..\\notes\\a.md", "notes/a.md"),
+    ("a..b/c", "a..b/c"),
+    ("demo/docs", "docs"),
+    ("/home/me/DEMO/scripts/run.sh", "scripts/run.sh"),
+    ("backend/app/models", "api/app/models"),
+    ("demo/frontend/src/backend/x", "api/x"),
+    ("frontend/src", "web/src"),
+    ("src/frontend/frontend/a", "web/frontend/a"),
+    ("./..", ""),
+])
+def test_normalize(norm, raw, expected):
+    assert norm.normalize(raw) == expected
+
+
+def test_normalize_is_memoized(norm):
+    assert norm.normalize("demo/backend/x") == norm.normalize("demo/backend/x") == "api/x"
+    assert "demo/backend/x" in norm._memo
+
+
+def config(folders=(), files=()):
+    return {"project_name": "demo", "custom_folders": list(folders),
+            "custom_files": [{"name": n, "content": c} for n, c in files]}
+
+
+def test_kinds_and_order():
+    report = normalize_paths(config(["docs", "notes.md", "tests"], [("scripts/run.sh", "echo")]))
+    assert [(e.path, e.kind) for e in report.entries] == [
+        ("docs", "directory"), ("notes.md", "file"), ("tests", "directory"), ("scripts/run.sh", "file")]
+    assert report.entries[-1].content == "echo"
+    assert not report.has_issues()
+
+
+def test_duplicates_keep_last_at_first_position():
+    report = normalize_paths(config(["docs", "tests", "demo/docs"], [("a.txt", "1"), ("./a.txt", "2")]))
+    assert [e.path for e in report.entries] == ["docs", "tests", "a.txt"]
+    assert report.entries[-1].content == "2"
+    assert {d["path"] for d in report.duplicates} == {"docs", "a.txt"}
+
+
+def test_file_directory_conflict_stays_directory():
+    report = normalize_paths(config(["notes"], [("notes", "x"), ("notes/todo.md", "y")]))
+    assert report.conflicts == [{"path": "notes", "file": ["notes"], "directory": ["notes"]}]
+    assert [(e.path, e.kind) for e in report.entries] == [("notes", "directory"), ("notes/todo.md", "file")]
+
+
+def test_file_implied_as_parent_is_dropped():
+    report = normalize_paths(config([], [("lib", "x"), ("lib/a.py", "y")]))
+    assert report.conflicts == [{"path": "lib", "file": ["lib"], "directory": ["lib/a.py"]}]
+    assert [e.path for e in report.entries] == ["lib/a.py"]
+
+
+def test_entries_that_normalize_to_nothing_are_reported():
+    report = normalize_paths(config(["..", "demo", "docs"]))
+    assert report.dropped == ["..", "demo"]
+    assert [e.path for e in report.entries] == ["docs"]
+
+
+def test_default_custom_folders():
+    assert [e.path for e in normalize_paths({"project_name": "demo"}).entries] == ["docs", "tests"]
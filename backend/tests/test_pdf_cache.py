@@ -0,0 +1,87 @@
+# backend/tests/test_pdf_cache.py
+from app.services.pdf_cache import PDFCache, pdf_key
+
+
+def blob(n, fill=b"x"):
+    return fill * n
+
+
+def test_memory_hit(tmp_path):
+    cache = PDFCache(memory_bytes=100, disk_bytes=0, directory=str(tmp_path))
+    cache.put("a", blob(10))
+    assert cache.get("a") == blob(10)
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert stats["memory"]["hits"] == 1 and stats["misses"] == 1
+
+
+def test_memory_eviction_spills_to_disk_and_promotes_back(tmp_path):
+    cache = PDFCache(memory_bytes=25, disk_bytes=1000, directory=str(tmp_path))
+    cache.put("a", blob(10, b"a"))
+    cache.put("b", blob(10, b"b"))
+    cache.put("c", blob(10, b"c"))  # evicts "a" from memory
+    stats = cache.stats()
+    assert stats["memory"]["entries"] == 2 and stats["memory"]["evictions"] == 1
+    assert (tmp_path / "a.pdf").exists()
+
+    assert cache.get("a") == blob(10, b"a")
+    assert cache.stats()["disk"]["hits"] == 1
+    assert cache.get("a") == blob(10, b"a")
+    assert cache.stats()["memory"]["hits"] == 1
+
+
+def test_too_big_for_memory_goes_to_disk(tmp_path):
+    cache = PDFCache(memory_bytes=10, disk_bytes=1000, directory=str(tmp_path))
+    cache.put("big", blob(50))
+    assert cache.stats()["memory"]["entries"] == 0
+    assert cache.get("big") == blob(50)
+
+
+def test_disk_tier_is_byte_bounded_lru(tmp_path):
+    cache = PDFCache(memory_bytes=0, disk_bytes=25, directory=str(tmp_path))
+    cache.put("a", blob(10))
+    cache.put("b", blob(10))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", blob(10))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()["disk"]
+    assert stats["bytes"] <= 25 and stats["evictions"] == 1
+    assert not (tmp_path / "b.pdf").exists()
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    PDFCache(memory_bytes=0, disk_bytes=1000, directory=str(tmp_path)).put("a", blob(10))
+    fresh = PDFCache(memory_bytes=100, disk_bytes=1000, directory=str(tmp_path))
+    assert fresh.get("a") == blob(10)
+    assert fresh.stats()["disk"]["entries"] == 1
+
+
+def test_clear(tmp_path):
+    cache = PDFCache(memory_bytes=100, disk_bytes=100, directory=str(tmp_path))
+    cache.put("a", blob(10))
+    cache.put("big", blob(100))  # spills "a" to disk
+    cache.clear()
+    assert cache.get("a") is None and cache.get("big") is None
+    assert not list(tmp_path.glob("*.pdf"))
+
+
+def test_key_depends_on_layout_and_mode():
+    keys = {pdf_key("d", "1", True), pdf_key("d", "2", True), pdf_key("d", "1", False), pdf_key("e", "1", True)}
+    assert len(keys) == 4
+
+
+def test_pdfs_are_keyed_and_rendered_without_secrets():
+    from app.routes.generator_routes import _pdf_key
+    from app.services.report import build_report, mask_secrets
+    from app.services.resolved_config import resolve_config
+
+    base = {"project_name": "Demo", "description": "d", "backend_framework": "fastapi",
+            "frontend_framework": "react", "database_type": "mysql"}
+    one = resolve_config(dict(base, database_password="first-secret"))
+    two = resolve_config(dict(base, database_password="second-secret"))
+    assert _pdf_key(one) == _pdf_key(two) != _pdf_key(resolve_config(base))
+
+    masked = mask_secrets(one)
+    assert "first-secret" not in repr(masked)
+    assert build_report(masked).as_dict()["sections"] == build_report(one).as_dict()["sections"]
@@ -0,0 +1,41 @@
+# backend/tests/test_pdf_fonts.py
+import os
+
+import pytest
+
+from app.services import pdf_fonts
+from app.services.pdf_fonts import SubsetCache, faces, text_blocks
+
+needs_fonts = pytest.mark.skipif(not faces(), reason="no TrueType fonts configured")
+
+
+@needs_fonts
+def test_shared_directory_eviction_is_rebuilt(tmp_path):
+    # Two worker processes: separate LRUs, one shared subset directory
+    face = faces()["sans"]
+    one, two = SubsetCache(1, str(tmp_path)), SubsetCache(1, str(tmp_path))
+    latin, greek = text_blocks(["abc"]), text_blocks(["αβγ"])
+    path = one.path_for(face, latin)
+    assert two.path_for(face, latin) == path
+    two.path_for(face, greek)  # evicts and unlinks the latin subset
+    again = one.path_for(face, latin)
+    assert again == path and os.path.exists(again)
+    assert one.stats()["misses"] == 2
+
+
+@needs_fonts
+def test_font_install_failure_falls_back_to_core_fonts(monkeypatch):
+    from app.services.pdf_generator import PDFGenerator
+
+    def broken(pdf, texts):
+        raise FileNotFoundError("subset vanished")
+
+    monkeypatch.setattr("app.services.pdf_generator.install_fonts", broken)
+    tree = {"name": "demo", "type": "directory", "children": []}
+    data = PDFGenerator.generate_summary_pdf({"project_name": "Demo", "description": "d"}, tree, "")
+    assert data.startswith(b"%PDF")
+
+
+def test_core_fonts_when_none_configured(monkeypatch):
+    monkeypatch.setattr(pdf_fonts, "_faces", {})
+    assert pdf_fonts.install_fonts(object(), ["ü"]) is pdf_fonts.CORE_FONTS
@@ -0,0 +1,71 @@
+# backend/tests/test_pdf_tree_layout.py
+from fpdf import FPDF
+
+from app.services.pdf_tree_layout import fit_row, render_tree, tree_rows
+
+
+def d(name, *children):
+    return {"name": name, "type": "directory", "children": list(children)}
+
+
+def f(name):
+    return {"name": name, "type": "file"}
+
+
+def wide(dirs, files):
+    return d("proj", *(d(f"pkg{i}", *(f(f"m{j}.py") for j in range(files))) for i in range(dirs)))
+
+
+def test_rows_match_ascii_tree():
+    rows = tree_rows(d("app", d("src", f("main.py")), f("README.md")))
+    assert ["".join(r) for r in rows] == [
+        "app/",
+        "|-- src/",
+        "|   `-- main.py",
+        "`-- README.md",
+    ]
+
+
+def test_depth_limit_collapses_subtrees():
+    chain = d("a", d("b", d("c", d("d", f("x")))))
+    rows = tree_rows(d("root", chain), max_depth=2)
+    assert rows[-1] == ("    `-- ", "b/ (+3)")
+
+
+def test_dir_limit_summarises_hidden_children():
+    rows = tree_rows(wide(1, 100), dir_limit=10)
+    labels = [label for _, label in rows]
+    assert len(rows) == 2 + 9 + 1
+    assert labels[-1] == "... 91 more"
+
+
+def test_fit_row_never_exceeds_width():
+    for prefix in ("", "|   " * 30):
+        for label in ("short.py", "x" * 200):
+            row = fit_row(prefix, label, 40)
+            assert len(row) <= 40
+    assert fit_row("|-- ", "a" * 60, 30).endswith("a" * 10)
+    assert "..." in fit_row("|-- ", "a" * 60, 30)
+
+
+def _pdf():
+    pdf = FPDF()
+    pdf.add_page()
+    return pdf
+
+
+def test_page_budget_caps_large_trees():
+    pdf = _pdf()
+    stats = render_tree(pdf, wide(50, 1000), max_depth=0, dir_limit=0, page_budget=3)
+    assert stats["pages"] <= 3 and pdf.pages_count <= 3
+    assert stats["omitted"] > 0
+
+
+def test_small_tree_fits_one_column():
+    stats = render_tree(_pdf(), wide(1, 5))
+    assert stats == {"rows": 7, "columns": 1, "pages": 1, "width": stats["width"], "omitted": 0}
+
+
+def test_long_trees_use_columns():
+    stats = render_tree(_pdf(), wide(4, 60), dir_limit=0, page_budget=0)
+    assert stats["columns"] > 1 and stats["omitted"] == 0
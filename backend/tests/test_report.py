@@ -0,0 +1,106 @@
+# backend/tests/test_report.py
+import base64
+import hashlib
+import re
+
+import pytest
+
+from app.services.report import HTML_CSP, negotiate
+
+CONFIG = {"project_name": "Demo", "description": "d", "backend_framework": "fastapi", "frontend_framework": "react"}
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, "json"),
+    ("", "json"),
+    ("*/*", "json"),
+    ("text/markdown", "markdown"),
+    ("text/html,application/xhtml+xml;q=0.9,*/*;q=0.8", "html"),
+    ("application/json;q=0.5, text/markdown", "markdown"),
+    ("text/html;q=0.2, application/pdf;q=0.9", "pdf"),
+    ("text/*", "markdown"),
+    ("TEXT/HTML", "html"),
+    ("text/html;q=0, application/json", "json"),
+    ("image/png", None),
+    ("text/html;q=0", None),
+    ("text/html;q=abc", None),
+])
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected
+
+
+@pytest.mark.parametrize("accept, media", [
+    ("application/json", "application/json"),
+    ("text/markdown", "text/markdown; charset=utf-8"),
+    ("text/html", "text/html; charset=utf-8"),
+])
+def test_report_formats(client, accept, media):
+    resp = client.post("/api/projects/report", json=CONFIG, headers={"Accept": accept})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == media
+    assert resp.headers["vary"] == "Accept"
+    etag = resp.headers["etag"]
+    again = client.post("/api/projects/report", json=CONFIG, headers={"Accept": accept, "If-None-Match": etag})
+    assert again.status_code == 304
+
+
+def test_query_format_overrides_accept(client):
+    resp = client.post("/api/projects/report", json=CONFIG, params={"format": "markdown"},
+                       headers={"Accept": "text/html"})
+    assert resp.headers["content-type"].startswith("text/markdown")
+    assert resp.text.startswith("# ProjectMaker Report: Demo")
+
+
+def test_unacceptable_and_unknown_formats(client):
+    assert client.post("/api/projects/report", json=CONFIG, headers={"Accept": "image/png"}).status_code == 406
+    assert client.post("/api/projects/report", json=CONFIG, params={"format": "docx"}).status_code == 400
+
+
+def test_get_by_config_hash(client):
+    preview = client.post("/api/projects/preview", json=CONFIG).json()
+    resp = client.get("/api/projects/report", params={"config_hash": preview["config_hash"]},
+                      headers={"Accept": "application/json"})
+    assert resp.status_code == 200 and resp.json()["project_name"] == "Demo"
+    assert client.get("/api/projects/report", params={"config_hash": "nope"}).status_code == 404
+
+
+def test_html_csp_allows_its_own_stylesheet(client):
+    resp = client.post("/api/projects/report", json=CONFIG, headers={"Accept": "text/html"})
+    assert resp.headers["content-security-policy"] == HTML_CSP
+    style = re.search(r"<style>(.*?)</style>", resp.text, re.S).group(1)
+    digest = base64.b64encode(hashlib.sha256(style.encode("utf-8")).digest()).decode("ascii")
+    assert f"'sha256-{digest}'" in HTML_CSP
+
+
+SECRET = "hunter2-Secret"
+SECRET_CONFIG = dict(CONFIG, database_type="postgresql", database_user="app", database_password=SECRET,
+                     target_directory="/home/someone/private")
+
+
+def test_report_formats_never_show_secrets(client, monkeypatch):
+    for accept in ("application/json", "text/markdown", "text/html"):
+        resp = client.post("/api/projects/report", json=SECRET_CONFIG, headers={"Accept": accept})
+        assert resp.status_code == 200
+        assert SECRET not in resp.text
+        assert "[CONFIGURED]" in resp.text
+    config = client.post("/api/projects/report", json=SECRET_CONFIG).json()["sections"][0]
+    assert config["id"] == "configuration"
+    assert "target_directory" not in {item["key"] for item in config["items"]}
+
+    # PDF text is compressed and glyph-encoded; capture what the generator draws instead
+    from fpdf import FPDF
+
+    from app.services.report import summary_pdf
+
+    drawn = []
+    for name in ("cell", "multi_cell", "text"):
+        original = getattr(FPDF, name)
+
+        def capture(self, *args, _original=original, **kwargs):
+            drawn.extend(str(a) for a in list(args) + list(kwargs.values()) if isinstance(a, str))
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(FPDF, name, capture)
+    assert summary_pdf(SECRET_CONFIG).startswith(b"%PDF")
+    assert drawn and not [t for t in drawn if SECRET in t]
+    assert any("[CONFIGURED]" in t for t in drawn)
@@ -0,0 +1,41 @@
+# backend/tests/test_request_log.py
+import json
+import threading
+
+from app.request_log import RequestLog, parse_sampling
+
+
+def test_parse_sampling_longest_prefix_first():
+    assert parse_sampling("*=1,/health=0.01,/api/x=bad,/api=0.5,junk") == [("/health", 0.01), ("/api", 0.5), ("", 1.0)]
+
+
+def test_sampling_and_errors_bypass(tmp_path):
+    log = RequestLog(str(tmp_path / "r.jsonl"), sampling="/health=0,*=1")
+    assert not log.record({"path": "/health", "status": 200})
+    assert log.record({"path": "/health", "status": 503})
+    assert log.record({"path": "/api", "status": 200})
+    log.flush()
+    log.close()
+    lines = [json.loads(line) for line in (tmp_path / "r.jsonl").read_text().splitlines()]
+    assert [(e["path"], e["status"]) for e in lines] == [("/health", 503), ("/api", 200)]
+    assert log.stats()["sampled_out"] == 1 and log.stats()["written"] == 2
+
+
+def test_every_record_is_written_or_counted_as_dropped(tmp_path):
+    for policy in ("drop", "block"):
+        log = RequestLog(str(tmp_path / f"{policy}.jsonl"), maxsize=1, backpressure=policy, block_timeout=0.0)
+        per_thread, threads = 2000, 8
+
+        def burst():
+            for i in range(per_thread):
+                log.record({"path": "/api", "status": 200, "i": i})
+
+        workers = [threading.Thread(target=burst) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        log.flush()
+        log.close()
+        stats = log.stats()
+        assert stats["written"] + stats["dropped"] + stats["queued"] == per_thread * threads
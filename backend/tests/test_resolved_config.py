@@ -0,0 +1,55 @@
+# backend/tests/test_resolved_config.py
+import pickle
+import warnings
+
+import pytest
+
+from app.routes.generator_routes import ProjectConfig
+from app.services.resolved_config import config_digest, resolve_config
+
+CONFIG = {"project_name": "Demo App", "description": "d", "backend_framework": "next",
+          "frontend_framework": "next.js", "custom_folders": ["docs"],
+          "custom_files": [{"name": "a.txt", "content": "x"}]}
+
+
+def test_resolves_once_and_reads_like_the_dict():
+    rc = resolve_config(CONFIG)
+    assert resolve_config(rc) is rc
+    assert rc["project_name"] == "Demo App" and rc.get("missing") is None
+    assert rc.slug == "demo-app" and rc.is_next_fullstack
+    assert rc.digest == config_digest(CONFIG)
+    assert rc == resolve_config(dict(reversed(list(CONFIG.items()))))
+
+
+def test_nested_values_are_frozen():
+    rc = resolve_config(CONFIG)
+    assert isinstance(rc["custom_folders"], tuple)
+    with pytest.raises(TypeError):
+        rc["custom_files"][0]["content"] = "changed"
+    with pytest.raises(TypeError):
+        rc.raw["project_name"] = "other"
+    assert rc.digest == config_digest(CONFIG)
+
+
+def test_source_and_copies_stay_independent():
+    source = {**CONFIG, "custom_folders": ["docs"]}
+    rc = resolve_config(source)
+    source["custom_folders"].append("later")
+    assert rc["custom_folders"] == ("docs",)
+    copy = rc.to_dict()
+    copy["custom_files"][0]["content"] = "mine"
+    assert copy["custom_folders"] == ["docs"]
+    assert rc["custom_files"][0]["content"] == "x"
+
+
+def test_pickles_for_process_pools():
+    rc = resolve_config(CONFIG)
+    again = pickle.loads(pickle.dumps(rc))
+    assert again == rc and again.digest == rc.digest
+
+
+def test_model_input_without_deprecation_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        rc = resolve_config(ProjectConfig(**CONFIG))
+    assert rc["custom_folders"] == ("docs",) and rc.backend_folder == "backend"
@@ -0,0 +1,58 @@
+# backend/tests/test_single_flight.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_run():
+    sf = SingleFlight()
+    gate = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        gate.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(sf.do, "k", work) for _ in range(8)]
+        while sf.stats()["shared"] < 7:
+            time.sleep(0.001)
+        gate.set()
+        results = [f.result(5) for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert sf.stats() == {"in_flight": 0, "executed": 1, "shared": 7}
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    sf = SingleFlight()
+    gate = threading.Event()
+
+    def boom():
+        gate.wait(5)
+        raise ValueError("bad config")
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(sf.do, "k", boom) for _ in range(3)]
+        while sf.stats()["shared"] < 2:
+            time.sleep(0.001)
+        gate.set()
+        for f in futures:
+            with pytest.raises(ValueError):
+                f.result(5)
+
+    assert sf.do("k", lambda: 42) == 42
+    assert sf.stats()["executed"] == 2
+
+
+def test_different_keys_run_separately():
+    sf = SingleFlight()
+    assert sf.do("a", lambda: 1) == 1
+    assert sf.do("b", lambda: 2) == 2
+    assert sf.stats() == {"in_flight": 0, "executed": 2, "shared": 0}
@@ -0,0 +1,88 @@
+# backend/tests/test_tree_builder.py
+from app.services.project_generator import ProjectGenerator
+from app.services.tree_builder import TreeBuilder
+
+
+def d(name, *children):
+    return {"name": name, "type": "directory", "children": list(children)}
+
+
+def f(name):
+    return {"name": name, "type": "file"}
+
+
+def names(node):
+    return [c["name"] for c in node.get("children") or ()]
+
+
+def find(tree, path):
+    node = tree
+    for name in path.split("/"):
+        matches = [c for c in node["children"] if c["name"] == name]
+        assert len(matches) == 1, f"{name} appears {len(matches)} times under {node['name']}"
+        node = matches[0]
+    return node
+
+
+def test_add_nests_and_dedups_in_first_seen_order():
+    b = TreeBuilder("proj")
+    b.add_all(["docs/", "src/app/main.py", "src/app/util.py", "README.md", "src\\lib"], kind="file")
+    b.add("src/app", kind="directory")
+    tree = b.to_tree()
+    assert names(tree) == ["docs", "src", "README.md"]
+    assert names(find(tree, "src")) == ["app", "lib"]
+    assert names(find(tree, "src/app")) == ["main.py", "util.py"]
+
+
+def test_file_and_directory_becomes_directory():
+    b = TreeBuilder("proj")
+    b.add("notes", kind="file")
+    b.add("notes/todo.md")
+    node = find(b.to_tree(), "notes")
+    assert node["type"] == "directory" and names(node) == ["todo.md"]
+
+
+def test_merge_keeps_bare_directories_bare():
+    b = TreeBuilder("proj")
+    b.merge(d("api", {"name": "empty", "type": "directory"}, f("app.py")))
+    api = find(b.to_tree(), "api")
+    assert api["children"][0] == {"name": "empty", "type": "directory"}
+
+
+def test_merge_splits_slashed_names():
+    b = TreeBuilder("proj")
+    b.merge(d("src", d("main", d("java/com/example", f("App.java")))))
+    b.add("src/main/java/com/example/extra", kind="directory")
+    tree = b.to_tree()
+    assert names(find(tree, "src/main")) == ["java"]
+    assert names(find(tree, "src/main/java/com/example")) == ["App.java", "extra"]
+
+
+def test_merge_under_and_merge_children():
+    b = TreeBuilder("proj")
+    b.merge_children(d("whole", f("a.txt"), d("lib", f("x.py"))))
+    b.merge(d("lib", f("y.py")))
+    b.merge(f("z.py"), under="lib/sub")
+    tree = b.to_tree()
+    assert names(tree) == ["a.txt", "lib"]
+    assert names(find(tree, "lib")) == ["x.py", "y.py", "sub"]
+    assert names(find(tree, "lib/sub")) == ["z.py"]
+
+
+def test_springboot_custom_folder_nests_into_package():
+    config = {"project_name": "demo", "description": "d", "backend_framework": "springboot",
+              "frontend_framework": None, "backend_folder_name": "backend",
+              "custom_folders": ["backend/src/main/java/com/example/extra"]}
+    tree = ProjectGenerator().generate_project_tree(config)
+    package = find(tree, "backend/src/main/java/com/example")
+    assert "extra" in names(package)
+    seen = set()
+
+    def walk(node, prefix):
+        for child in node.get("children") or ():
+            path = prefix + child["name"]
+            assert "/" not in child["name"] and path not in seen
+            seen.add(path)
+            walk(child, path + "/")
+
+    walk(tree, "")
@@ -0,0 +1,54 @@
+# backend/tests/test_tree_codec.py
+import json
+
+import pytest
+
+from app.services.tree_codec import decode_columnar, dumps, encode_columnar
+
+CONFIG = {"project_name": "Demo", "description": "d", "backend_framework": "fastapi", "frontend_framework": "react"}
+
+
+def test_round_trip_keeps_order_and_empty_dirs():
+    tree = {"name": "app", "type": "directory", "children": [
+        {"name": "src", "type": "directory", "children": [
+            {"name": "main.py", "type": "file"},
+            {"name": "empty", "type": "directory", "children": []},
+        ]},
+        {"name": "bare", "type": "directory"},
+        {"name": "README.md", "type": "file"},
+    ]}
+    data = encode_columnar(tree)
+    assert data["names"] == ["app", "src", "main.py", "empty", "bare", "README.md"]
+    assert data["parents"] == [-1, 0, 1, 1, 0, 0]
+    assert data["bare"] == [4]
+    assert decode_columnar(data) == tree
+
+
+def test_wide_tree_bitmap():
+    tree = {"name": "r", "type": "directory", "children": [
+        {"name": f"n{i}", "type": "directory" if i % 3 else "file", **({"children": []} if i % 3 else {})}
+        for i in range(37)
+    ]}
+    assert decode_columnar(encode_columnar(tree)) == tree
+
+
+def test_dumps_matches_json():
+    obj = {"name": "ü ✓", "n": [1, 2.5, None, True]}
+    assert json.loads(dumps(obj)) == obj
+
+
+@pytest.mark.parametrize("frontend", ["react", "vue", None])
+def test_columnar_preview_round_trip(client, frontend):
+    config = dict(CONFIG, frontend_framework=frontend)
+    nested = client.post("/api/projects/preview", json=config).json()
+    resp = client.post("/api/projects/preview", json=config, params={"format": "columnar"})
+    assert resp.status_code == 200
+    flat = resp.json()
+    assert flat["tree"]["format"] == "columnar"
+    assert decode_columnar(flat["tree"]) == nested["tree"]
+    assert flat["hash"] == nested["hash"]
+
+
+def test_unknown_format_is_rejected(client):
+    resp = client.post("/api/projects/preview", json=CONFIG, params={"format": "xml"})
+    assert resp.status_code == 400
@@ -0,0 +1,121 @@
+# backend/tests/test_tree_delta.py
+import copy
+
+import pytest
+
+from app.services.tree_delta import diff_trees
+
+CONFIG = {"project_name": "Demo", "description": "d", "backend_framework": "fastapi", "frontend_framework": "react"}
+
+
+def apply_patch(tree, patch):
+    """Client side of the delta protocol: removals, then renames, then additions."""
+    tree = copy.deepcopy(tree)
+
+    def find(path):
+        node = tree
+        for name in path:
+            node = next(c for c in node["children"] if c["name"] == name)
+        return node
+
+    for path in patch["removed"]:
+        parent = find(path[:-1])
+        parent["children"] = [c for c in parent["children"] if c["name"] != path[-1]]
+    for r in patch["renamed"]:
+        parent = find(r["from"][:-1])
+        node = next(c for c in parent["children"] if c["name"] == r["from"][-1])
+        parent["children"].remove(node)
+        node["name"] = r["to"]
+        parent["children"].insert(r["index"], node)
+    for a in patch["added"]:
+        find(a["parent"])["children"].insert(a["index"], a["node"])
+    if "root" in patch:
+        tree["name"] = patch["root"]
+    return tree
+
+
+def d(name, *children):
+    return {"name": name, "type": "directory", "children": list(children)}
+
+
+def f(name):
+    return {"name": name, "type": "file"}
+
+
+def test_renamed_folder_is_a_rename_not_a_copy():
+    old = d("app", d("backend", f("a.py"), f("b.py"), f("c.py")), f("README.md"))
+    new = d("app", d("api", f("a.py"), f("b.py"), f("c.py")), f("README.md"))
+    patch = diff_trees(old, new)
+    assert patch["renamed"] == [{"from": ["backend"], "to": "api", "index": 0}]
+    assert patch["added"] == patch["removed"] == []
+    assert apply_patch(old, patch) == new
+
+
+def test_reordered_siblings_fall_back_to_full_tree():
+    old = d("app", f("a"), f("b"), f("c"), f("d"))
+    new = d("app", f("b"), f("a"), f("c"), f("d"))
+    assert diff_trees(old, new) is None
+
+
+def test_duplicate_names_fall_back_to_full_tree():
+    tree = d("app", f("a"), f("a"), f("b"))
+    assert diff_trees(tree, tree) is None
+
+
+@pytest.mark.parametrize("change", [
+    {"backend_folder_name": "api"},
+    {"custom_folders": ["docs", "tests", "notes", "x.md"]},
+    {"frontend_framework": "vue"},
+    {"project_name": "Other"},
+    {"description": "changed"},
+])
+def test_delta_round_trip(client, change):
+    base = client.post("/api/projects/preview", json=CONFIG).json()
+    target = dict(CONFIG, **change)
+    full = client.post("/api/projects/preview", json=target).json()
+    resp = client.post("/api/projects/preview", json=target, params={"base_hash": base["hash"]}).json()
+    if not resp.get("delta"):
+        assert resp["tree"] == full["tree"]
+        return
+    assert resp["base_hash"] == base["hash"] and resp["hash"] == full["hash"]
+    assert apply_patch(base["tree"], resp) == full["tree"]
+    assert resp.get("requirements", base["requirements"]) == full["requirements"]
+
+
+def test_unchanged_payload_is_an_empty_delta(client):
+    base = client.post("/api/projects/preview", json=CONFIG).json()
+    resp = client.post("/api/projects/preview", json=CONFIG, params={"base_hash": base["hash"]}).json()
+    assert resp["delta"] and resp["removed"] == resp["renamed"] == resp["added"] == []
+
+
+def test_unknown_base_hash_returns_full_tree(client):
+    resp = client.post("/api/projects/preview", json=CONFIG, params={"base_hash": "unknown"}).json()
+    assert "tree" in resp and not resp.get("delta")
+
+
+def test_full_and_delta_responses_have_distinct_etags(client):
+    full = client.post("/api/projects/preview", json=CONFIG)
+    full_etag = full.headers["etag"]
+    target = dict(CONFIG, backend_folder_name="api")
+    params = {"base_hash": full.json()["hash"]}
+
+    delta = client.post("/api/projects/preview", json=target, params=params)
+    assert delta.json()["delta"]
+    delta_etag = delta.headers["etag"]
+    assert delta_etag != full_etag
+    assert delta_etag != client.post("/api/projects/preview", json=target).headers["etag"]
+
+    # Validating with the full tree's ETag must not turn the patch into a 304, and vice versa
+    again = client.post("/api/projects/preview", json=target, params=params,
+                        headers={"If-None-Match": client.post("/api/projects/preview", json=target).headers["etag"]})
+    assert again.status_code == 200 and again.json()["delta"]
+    assert client.post("/api/projects/preview", json=target, params=params,
+                       headers={"If-None-Match": delta_etag}).status_code == 304
+    assert client.post("/api/projects/preview", json=target,
+                       headers={"If-None-Match": delta_etag}).status_code == 200
+
+    # An unknown base falls back to the full tree, validated by the full tree's ETag
+    target_etag = client.post("/api/projects/preview", json=target).headers["etag"]
+    fallback = client.post("/api/projects/preview", json=target, params={"base_hash": "unknown"},
+                           headers={"If-None-Match": target_etag})
+    assert fallback.status_code == 304 and fallback.headers["etag"] == target_etag